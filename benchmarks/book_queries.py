@@ -0,0 +1,73 @@
+"""
+Market order price lookups per second over many order books.
+
+Compares OrderBuilder.calculate_buy_market_price (a Python walk over OrderSummary
+models) against CompactOrderBook.market_price (binary search over cumulative arrays).
+
+Run with: python -m benchmarks.book_queries [n_books]
+"""
+
+import random
+import sys
+import time
+from datetime import UTC, datetime
+
+from polymarket_apis.types.clob_types import OrderBookSummary, OrderSummary, OrderType
+from polymarket_apis.utilities.book_arrays import CompactOrderBook
+from polymarket_apis.utilities.order_builder.builder import OrderBuilder
+from polymarket_apis.utilities.signing.signer import Signer
+
+PRIVATE_KEY = "0x" + "11" * 32
+CONDITION_ID = "0x" + "ab" * 32
+AMOUNTS = (50.0, 500.0, 5_000.0, 50_000.0)
+
+
+def random_book(token_id: str, rng: random.Random) -> OrderBookSummary:
+    mid = rng.randint(10, 90)
+    return OrderBookSummary(
+        market=CONDITION_ID,
+        asset_id=token_id,
+        timestamp=datetime.now(UTC),
+        hash="",
+        bids=[
+            OrderSummary(price=p / 100, size=rng.randint(1, 2000))
+            for p in range(1, mid)
+        ],
+        asks=[
+            OrderSummary(price=p / 100, size=rng.randint(1, 2000))
+            for p in range(99, mid, -1)
+        ],
+    )
+
+
+def main(n_books: int = 1000) -> None:
+    rng = random.Random(0)
+    builder = OrderBuilder(signer=Signer(PRIVATE_KEY, chain_id=137))
+    books = [random_book(str(i), rng) for i in range(n_books)]
+    lookups = n_books * len(AMOUNTS)
+
+    start = time.perf_counter()
+    for book in books:
+        for amount in AMOUNTS:
+            builder.calculate_buy_market_price(book.asks, amount, OrderType.FAK)
+    walked = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compact_books = [CompactOrderBook.from_summary(book) for book in books]
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for compact in compact_books:
+        for amount in AMOUNTS:
+            compact.market_price("BUY", amount, OrderType.FAK)
+    searched = time.perf_counter() - start
+
+    print(f"books x amounts:   {lookups}")
+    print(f"list walk:         {lookups / walked:12.1f} lookups/s")
+    print(f"compact build:     {n_books / built:12.1f} books/s")
+    print(f"compact search:    {lookups / searched:12.1f} lookups/s")
+    print(f"speedup (search):  {walked / searched:12.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,73 @@
+"""
+Level 2 header creation per second for a post_order sized body.
+
+Compares create_level_2_headers (secret decoded, body re-serialized and a datetime
+built on every call) against a Level2HeaderFactory signing the serialized wire bytes.
+
+Run with: python -m benchmarks.l2_headers [n_requests]
+"""
+
+import sys
+import time
+
+from polymarket_apis.types.clob_types import ApiCreds, RequestArgs
+from polymarket_apis.utilities.endpoints import POST_ORDER
+from polymarket_apis.utilities.headers import (
+    Level2HeaderFactory,
+    create_level_2_headers,
+    serialize_body,
+)
+from polymarket_apis.utilities.signing.signer import Signer
+
+PRIVATE_KEY = "0x" + "11" * 32
+# dummy credentials, nothing is sent
+CREDS = ApiCreds(
+    apiKey="00000000-0000-0000-0000-000000000000",
+    secret="c2VjcmV0c2VjcmV0c2VjcmV0c2VjcmV0c2VjcmV0c2U=",  # noqa: S106
+    passphrase="passphrase",  # noqa: S106
+)
+BODY = {
+    "order": {
+        "salt": 1234567890,
+        "maker": "0x" + "22" * 20,
+        "signer": "0x" + "33" * 20,
+        "taker": "0x" + "00" * 20,
+        "tokenId": "15353185604353847122370324954202969073036867278400776447048296624042585335546",
+        "makerAmount": "5000000",
+        "takerAmount": "10000000",
+        "expiration": "0",
+        "nonce": "0",
+        "feeRateBps": "0",
+        "side": "BUY",
+        "signatureType": 1,
+        "signature": "0x" + "ab" * 65,
+    },
+    "owner": CREDS.key,
+    "orderType": "GTC",
+}
+
+
+def main(n_requests: int = 20000) -> None:
+    signer = Signer(PRIVATE_KEY, chain_id=137)
+    request_args = RequestArgs(method="POST", request_path=POST_ORDER, body=BODY)
+
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        create_level_2_headers(signer, CREDS, request_args)
+        serialize_body(BODY)  # the body is serialized again for the request content
+    legacy = time.perf_counter() - start
+
+    factory = Level2HeaderFactory(signer, CREDS)
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        factory.create(request_args, serialize_body(BODY))
+    cached = time.perf_counter() - start
+
+    print(f"requests:          {n_requests}")
+    print(f"legacy headers:    {n_requests / legacy:10.1f} req/s")
+    print(f"header factory:    {n_requests / cached:10.1f} req/s")
+    print(f"speedup:           {legacy / cached:10.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,97 @@
+"""
+Orders/sec when signing a quoting ladder with OrderBuilder.
+
+Compares the cached per-exchange py_order_utils builder against building a fresh
+UtilsOrderBuilder + UtilsSigner for every order (the previous behaviour).
+
+Run with: python -m benchmarks.order_signing [n_orders]
+"""
+
+import sys
+import time
+
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.model import OrderData, SignedOrder
+from py_order_utils.signer import Signer as UtilsSigner
+
+from polymarket_apis.types.clob_types import CreateOrderOptions, OrderArgs
+from polymarket_apis.utilities.config import get_contract_config
+from polymarket_apis.utilities.order_builder.builder import (
+    ROUNDING_CONFIG,
+    OrderBuilder,
+)
+from polymarket_apis.utilities.signing.signer import Signer
+
+PRIVATE_KEY = "0x" + "11" * 32
+TOKEN_ID = (
+    "15353185604353847122370324954202969073036867278400776447048296624042585335546"
+)
+OPTIONS = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+
+
+def ladder(n_orders: int) -> list[OrderArgs]:
+    return [
+        OrderArgs(
+            token_id=TOKEN_ID,
+            price=round(0.01 + (i % 98) * 0.01, 2),
+            size=10 + i % 7,
+            side="BUY" if i % 2 else "SELL",
+        )
+        for i in range(n_orders)
+    ]
+
+
+def sign_uncached(builder: OrderBuilder, order_args: OrderArgs) -> SignedOrder:
+    # what OrderBuilder.create_order used to do for every order
+    side, maker_amount, taker_amount = builder.get_order_amounts(
+        order_args.side,
+        order_args.size,
+        order_args.price,
+        ROUNDING_CONFIG[OPTIONS.tick_size],
+    )
+    chain_id = builder.signer.get_chain_id()
+    order_builder = UtilsOrderBuilder(
+        get_contract_config(chain_id, OPTIONS.neg_risk).exchange,
+        chain_id,
+        UtilsSigner(key=builder.signer.private_key),
+    )
+
+    return order_builder.build_signed_order(
+        OrderData(
+            maker=builder.funder,
+            taker=order_args.taker,
+            tokenId=order_args.token_id,
+            makerAmount=str(maker_amount),
+            takerAmount=str(taker_amount),
+            side=side,
+            feeRateBps=str(order_args.fee_rate_bps),
+            nonce=str(order_args.nonce),
+            signer=builder.signer.address(),
+            expiration=str(order_args.expiration),
+            signatureType=builder.sig_type,
+        ),
+    )
+
+
+def main(n_orders: int = 2000) -> None:
+    builder = OrderBuilder(signer=Signer(PRIVATE_KEY, chain_id=137))
+    orders = ladder(n_orders)
+
+    start = time.perf_counter()
+    for order_args in orders:
+        sign_uncached(builder, order_args)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for order_args in orders:
+        builder.create_order(order_args, OPTIONS)
+    cached = time.perf_counter() - start
+
+    print(f"orders signed:     {n_orders}")
+    print(f"fresh builder:     {n_orders / uncached:10.1f} orders/s")
+    print(f"cached builder:    {n_orders / cached:10.1f} orders/s")
+    print(f"speedup:           {uncached / cached:10.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
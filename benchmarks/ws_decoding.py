@@ -0,0 +1,118 @@
+"""
+Market channel messages decoded per second, full pydantic validation vs the fast path.
+
+Uses the market frames of a stream log (utilities.stream_log) or of a file with one raw frame
+per line when given one, otherwise synthetic book / price_change / last_trade_price traffic
+shaped like the live feed.
+
+Run with: python -m benchmarks.ws_decoding [stream_log_or_frames_file]
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+from polymarket_apis.clients.websockets_client import parse_market_message
+from polymarket_apis.utilities.fast_decode import orjson
+from polymarket_apis.utilities.stream_log import MAGIC, StreamReplayer
+
+CONDITION_ID = "0x" + "ab" * 32
+TOKEN_IDS = [str(random.Random(i).getrandbits(255)) for i in range(50)]
+
+
+def synthetic_frames(n_frames: int = 20000) -> list[str]:
+    rng = random.Random(0)
+    frames = []
+    for i in range(n_frames):
+        timestamp = str(1_757_908_892_351 + i)
+        token_id = rng.choice(TOKEN_IDS)
+        if i % 100 == 0:
+            message: object = [
+                {
+                    "event_type": "book",
+                    "market": CONDITION_ID,
+                    "asset_id": token_id,
+                    "timestamp": timestamp,
+                    "hash": "0x" + "cd" * 20,
+                    "bids": [
+                        {"price": f"{p / 100:.2f}", "size": str(rng.randint(1, 5000))}
+                        for p in range(1, 50)
+                    ],
+                    "asks": [
+                        {"price": f"{p / 100:.2f}", "size": str(rng.randint(1, 5000))}
+                        for p in range(99, 50, -1)
+                    ],
+                    "tick_size": "0.01",
+                    "last_trade_price": "0.50",
+                }
+            ]
+        elif i % 10 == 0:
+            message = {
+                "event_type": "last_trade_price",
+                "market": CONDITION_ID,
+                "asset_id": token_id,
+                "price": "0.5",
+                "size": "120",
+                "side": "BUY",
+                "fee_rate_bps": "0",
+                "timestamp": timestamp,
+            }
+        else:
+            message = {
+                "event_type": "price_change",
+                "market": CONDITION_ID,
+                "timestamp": timestamp,
+                "price_changes": [
+                    {
+                        "asset_id": rng.choice(TOKEN_IDS),
+                        "price": f"{rng.randint(1, 99) / 100:.2f}",
+                        "size": str(rng.randint(0, 5000)),
+                        "side": rng.choice(["BUY", "SELL"]),
+                        "hash": "0x" + "ef" * 20,
+                        "best_bid": "0.49",
+                        "best_ask": "0.51",
+                    }
+                    for _ in range(rng.randint(1, 4))
+                ],
+            }
+        frames.append(json.dumps(message))
+    return frames
+
+
+def throughput(frames: list[str], validate: bool) -> tuple[float, int]:
+    start = time.perf_counter()
+    events = 0
+    for frame in frames:
+        try:
+            events += len(parse_market_message(frame, validate=validate))
+        except ValueError:
+            # PONG frames, invalid messages
+            continue
+    return len(frames) / (time.perf_counter() - start), events
+
+
+def load_frames(path: str) -> list[str]:
+    with Path(path).open("rb") as file:
+        is_stream_log = file.read(len(MAGIC)) == MAGIC
+    if is_stream_log:
+        return [record.text for record in StreamReplayer(path).records("market")]
+    return Path(path).read_text().splitlines()
+
+
+def main(path: str | None = None) -> None:
+    frames = load_frames(path) if path else synthetic_frames()
+
+    validated, events = throughput(frames, validate=True)
+    fast, fast_events = throughput(frames, validate=False)
+
+    print(f"frames:            {len(frames)} ({events} events)")
+    print(f"json parser:       {'orjson' if orjson is not None else 'json'}")
+    print(f"validated:         {validated:12.1f} frames/s")
+    print(f"fast path:         {fast:12.1f} frames/s ({fast_events} events)")
+    print(f"speedup:           {fast / validated:12.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -15,7 +15,10 @@ __author__ = "Razvan Gheorghe"
 __email__ = "razvan@gheorghe.me"
 
 from .clients import (
+    AsyncPolymarketClobClient,
+    AsyncPolymarketGammaClient,
     AsyncPolymarketGraphQLClient,
+    AsyncPolymarketWebsocketsClient,
     PolymarketClobClient,
     PolymarketDataClient,
     PolymarketGammaClient,
@@ -28,7 +31,10 @@ from .types.clob_types import ApiCreds, MarketOrderArgs, OrderArgs, OrderType
 
 __all__ = [
     "ApiCreds",
+    "AsyncPolymarketClobClient",
+    "AsyncPolymarketGammaClient",
     "AsyncPolymarketGraphQLClient",
+    "AsyncPolymarketWebsocketsClient",
     "MarketOrderArgs",
     "OrderArgs",
     "OrderType",
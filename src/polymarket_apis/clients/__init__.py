@@ -5,15 +5,21 @@ This module contains all the client classes for interacting with different
 Polymarket APIs including CLOB, Data, Gamma, GraphQL, Web3, and WebSocket clients.
 """
 
-from .clob_client import PolymarketClobClient
+from .clob_client import AsyncPolymarketClobClient, PolymarketClobClient
 from .data_client import PolymarketDataClient
-from .gamma_client import PolymarketGammaClient
+from .gamma_client import AsyncPolymarketGammaClient, PolymarketGammaClient
 from .graphql_client import AsyncPolymarketGraphQLClient, PolymarketGraphQLClient
 from .web3_client import PolymarketGaslessWeb3Client, PolymarketWeb3Client
-from .websockets_client import PolymarketWebsocketsClient
+from .websockets_client import (
+    AsyncPolymarketWebsocketsClient,
+    PolymarketWebsocketsClient,
+)
 
 __all__ = [
+    "AsyncPolymarketClobClient",
+    "AsyncPolymarketGammaClient",
     "AsyncPolymarketGraphQLClient",
+    "AsyncPolymarketWebsocketsClient",
     "PolymarketClobClient",
     "PolymarketDataClient",
     "PolymarketGammaClient",
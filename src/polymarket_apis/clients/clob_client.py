@@ -1,5 +1,8 @@
+import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Literal, Self, cast
 from urllib.parse import urljoin
@@ -10,8 +13,10 @@ from py_order_utils.model import SignedOrder
 
 from ..types.clob_types import (
     ApiCreds,
+    BatchResponse,
     BidAsk,
     BookParams,
+    ChunkError,
     ClobMarket,
     CreateOrderOptions,
     DailyEarnedReward,
@@ -38,7 +43,15 @@ from ..types.clob_types import (
     TokenValueDict,
 )
 from ..types.common import EthAddress, Keccak256
-from ..utilities.constants import END_CURSOR, POLYGON
+from ..utilities.batching import arun_chunked, run_chunked
+from ..utilities.constants import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    END_CURSOR,
+    MAX_CANCEL_ORDERS_BATCH,
+    MAX_POST_ORDERS_BATCH,
+    POLYGON,
+)
 from ..utilities.endpoints import (
     ARE_ORDERS_SCORING,
     CANCEL,
@@ -81,7 +94,12 @@ from ..utilities.exceptions import (
     LiquidityError,
     MissingOrderbookError,
 )
-from ..utilities.headers import create_level_1_headers, create_level_2_headers
+from ..utilities.headers import (
+    Level2HeaderFactory,
+    create_level_1_headers,
+    serialize_body,
+)
+from ..utilities.market_cache import MarketMetadataCache
 from ..utilities.order_builder.builder import OrderBuilder
 from ..utilities.order_builder.helpers import (
     is_tick_size_smaller,
@@ -93,6 +111,63 @@ from ..utilities.signing.signer import Signer
 logger = logging.getLogger(__name__)
 
 
+def _align_post_responses(
+    pages: list[list[OrderPostResponse]], errors: list[ChunkError]
+) -> list[OrderPostResponse]:
+    # one response per posted order (run_chunked with one_per_item rejects short pages) - the
+    # orders of a failed batch get its error
+    failed = {error.index: error for error in errors}
+    remaining = iter(pages)
+    responses: list[OrderPostResponse] = []
+    for index in range(len(pages) + len(errors)):
+        error = failed.get(index)
+        if error is None:
+            responses.extend(next(remaining))
+            continue
+        responses.extend(
+            OrderPostResponse(
+                errorMsg=error.error,
+                orderID="",
+                takingAmount="",
+                makingAmount="",
+                status="",
+                success=False,
+            )
+            for _ in error.items
+        )
+    return responses
+
+
+def _merge_cancel_responses(
+    pages: list[OrderCancelResponse], errors: list[ChunkError]
+) -> OrderCancelResponse:
+    canceled: list[Keccak256] = []
+    not_canceled: dict[Keccak256, str] = {}
+    for page in pages:
+        canceled.extend(page.canceled or [])
+        not_canceled.update(page.not_canceled or {})
+    for error in errors:
+        for order_id in error.items:
+            not_canceled[order_id] = error.error
+    return OrderCancelResponse(canceled=canceled, not_canceled=not_canceled)
+
+
+def _merge_bid_asks(pages: list[dict[str, BidAsk]]) -> dict[str, BidAsk]:
+    # the same token can show up in two chunks with different sides
+    merged: dict[str, BidAsk] = {}
+    for page in pages:
+        for token_id, bid_ask in page.items():
+            if token_id in merged:
+                current = merged[token_id]
+                merged[token_id] = BidAsk(
+                    BUY=bid_ask.BUY if bid_ask.BUY is not None else current.BUY,
+                    SELL=bid_ask.SELL if bid_ask.SELL is not None else current.SELL,
+                )
+            else:
+                merged[token_id] = bid_ask
+    return merged
+
+
 class PolymarketClobClient:
     def __init__(
         self,
@@ -102,6 +177,7 @@ class PolymarketClobClient:
         chain_id: Literal[137, 80002] = POLYGON,
         signature_type: Literal[0, 1, 2] = 1,
         # 0 - EOA wallet, 1 - Proxy wallet, 2 - Gnosis Safe wallet
+        metadata_cache: MarketMetadataCache | None = None,
     ):
         self.address = address
         self.client = httpx.Client(http2=True, timeout=30.0)
@@ -114,16 +190,25 @@ class PolymarketClobClient:
             sig_type=signature_type,
             funder=address,
         )
-        self.creds = creds if creds else self.create_or_derive_api_creds()
 
-        # local cache
-        self.__tick_sizes: dict[str, TickSize] = {}
-        self.__neg_risk: dict[str, bool] = {}
-        self.__fee_rates: dict[str, int] = {}
+        # tick size / neg risk / fee rate per token, can be shared between clients
+        self.metadata_cache = (
+            metadata_cache if metadata_cache is not None else MarketMetadataCache()
+        )
+        self._l2_headers: Level2HeaderFactory | None = None
+        self.creds = creds if creds else self.create_or_derive_api_creds()
 
     def _build_url(self, endpoint: str) -> str:
         return urljoin(self.base_url, endpoint)
 
+    def _level_2_headers(
+        self, request_args: RequestArgs, content: bytes | None = None
+    ) -> dict[str, str]:
+        # rebuilt whenever the creds are replaced
+        if self._l2_headers is None or self._l2_headers.creds is not self.creds:
+            self._l2_headers = Level2HeaderFactory(self.signer, self.creds)
+        return self._l2_headers.create(request_args, content)
+
     def get_ok(self) -> str:
         response = self.client.get(self.base_url)
         response.raise_for_status()
@@ -152,21 +237,21 @@ class PolymarketClobClient:
 
     def get_api_keys(self) -> list[str]:
         request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
         response = self.client.get(self._build_url(GET_API_KEYS), headers=headers)
         response.raise_for_status()
         return cast("list[str]", response.json()["apiKeys"])
 
     def delete_api_keys(self) -> Literal["OK"]:
         request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
         response = self.client.delete(self._build_url(DELETE_API_KEY), headers=headers)
         response.raise_for_status()
         return cast("Literal['OK']", response.json())
 
     def create_readonly_api_key(self) -> str:
         request_args = RequestArgs(method="POST", request_path=CREATE_READONLY_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         response = self.client.post(
             self._build_url(CREATE_READONLY_API_KEY), headers=headers
@@ -176,7 +261,7 @@ class PolymarketClobClient:
 
     def get_readonly_api_keys(self) -> list[str]:
         request_args = RequestArgs(method="GET", request_path=GET_READONLY_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         response = self.client.get(
             self._build_url(GET_READONLY_API_KEYS), headers=headers
@@ -186,19 +271,20 @@ class PolymarketClobClient:
 
     def delete_readonly_api_key(self, key: str) -> str:
         body = {"key": key}
+        content = serialize_body(body)
 
         request_args = RequestArgs(
             method="DELETE",
             request_path=DELETE_READONLY_API_KEY,
             body=body,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args, content)
 
         response = self.client.request(
             "DELETE",
             self._build_url(DELETE_READONLY_API_KEY),
             headers=headers,
-            content=json.dumps(body).encode("utf-8"),
+            content=content,
         )
         response.raise_for_status()
         return cast("str", response.json())
@@ -210,41 +296,78 @@ class PolymarketClobClient:
         return datetime.fromtimestamp(response.json(), tz=UTC)
 
     def get_tick_size(self, token_id: str) -> TickSize:
-        if token_id in self.__tick_sizes:
-            return self.__tick_sizes[token_id]
+        tick_size = self.metadata_cache.get_tick_size(token_id)
+        if tick_size is not None:
+            return tick_size
 
         params = {"token_id": token_id}
         response = self.client.get(self._build_url(GET_TICK_SIZE), params=params)
         response.raise_for_status()
-        self.__tick_sizes[token_id] = cast(
-            "TickSize", str(response.json()["minimum_tick_size"])
-        )
+        tick_size = cast("TickSize", str(response.json()["minimum_tick_size"]))
+        self.metadata_cache.set_tick_size(token_id, tick_size)
 
-        return self.__tick_sizes[token_id]
+        return tick_size
 
     def get_neg_risk(self, token_id: str) -> bool:
-        if token_id in self.__neg_risk:
-            return self.__neg_risk[token_id]
+        cached = self.metadata_cache.get_neg_risk(token_id)
+        if cached is not None:
+            return cached
 
         params = {"token_id": token_id}
         response = self.client.get(self._build_url(GET_NEG_RISK), params=params)
         response.raise_for_status()
-        self.__neg_risk[token_id] = response.json()["neg_risk"]
+        neg_risk = bool(response.json()["neg_risk"])
+        self.metadata_cache.set_neg_risk(token_id, neg_risk)
 
-        return self.__neg_risk[token_id]
+        return neg_risk
 
     def get_fee_rate_bps(self, token_id: str) -> int:
-        if token_id in self.__fee_rates:
-            return self.__fee_rates[token_id]
+        cached = self.metadata_cache.get_fee_rate_bps(token_id)
+        if cached is not None:
+            return cached
+        return self._fetch_fee_rate_bps(token_id)
 
+    def _fetch_fee_rate_bps(self, token_id: str) -> int:
         params = {"token_id": token_id}
         response = self.client.get(self._build_url(GET_FEE_RATE), params=params)
         response.raise_for_status()
-        fee_rate = response.json().get("base_fee") or 0
-        self.__fee_rates[token_id] = fee_rate
+        fee_rate = int(response.json().get("base_fee") or 0)
+        self.metadata_cache.set_fee_rate_bps(token_id, fee_rate)
 
         return fee_rate
 
+    def warm_fee_rates(
+        self,
+        token_ids: list[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, int]]:
+        """Fetch the fee rates of the tokens missing from the cache concurrently, so create_order finds them cached."""
+        unique = list(dict.fromkeys(token_ids))
+        fee_rates: dict[str, int] = {}
+        missing = []
+        for token_id in unique:
+            fee_rate = self.metadata_cache.get_fee_rate_bps(token_id)
+            if fee_rate is None:
+                missing.append(token_id)
+            else:
+                fee_rates[token_id] = fee_rate
+
+        def fetch(chunk: list[str]) -> dict[str, int]:
+            # the fee rate endpoint takes a single token
+            return {chunk[0]: self._fetch_fee_rate_bps(chunk[0])}
+
+        pages, errors = run_chunked(fetch, missing, 1, max_concurrency)
+        for page in pages:
+            fee_rates.update(page)
+        return BatchResponse[dict[str, int]](
+            data={
+                token_id: fee_rates[token_id]
+                for token_id in unique
+                if token_id in fee_rates
+            },
+            errors=errors,
+        )
+
     def __resolve_tick_size(
         self,
         token_id: str,
@@ -338,14 +461,92 @@ class PolymarketClobClient:
         params = {"token_id": token_id}
         response = self.client.get(self._build_url(GET_ORDER_BOOK), params=params)
         response.raise_for_status()
-        return OrderBookSummary(**response.json())
+        book = OrderBookSummary(**response.json())
+        self.metadata_cache.warm_from_books([book])
+        return book
 
     def get_order_books(self, token_ids: list[str]) -> list[OrderBookSummary]:
         """Get the orderbook for a set of tokens."""
         body = [{"token_id": token_id} for token_id in token_ids]
         response = self.client.post(self._build_url(GET_ORDER_BOOKS), json=body)
         response.raise_for_status()
-        return [OrderBookSummary(**obs) for obs in response.json()]
+        books = [OrderBookSummary(**obs) for obs in response.json()]
+        self.metadata_cache.warm_from_books(books)
+        return books
+
+    def get_midpoints_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, float]]:
+        """Get the mid-market prices for many tokens, split into chunks sent concurrently."""
+        pages, errors = run_chunked(
+            self.get_midpoints, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[dict[str, float]](
+            data={k: v for page in pages for k, v in page.items()}, errors=errors
+        )
+
+    def get_spreads_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, float]]:
+        """Get the spreads for many tokens, split into chunks sent concurrently."""
+        pages, errors = run_chunked(
+            self.get_spreads, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[dict[str, float]](
+            data={k: v for page in pages for k, v in page.items()}, errors=errors
+        )
+
+    def get_prices_batched(
+        self,
+        params: list[BookParams],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, BidAsk]]:
+        """Get the market prices for many tokens and sides, split into chunks sent concurrently."""
+        pages, errors = run_chunked(
+            self.get_prices,
+            params,
+            chunk_size,
+            max_concurrency,
+            item_id=lambda param: param.token_id,
+        )
+        return BatchResponse[dict[str, BidAsk]](
+            data=_merge_bid_asks(pages), errors=errors
+        )
+
+    def get_last_trades_prices_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[list[Price]]:
+        """Fetches the last trades prices for many tokens, split into chunks sent concurrently."""
+        pages, errors = run_chunked(
+            self.get_last_trades_prices, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[list[Price]](
+            data=[price for page in pages for price in page], errors=errors
+        )
+
+    def get_order_books_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[list[OrderBookSummary]]:
+        """Get the orderbooks for many tokens, split into chunks sent concurrently."""
+        pages, errors = run_chunked(
+            self.get_order_books, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[list[OrderBookSummary]](
+            data=[book for page in pages for book in page], errors=errors
+        )
 
     async def get_order_books_async(
         self, token_ids: list[str]
@@ -356,41 +557,73 @@ class PolymarketClobClient:
             self._build_url(GET_ORDER_BOOKS), json=body
         )
         response.raise_for_status()
-        return [OrderBookSummary(**obs) for obs in response.json()]
+        books = [OrderBookSummary(**obs) for obs in response.json()]
+        self.metadata_cache.warm_from_books(books)
+        return books
 
     def get_market(self, condition_id: Keccak256) -> ClobMarket:
         """Get a ClobMarket by condition_id."""
         response = self.client.get(self._build_url(GET_MARKET + condition_id))
         response.raise_for_status()
-        return ClobMarket(**response.json())
+        market = ClobMarket(**response.json())
+        self.metadata_cache.warm([market])
+        return market
 
     def get_markets(self, next_cursor: str = "MA==") -> PaginatedResponse[ClobMarket]:
         """Get paginated ClobMarkets."""
         params = {"next_cursor": next_cursor}
         response = self.client.get(self._build_url(GET_MARKETS), params=params)
         response.raise_for_status()
-        return PaginatedResponse[ClobMarket](**response.json())
+        page = PaginatedResponse[ClobMarket](**response.json())
+        self.metadata_cache.warm(page.data)
+        return page
+
+    def iter_markets(self, next_cursor: str = "MA==") -> Iterator[list[ClobMarket]]:
+        """Yield ClobMarket pages as they arrive, fetching the next page while the caller handles the current one."""
+        if next_cursor == END_CURSOR:
+            return
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending: Future[PaginatedResponse[ClobMarket]] | None = pool.submit(
+                self.get_markets, next_cursor
+            )
+            while pending is not None:
+                page = pending.result()
+                pending = None
+                if page.next_cursor != END_CURSOR:
+                    pending = pool.submit(self.get_markets, page.next_cursor)
+                yield page.data
+
+    def warm_metadata_cache(
+        self,
+        next_cursor: str = "MA==",
+        fee_rates: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[ChunkError]:
+        """
+        Fetch every ClobMarket page once so tick size and neg risk are cached for all tokens.
 
-    def get_all_markets(self, next_cursor: str = "MA==") -> list[ClobMarket]:
-        """Recursively fetch all ClobMarkets using pagination."""
-        # Base case: Stop recursion if next_cursor indicates the last page
-        if next_cursor == "LTE=":
-            print("Reached the last page of markets.")
+        With fee_rates, the fee rates of the tokens of markets accepting orders are then fetched
+        with warm_fee_rates. Returns the fee rate fetches that failed.
+        """
+        token_ids = []
+        for page in self.iter_markets(next_cursor=next_cursor):
+            token_ids += [
+                token.token_id
+                for market in page
+                if market.accepting_orders
+                for token in market.token_ids
+            ]
+        if not fee_rates:
             return []
+        return self.warm_fee_rates(token_ids, max_concurrency).errors
 
-        # Fetch current page of markets
-        paginated_response = self.get_markets(next_cursor=next_cursor)
-
-        # Collect current page data
-        current_markets = paginated_response.data
-
-        # Recursively fetch remaining pages
-        next_page_markets = self.get_all_markets(
-            next_cursor=paginated_response.next_cursor,
-        )
+    def get_all_markets(self, next_cursor: str = "MA==") -> list[ClobMarket]:
+        """Fetch all ClobMarkets using pagination."""
+        results: list[ClobMarket] = []
+        for page in self.iter_markets(next_cursor=next_cursor):
+            results.extend(page)
 
-        # Combine current page data with data from subsequent pages
-        return current_markets + next_page_markets
+        return results
 
     def get_recent_history(
         self,
@@ -467,7 +700,7 @@ class PolymarketClobClient:
             "signature_type": self.signature_type,
         }
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
         response = self.client.get(
             self._build_url(GET_BALANCE_ALLOWANCE), headers=headers, params=params
         )
@@ -481,7 +714,7 @@ class PolymarketClobClient:
             "signature_type": self.signature_type,
         }
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
         response = self.client.get(
             self._build_url(GET_BALANCE_ALLOWANCE), headers=headers, params=params
         )
@@ -505,7 +738,7 @@ class PolymarketClobClient:
             params["asset_id"] = token_id
 
         request_args = RequestArgs(method="GET", request_path=ORDERS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         results = []
         next_cursor = next_cursor if next_cursor is not None else "MA=="
@@ -520,11 +753,9 @@ class PolymarketClobClient:
 
         return results
 
-    def create_order(
+    def __resolve_order_options(
         self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
-    ) -> SignedOrder:
-        """Creates and signs an order."""
-        # add resolve_order_options, or similar
+    ) -> CreateOrderOptions:
         tick_size = self.__resolve_tick_size(
             order_args.token_id,
             options.tick_size if options else None,
@@ -546,30 +777,46 @@ class PolymarketClobClient:
         )
         order_args.fee_rate_bps = fee_rate_bps
 
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
+        )
+
+    def create_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
+    ) -> SignedOrder:
+        """Creates and signs an order."""
         return self.builder.create_order(
-            order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+            order_args, self.__resolve_order_options(order_args, options)
         )
 
+    def create_orders(
+        self,
+        args: list[OrderArgs],
+        options: PartialCreateOrderOptions | None = None,
+        executor: Executor | None = None,
+    ) -> list[SignedOrder]:
+        """Creates and signs multiple orders, in input order, optionally spread over an executor from builder.signing_pool()."""
+        resolved = [
+            self.__resolve_order_options(order_args, options) for order_args in args
+        ]
+        return self.builder.create_orders(args, resolved, executor)
+
     def post_order(
         self, order: SignedOrder, order_type: OrderType = OrderType.GTC
     ) -> OrderPostResponse | None:
         """Posts a SignedOrder."""
         body = order_to_json(order, self.creds.key, order_type)
-        headers = create_level_2_headers(
-            self.signer,
-            self.creds,
-            RequestArgs(method="POST", request_path=POST_ORDER, body=body),
+        content = serialize_body(body)
+        headers = self._level_2_headers(
+            RequestArgs(method="POST", request_path=POST_ORDER, body=body), content
         )
 
         try:
             response = self.client.post(
                 self._build_url("/order"),
                 headers=headers,
-                content=json.dumps(body).encode("utf-8"),
+                content=content,
             )
             response.raise_for_status()
             return OrderPostResponse(**response.json())
@@ -590,28 +837,29 @@ class PolymarketClobClient:
         order = self.create_order(order_args, options)
         return self.post_order(order=order, order_type=order_type)
 
-    def post_orders(self, args: list[PostOrdersArgs]) -> list[OrderPostResponse] | None:
-        """Posts multiple SignedOrders at once."""
+    def __post_orders_batch(
+        self, args: list[PostOrdersArgs]
+    ) -> list[OrderPostResponse]:
         body = [
             order_to_json(arg.order, self.creds.key, arg.order_type) for arg in args
         ]
-        headers = create_level_2_headers(
-            self.signer,
-            self.creds,
-            RequestArgs(method="POST", request_path=POST_ORDERS, body=body),
+        content = serialize_body(body)
+        headers = self._level_2_headers(
+            RequestArgs(method="POST", request_path=POST_ORDERS, body=body), content
         )
+        response = self.client.post(
+            self._build_url("/orders"),
+            headers=headers,
+            content=content,
+        )
+        response.raise_for_status()
+        return [OrderPostResponse(**item) for item in response.json()]
 
+    def post_orders(self, args: list[PostOrdersArgs]) -> list[OrderPostResponse] | None:
+        """Posts multiple SignedOrders at once."""
         try:
-            response = self.client.post(
-                self._build_url("/orders"),
-                headers=headers,
-                content=json.dumps(body).encode("utf-8"),
-            )
-            response.raise_for_status()
-            order_responses = []
-            for index, item in enumerate(response.json()):
-                resp = OrderPostResponse(**item)
-                order_responses.append(resp)
+            order_responses = self.__post_orders_batch(args)
+            for index, resp in enumerate(order_responses):
                 if resp.error_msg:
                     msg = (
                         f"Error posting order in position {index} \n"
@@ -627,16 +875,40 @@ class PolymarketClobClient:
         else:
             return order_responses
 
+    def post_orders_batched(
+        self,
+        args: list[PostOrdersArgs],
+        batch_size: int = MAX_POST_ORDERS_BATCH,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[OrderPostResponse]:
+        """
+        Posts any number of SignedOrders, split into batches of at most batch_size sent concurrently.
+
+        Returns one OrderPostResponse per order in input order - orders of a failed batch get success=False and the error in error_msg.
+        A batch whose response does not hold one entry per order counts as failed too, its orders may still have been placed.
+        """
+        pages, errors = run_chunked(
+            self.__post_orders_batch,
+            args,
+            batch_size,
+            max_concurrency,
+            item_id=lambda arg: arg.order.signature,
+            one_per_item=True,
+        )
+        return _align_post_responses(pages, errors)
+
     def create_and_post_orders(
-        self, args: list[OrderArgs], order_types: list[OrderType]
+        self,
+        args: list[OrderArgs],
+        order_types: list[OrderType],
+        executor: Executor | None = None,
     ) -> list[OrderPostResponse] | None:
         """Utility function to create and publish multiple orders at once."""
+        orders = self.create_orders(args, executor=executor)
         return self.post_orders(
             [
-                PostOrdersArgs(
-                    order=self.create_order(order_args), order_type=order_type
-                )
-                for order_args, order_type in zip(args, order_types, strict=True)
+                PostOrdersArgs(order=order, order_type=order_type)
+                for order, order_type in zip(orders, order_types, strict=True)
             ],
         )
 
@@ -725,15 +997,16 @@ class PolymarketClobClient:
     def cancel_order(self, order_id: Keccak256) -> OrderCancelResponse:
         """Cancels an order."""
         body = {"orderID": order_id}
+        content = serialize_body(body)
 
         request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args, content)
 
         response = self.client.request(
             "DELETE",
             self._build_url(CANCEL),
             headers=headers,
-            content=json.dumps(body).encode("utf-8"),
+            content=content,
         )
         response.raise_for_status()
         return OrderCancelResponse(**response.json())
@@ -741,27 +1014,40 @@ class PolymarketClobClient:
     def cancel_orders(self, order_ids: list[Keccak256]) -> OrderCancelResponse:
         """Cancels orders."""
         body = order_ids
+        content = serialize_body(body)
 
         request_args = RequestArgs(
             method="DELETE",
             request_path=CANCEL_ORDERS,
             body=body,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args, content)
 
         response = self.client.request(
             "DELETE",
             self._build_url(CANCEL_ORDERS),
             headers=headers,
-            content=json.dumps(body).encode("utf-8"),
+            content=content,
         )
         response.raise_for_status()
         return OrderCancelResponse(**response.json())
 
+    def cancel_orders_batched(
+        self,
+        order_ids: list[Keccak256],
+        batch_size: int = MAX_CANCEL_ORDERS_BATCH,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> OrderCancelResponse:
+        """Cancels any number of orders in concurrent batches - ids of a failed batch are reported in not_canceled with the error."""
+        pages, errors = run_chunked(
+            self.cancel_orders, order_ids, batch_size, max_concurrency
+        )
+        return _merge_cancel_responses(pages, errors)
+
     def cancel_all(self) -> OrderCancelResponse:
         """Cancels all available orders for the user."""
         request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         response = self.client.delete(self._build_url(CANCEL_ALL), headers=headers)
         response.raise_for_status()
@@ -770,7 +1056,7 @@ class PolymarketClobClient:
     def is_order_scoring(self, order_id: Keccak256) -> bool:
         """Check if the order is currently scoring."""
         request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         response = self.client.get(
             self._build_url(IS_ORDER_SCORING),
@@ -783,16 +1069,17 @@ class PolymarketClobClient:
     def are_orders_scoring(self, order_ids: list[Keccak256]) -> dict[Keccak256, bool]:
         """Check if the orders are currently scoring."""
         body = order_ids
+        content = serialize_body(body)
         request_args = RequestArgs(
             method="POST",
             request_path=ARE_ORDERS_SCORING,
             body=body,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args, content)
         headers["Content-Type"] = "application/json"
 
         response = self.client.post(
-            self._build_url(ARE_ORDERS_SCORING), headers=headers, json=body
+            self._build_url(ARE_ORDERS_SCORING), headers=headers, content=content
         )
         response.raise_for_status()
         return cast("dict[Keccak256, bool]", response.json())
@@ -804,7 +1091,7 @@ class PolymarketClobClient:
         - metadata, tokens, max_spread, min_size, rewards_config, market_competitiveness.
         """
         request_args = RequestArgs(method="GET", request_path="/rewards/markets/")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         response = self.client.get(
             self._build_url("/rewards/markets/" + condition_id), headers=headers
@@ -838,7 +1125,7 @@ class PolymarketClobClient:
             params["maker_address"] = address
 
         request_args = RequestArgs(method="GET", request_path=TRADES)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
 
         results = []
         next_cursor_str: str = next_cursor if next_cursor is not None else "MA=="
@@ -863,7 +1150,7 @@ class PolymarketClobClient:
         }
 
         request_args = RequestArgs(method="GET", request_path="/rewards/user/total")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
         params["l2Headers"] = json.dumps(headers)
 
         response = self.client.get(
@@ -924,7 +1211,7 @@ class PolymarketClobClient:
             params["desc"] = desc[sort_direction]
 
         request_args = RequestArgs(method="GET", request_path="/rewards/user/markets")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._level_2_headers(request_args)
         params["l2Headers"] = json.dumps(headers)
 
         next_cursor = "MA=="
@@ -953,3 +1240,1099 @@ class PolymarketClobClient:
     ) -> None:
         self.client.close()
         await self.async_client.aclose()
+
+
+class AsyncPolymarketClobClient:
+    """
+    Asynchronous counterpart of PolymarketClobClient.
+
+    Uses the same signer, order builder and header builders, but every network call is awaitable
+    and goes through a single HTTP/2 httpx.AsyncClient.
+    If no creds are passed, they are created or derived on first authenticated call (or on `async with`).
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        address: EthAddress,
+        creds: ApiCreds | None = None,
+        chain_id: Literal[137, 80002] = POLYGON,
+        signature_type: Literal[0, 1, 2] = 1,
+        # 0 - EOA wallet, 1 - Proxy wallet, 2 - Gnosis Safe wallet
+        metadata_cache: MarketMetadataCache | None = None,
+    ):
+        self.address = address
+        self.client = httpx.AsyncClient(http2=True, timeout=30.0)
+        self.base_url: str = "https://clob.polymarket.com"
+        self.signer = Signer(private_key=private_key, chain_id=chain_id)
+        self.signature_type = signature_type
+        self.builder = OrderBuilder(
+            signer=self.signer,
+            sig_type=signature_type,
+            funder=address,
+        )
+        self.creds = creds
+
+        # tick size / neg risk / fee rate per token, can be shared between clients
+        self.metadata_cache = (
+            metadata_cache if metadata_cache is not None else MarketMetadataCache()
+        )
+        self._l2_headers: Level2HeaderFactory | None = None
+        # concurrent first calls must create/derive the creds only once
+        self._creds_lock = asyncio.Lock()
+
+    def _build_url(self, endpoint: str) -> str:
+        return urljoin(self.base_url, endpoint)
+
+    async def _get_creds(self) -> ApiCreds:
+        if self.creds is None:
+            async with self._creds_lock:
+                if self.creds is None:
+                    self.creds = await self.create_or_derive_api_creds()
+        return self.creds
+
+    async def _level_2_headers(
+        self, request_args: RequestArgs, content: bytes | None = None
+    ) -> dict[str, str]:
+        creds = await self._get_creds()
+        # rebuilt whenever the creds are replaced
+        if self._l2_headers is None or self._l2_headers.creds is not creds:
+            self._l2_headers = Level2HeaderFactory(self.signer, creds)
+        return self._l2_headers.create(request_args, content)
+
+    async def get_ok(self) -> str:
+        response = await self.client.get(self.base_url)
+        response.raise_for_status()
+        return cast("str", response.json())
+
+    async def create_api_creds(self, nonce: int | None = None) -> ApiCreds:
+        headers = create_level_1_headers(self.signer, nonce)
+        response = await self.client.post(
+            self._build_url(CREATE_API_KEY), headers=headers
+        )
+        response.raise_for_status()
+        return ApiCreds(**response.json())
+
+    async def derive_api_key(self, nonce: int | None = None) -> ApiCreds:
+        headers = create_level_1_headers(self.signer, nonce)
+        response = await self.client.get(
+            self._build_url(DERIVE_API_KEY), headers=headers
+        )
+        response.raise_for_status()
+        return ApiCreds(**response.json())
+
+    async def create_or_derive_api_creds(self, nonce: int | None = None) -> ApiCreds:
+        try:
+            return await self.create_api_creds(nonce)
+        except HTTPStatusError:
+            return await self.derive_api_key(nonce)
+
+    def set_api_creds(self, creds: ApiCreds) -> None:
+        self.creds = creds
+
+    async def get_api_keys(self) -> list[str]:
+        request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
+        headers = await self._level_2_headers(request_args)
+        response = await self.client.get(self._build_url(GET_API_KEYS), headers=headers)
+        response.raise_for_status()
+        return cast("list[str]", response.json()["apiKeys"])
+
+    async def delete_api_keys(self) -> Literal["OK"]:
+        request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
+        headers = await self._level_2_headers(request_args)
+        response = await self.client.delete(
+            self._build_url(DELETE_API_KEY), headers=headers
+        )
+        response.raise_for_status()
+        return cast("Literal['OK']", response.json())
+
+    async def create_readonly_api_key(self) -> str:
+        request_args = RequestArgs(method="POST", request_path=CREATE_READONLY_API_KEY)
+        headers = await self._level_2_headers(request_args)
+
+        response = await self.client.post(
+            self._build_url(CREATE_READONLY_API_KEY), headers=headers
+        )
+        response.raise_for_status()
+        return cast("str", response.json()["apiKey"])
+
+    async def get_readonly_api_keys(self) -> list[str]:
+        request_args = RequestArgs(method="GET", request_path=GET_READONLY_API_KEYS)
+        headers = await self._level_2_headers(request_args)
+
+        response = await self.client.get(
+            self._build_url(GET_READONLY_API_KEYS), headers=headers
+        )
+        response.raise_for_status()
+        return cast("list[str]", response.json()["readonlyApiKeys"])
+
+    async def delete_readonly_api_key(self, key: str) -> str:
+        body = {"key": key}
+        content = serialize_body(body)
+
+        request_args = RequestArgs(
+            method="DELETE",
+            request_path=DELETE_READONLY_API_KEY,
+            body=body,
+        )
+        headers = await self._level_2_headers(request_args, content)
+
+        response = await self.client.request(
+            "DELETE",
+            self._build_url(DELETE_READONLY_API_KEY),
+            headers=headers,
+            content=content,
+        )
+        response.raise_for_status()
+        return cast("str", response.json())
+
+    async def get_utc_time(self) -> datetime:
+        # parse server timestamp into utc datetime
+        response = await self.client.get(self._build_url(TIME))
+        response.raise_for_status()
+        return datetime.fromtimestamp(response.json(), tz=UTC)
+
+    async def get_tick_size(self, token_id: str) -> TickSize:
+        tick_size = self.metadata_cache.get_tick_size(token_id)
+        if tick_size is not None:
+            return tick_size
+
+        params = {"token_id": token_id}
+        response = await self.client.get(self._build_url(GET_TICK_SIZE), params=params)
+        response.raise_for_status()
+        tick_size = cast("TickSize", str(response.json()["minimum_tick_size"]))
+        self.metadata_cache.set_tick_size(token_id, tick_size)
+
+        return tick_size
+
+    async def get_neg_risk(self, token_id: str) -> bool:
+        cached = self.metadata_cache.get_neg_risk(token_id)
+        if cached is not None:
+            return cached
+
+        params = {"token_id": token_id}
+        response = await self.client.get(self._build_url(GET_NEG_RISK), params=params)
+        response.raise_for_status()
+        neg_risk = bool(response.json()["neg_risk"])
+        self.metadata_cache.set_neg_risk(token_id, neg_risk)
+
+        return neg_risk
+
+    async def get_fee_rate_bps(self, token_id: str) -> int:
+        cached = self.metadata_cache.get_fee_rate_bps(token_id)
+        if cached is not None:
+            return cached
+        return await self._fetch_fee_rate_bps(token_id)
+
+    async def _fetch_fee_rate_bps(self, token_id: str) -> int:
+        params = {"token_id": token_id}
+        response = await self.client.get(self._build_url(GET_FEE_RATE), params=params)
+        response.raise_for_status()
+        fee_rate = int(response.json().get("base_fee") or 0)
+        self.metadata_cache.set_fee_rate_bps(token_id, fee_rate)
+
+        return fee_rate
+
+    async def warm_fee_rates(
+        self,
+        token_ids: list[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, int]]:
+        """Fetch the fee rates of the tokens missing from the cache concurrently, so create_order finds them cached."""
+        unique = list(dict.fromkeys(token_ids))
+        fee_rates: dict[str, int] = {}
+        missing = []
+        for token_id in unique:
+            fee_rate = self.metadata_cache.get_fee_rate_bps(token_id)
+            if fee_rate is None:
+                missing.append(token_id)
+            else:
+                fee_rates[token_id] = fee_rate
+
+        async def fetch(chunk: list[str]) -> dict[str, int]:
+            # the fee rate endpoint takes a single token
+            return {chunk[0]: await self._fetch_fee_rate_bps(chunk[0])}
+
+        pages, errors = await arun_chunked(fetch, missing, 1, max_concurrency)
+        for page in pages:
+            fee_rates.update(page)
+        return BatchResponse[dict[str, int]](
+            data={
+                token_id: fee_rates[token_id]
+                for token_id in unique
+                if token_id in fee_rates
+            },
+            errors=errors,
+        )
+
+    async def __resolve_tick_size(
+        self,
+        token_id: str,
+        tick_size: TickSize | None = None,
+    ) -> TickSize:
+        min_tick_size = await self.get_tick_size(token_id)
+        if tick_size is not None:
+            if is_tick_size_smaller(tick_size, min_tick_size):
+                msg = f"invalid tick size ({tick_size!s}), minimum for the market is {min_tick_size!s}"
+                raise InvalidTickSizeError(msg)
+        else:
+            tick_size = min_tick_size
+        return tick_size
+
+    async def __resolve_fee_rate(
+        self,
+        token_id: str,
+        user_fee_rate: int | None = None,
+    ) -> int:
+        market_fee_rate_bps = await self.get_fee_rate_bps(token_id)
+        # If both fee rate on the market and the user supplied fee rate are non-zero, validate that they match
+        # else return the market fee rate
+        if (
+            market_fee_rate_bps > 0
+            and user_fee_rate is not None
+            and user_fee_rate > 0
+            and user_fee_rate != market_fee_rate_bps
+        ):
+            msg = f"invalid user provided fee rate: ({user_fee_rate}), fee rate for the market must be {market_fee_rate_bps}"
+            raise InvalidFeeRateError(msg)
+        return market_fee_rate_bps
+
+    async def get_midpoint(self, token_id: str) -> Midpoint:
+        """Get the mid-market price for the given token."""
+        params = {"token_id": token_id}
+        response = await self.client.get(self._build_url(MID_POINT), params=params)
+        response.raise_for_status()
+        return Midpoint(token_id=token_id, value=float(response.json()["mid"]))
+
+    async def get_midpoints(self, token_ids: list[str]) -> dict[str, float]:
+        """Get the mid-market prices for a set of tokens."""
+        data = [{"token_id": token_id} for token_id in token_ids]
+        response = await self.client.post(self._build_url(MID_POINTS), json=data)
+        response.raise_for_status()
+        return TokenValueDict(**response.json()).root
+
+    async def get_spread(self, token_id: str) -> Spread:
+        """Get the spread for the given token."""
+        params = {"token_id": token_id}
+        response = await self.client.get(self._build_url(GET_SPREAD), params=params)
+        response.raise_for_status()
+        return Spread(token_id=token_id, value=float(response.json()["mid"]))
+
+    async def get_spreads(self, token_ids: list[str]) -> dict[str, float]:
+        """Get the spreads for a set of tokens."""
+        data = [{"token_id": token_id} for token_id in token_ids]
+        response = await self.client.post(self._build_url(GET_SPREADS), json=data)
+        response.raise_for_status()
+        return TokenValueDict(**response.json()).root
+
+    async def get_price(self, token_id: str, side: Literal["BUY", "SELL"]) -> Price:
+        """Get the market price for the given token and side."""
+        params = {"token_id": token_id, "side": side}
+        response = await self.client.get(self._build_url(PRICE), params=params)
+        response.raise_for_status()
+        return Price(**response.json(), token_id=token_id, side=side)
+
+    async def get_prices(self, params: list[BookParams]) -> dict[str, BidAsk]:
+        """Get the market prices for a set of tokens and sides."""
+        data = [{"token_id": param.token_id, "side": param.side} for param in params]
+        response = await self.client.post(self._build_url(GET_PRICES), json=data)
+        response.raise_for_status()
+        return TokenBidAskDict(**response.json()).root
+
+    async def get_last_trade_price(self, token_id: str) -> Price:
+        """Fetches the last trade price for a token_id."""
+        params = {"token_id": token_id}
+        response = await self.client.get(
+            self._build_url(GET_LAST_TRADE_PRICE), params=params
+        )
+        response.raise_for_status()
+        return Price(**response.json(), token_id=token_id)
+
+    async def get_last_trades_prices(self, token_ids: list[str]) -> list[Price]:
+        """Fetches the last trades prices for a set of token ids."""
+        body = [{"token_id": token_id} for token_id in token_ids]
+        response = await self.client.post(
+            self._build_url(GET_LAST_TRADES_PRICES), json=body
+        )
+        response.raise_for_status()
+        return [Price(**price) for price in response.json()]
+
+    async def get_order_book(self, token_id: str) -> OrderBookSummary:
+        """Get the orderbook for the given token."""
+        params = {"token_id": token_id}
+        response = await self.client.get(self._build_url(GET_ORDER_BOOK), params=params)
+        response.raise_for_status()
+        book = OrderBookSummary(**response.json())
+        self.metadata_cache.warm_from_books([book])
+        return book
+
+    async def get_order_books(self, token_ids: list[str]) -> list[OrderBookSummary]:
+        """Get the orderbook for a set of tokens."""
+        body = [{"token_id": token_id} for token_id in token_ids]
+        response = await self.client.post(self._build_url(GET_ORDER_BOOKS), json=body)
+        response.raise_for_status()
+        books = [OrderBookSummary(**obs) for obs in response.json()]
+        self.metadata_cache.warm_from_books(books)
+        return books
+
+    async def get_midpoints_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, float]]:
+        """Get the mid-market prices for many tokens, split into chunks sent concurrently."""
+        pages, errors = await arun_chunked(
+            self.get_midpoints, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[dict[str, float]](
+            data={k: v for page in pages for k, v in page.items()}, errors=errors
+        )
+
+    async def get_spreads_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, float]]:
+        """Get the spreads for many tokens, split into chunks sent concurrently."""
+        pages, errors = await arun_chunked(
+            self.get_spreads, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[dict[str, float]](
+            data={k: v for page in pages for k, v in page.items()}, errors=errors
+        )
+
+    async def get_prices_batched(
+        self,
+        params: list[BookParams],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[dict[str, BidAsk]]:
+        """Get the market prices for many tokens and sides, split into chunks sent concurrently."""
+        pages, errors = await arun_chunked(
+            self.get_prices,
+            params,
+            chunk_size,
+            max_concurrency,
+            item_id=lambda param: param.token_id,
+        )
+        return BatchResponse[dict[str, BidAsk]](
+            data=_merge_bid_asks(pages), errors=errors
+        )
+
+    async def get_last_trades_prices_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[list[Price]]:
+        """Fetches the last trades prices for many tokens, split into chunks sent concurrently."""
+        pages, errors = await arun_chunked(
+            self.get_last_trades_prices, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[list[Price]](
+            data=[price for page in pages for price in page], errors=errors
+        )
+
+    async def get_order_books_batched(
+        self,
+        token_ids: list[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResponse[list[OrderBookSummary]]:
+        """Get the orderbooks for many tokens, split into chunks sent concurrently."""
+        pages, errors = await arun_chunked(
+            self.get_order_books, token_ids, chunk_size, max_concurrency
+        )
+        return BatchResponse[list[OrderBookSummary]](
+            data=[book for page in pages for book in page], errors=errors
+        )
+
+    async def get_market(self, condition_id: Keccak256) -> ClobMarket:
+        """Get a ClobMarket by condition_id."""
+        response = await self.client.get(self._build_url(GET_MARKET + condition_id))
+        response.raise_for_status()
+        market = ClobMarket(**response.json())
+        self.metadata_cache.warm([market])
+        return market
+
+    async def get_markets(
+        self, next_cursor: str = "MA=="
+    ) -> PaginatedResponse[ClobMarket]:
+        """Get paginated ClobMarkets."""
+        params = {"next_cursor": next_cursor}
+        response = await self.client.get(self._build_url(GET_MARKETS), params=params)
+        response.raise_for_status()
+        page = PaginatedResponse[ClobMarket](**response.json())
+        self.metadata_cache.warm(page.data)
+        return page
+
+    async def iter_markets(
+        self, next_cursor: str = "MA=="
+    ) -> AsyncIterator[list[ClobMarket]]:
+        """Yield ClobMarket pages as they arrive, fetching the next page while the caller handles the current one."""
+        if next_cursor == END_CURSOR:
+            return
+        pending: asyncio.Task[PaginatedResponse[ClobMarket]] | None = (
+            asyncio.create_task(self.get_markets(next_cursor))
+        )
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                if page.next_cursor != END_CURSOR:
+                    pending = asyncio.create_task(self.get_markets(page.next_cursor))
+                yield page.data
+        finally:
+            # the consumer stopped early - drop the prefetched page
+            if pending is not None:
+                pending.cancel()
+
+    async def warm_metadata_cache(
+        self,
+        next_cursor: str = "MA==",
+        fee_rates: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[ChunkError]:
+        """Fetch every ClobMarket page once so tick size and neg risk are cached for all tokens, fee_rates as in the sync client."""
+        token_ids = []
+        async for page in self.iter_markets(next_cursor=next_cursor):
+            token_ids += [
+                token.token_id
+                for market in page
+                if market.accepting_orders
+                for token in market.token_ids
+            ]
+        if not fee_rates:
+            return []
+        return (await self.warm_fee_rates(token_ids, max_concurrency)).errors
+
+    async def get_all_markets(self, next_cursor: str = "MA==") -> list[ClobMarket]:
+        """Fetch all ClobMarkets using pagination."""
+        results: list[ClobMarket] = []
+        async for page in self.iter_markets(next_cursor=next_cursor):
+            results.extend(page)
+
+        return results
+
+    async def get_recent_history(
+        self,
+        token_id: str,
+        interval: Literal["1h", "6h", "1d", "1w", "1m", "max"] = "1d",
+        fidelity: int = 1,  # resolution in minutes
+    ) -> PriceHistory:
+        """Get the recent price history of a token (up to now) - 1h, 6h, 1d, 1w, 1m."""
+        min_fidelities: dict[str, int] = {
+            "1h": 1,
+            "6h": 1,
+            "1d": 1,
+            "1w": 5,
+            "1m": 10,
+            "max": 2,
+        }
+
+        if fidelity < min_fidelities[interval]:
+            msg = f"invalid filters: minimum fidelity' for '{interval}' range is {min_fidelities.get(interval)}"
+            raise ValueError(msg)
+
+        params: dict[str, int | str] = {
+            "market": token_id,
+            "interval": interval,
+            "fidelity": fidelity,
+        }
+        response = await self.client.get(
+            self._build_url("/prices-history"), params=params
+        )
+        response.raise_for_status()
+        return PriceHistory(**response.json(), token_id=token_id)
+
+    async def get_history(
+        self,
+        token_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        fidelity: int = 2,  # resolution in minutes
+    ) -> PriceHistory:
+        """Get the price history of a token between a selected date range of max 15 days or from start_time to now."""
+        if start_time is None and end_time is None:
+            msg = "At least 'start_time' or ('start_time' and 'end_time') must be provided"
+            raise ValueError(msg)
+
+        if (
+            start_time
+            and end_time
+            and start_time + timedelta(days=15, seconds=1) < end_time
+        ):
+            msg = "'start_time' - 'end_time' range cannot exceed 15 days. Remove 'end_time' to get prices up to now or set a shorter range."
+            raise ValueError(msg)
+
+        params: dict[str, int | str] = {
+            "market": token_id,
+            "fidelity": fidelity,
+        }
+        if start_time:
+            params["startTs"] = int(start_time.timestamp())
+        if end_time:
+            params["endTs"] = int(end_time.timestamp())
+
+        response = await self.client.get(
+            self._build_url("/prices-history"), params=params
+        )
+        response.raise_for_status()
+        return PriceHistory(**response.json(), token_id=token_id)
+
+    async def get_all_history(self, token_id: str) -> PriceHistory:
+        """Get the full price history of a token."""
+        return await self.get_history(
+            token_id=token_id,
+            start_time=datetime(2020, 1, 1, tzinfo=UTC),
+        )
+
+    async def get_usdc_balance(self) -> float:
+        params = {
+            "asset_type": "COLLATERAL",
+            "signature_type": self.signature_type,
+        }
+        request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
+        headers = await self._level_2_headers(request_args)
+        response = await self.client.get(
+            self._build_url(GET_BALANCE_ALLOWANCE), headers=headers, params=params
+        )
+        response.raise_for_status()
+        return int(response.json()["balance"]) / 10**6
+
+    async def get_token_balance(self, token_id: str) -> float:
+        params = {
+            "asset_type": "CONDITIONAL",
+            "token_id": token_id,
+            "signature_type": self.signature_type,
+        }
+        request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
+        headers = await self._level_2_headers(request_args)
+        response = await self.client.get(
+            self._build_url(GET_BALANCE_ALLOWANCE), headers=headers, params=params
+        )
+        response.raise_for_status()
+        return int(response.json()["balance"]) / 10**6
+
+    async def get_orders(
+        self,
+        order_id: str | None = None,
+        condition_id: Keccak256 | None = None,
+        token_id: str | None = None,
+        next_cursor: str = "MA==",
+    ) -> list[OpenOrder]:
+        """Gets your active orders, filtered by order_id, condition_id, token_id."""
+        params = {}
+        if order_id:
+            params["id"] = order_id
+        if condition_id:
+            params["market"] = condition_id
+        if token_id:
+            params["asset_id"] = token_id
+
+        request_args = RequestArgs(method="GET", request_path=ORDERS)
+        headers = await self._level_2_headers(request_args)
+
+        results = []
+        next_cursor = next_cursor if next_cursor is not None else "MA=="
+        while next_cursor != END_CURSOR:
+            params["next_cursor"] = next_cursor
+            response = await self.client.get(
+                self._build_url(ORDERS), headers=headers, params=params
+            )
+            response.raise_for_status()
+            next_cursor = response.json()["next_cursor"]
+            results += [OpenOrder(**order) for order in response.json()["data"]]
+
+        return results
+
+    async def __resolve_order_options(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
+    ) -> CreateOrderOptions:
+        tick_size = await self.__resolve_tick_size(
+            order_args.token_id,
+            options.tick_size if options else None,
+        )
+
+        if not price_valid(order_args.price, tick_size):
+            msg = f"price ({order_args.price}), min: {tick_size} - max: {1 - float(tick_size)}"
+            raise InvalidPriceError(msg)
+
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk is not None
+            else await self.get_neg_risk(order_args.token_id)
+        )
+
+        # fee rate
+        fee_rate_bps = await self.__resolve_fee_rate(
+            order_args.token_id, order_args.fee_rate_bps
+        )
+        order_args.fee_rate_bps = fee_rate_bps
+
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
+        )
+
+    async def create_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
+    ) -> SignedOrder:
+        """Creates and signs an order."""
+        return self.builder.create_order(
+            order_args, await self.__resolve_order_options(order_args, options)
+        )
+
+    async def create_orders(
+        self,
+        args: list[OrderArgs],
+        options: PartialCreateOrderOptions | None = None,
+        executor: Executor | None = None,
+    ) -> list[SignedOrder]:
+        """Creates and signs multiple orders, in input order, optionally spread over an executor from builder.signing_pool()."""
+        resolved = [
+            await self.__resolve_order_options(order_args, options)
+            for order_args in args
+        ]
+        if executor is None:
+            return self.builder.create_orders(args, resolved)
+        return await asyncio.to_thread(
+            self.builder.create_orders, args, resolved, executor
+        )
+
+    async def post_order(
+        self, order: SignedOrder, order_type: OrderType = OrderType.GTC
+    ) -> OrderPostResponse | None:
+        """Posts a SignedOrder."""
+        creds = await self._get_creds()
+        body = order_to_json(order, creds.key, order_type)
+        content = serialize_body(body)
+        headers = await self._level_2_headers(
+            RequestArgs(method="POST", request_path=POST_ORDER, body=body), content
+        )
+
+        try:
+            response = await self.client.post(
+                self._build_url("/order"),
+                headers=headers,
+                content=content,
+            )
+            response.raise_for_status()
+            return OrderPostResponse(**response.json())
+        except httpx.HTTPStatusError as exc:
+            msg = (
+                f"Client Error '{exc.response.status_code} {exc.response.reason_phrase}' while posting order\n"
+                f"Details: {exc.response.text}"
+            )
+            logger.warning(msg)
+            return None
+
+    async def create_and_post_order(
+        self,
+        order_args: OrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+        order_type: OrderType = OrderType.GTC,
+    ) -> OrderPostResponse | None:
+        """Utility function to create and publish an order."""
+        order = await self.create_order(order_args, options)
+        return await self.post_order(order=order, order_type=order_type)
+
+    async def __post_orders_batch(
+        self, args: list[PostOrdersArgs]
+    ) -> list[OrderPostResponse]:
+        creds = await self._get_creds()
+        body = [order_to_json(arg.order, creds.key, arg.order_type) for arg in args]
+        content = serialize_body(body)
+        headers = await self._level_2_headers(
+            RequestArgs(method="POST", request_path=POST_ORDERS, body=body), content
+        )
+        response = await self.client.post(
+            self._build_url("/orders"),
+            headers=headers,
+            content=content,
+        )
+        response.raise_for_status()
+        return [OrderPostResponse(**item) for item in response.json()]
+
+    async def post_orders(
+        self, args: list[PostOrdersArgs]
+    ) -> list[OrderPostResponse] | None:
+        """Posts multiple SignedOrders at once."""
+        try:
+            order_responses = await self.__post_orders_batch(args)
+            for index, resp in enumerate(order_responses):
+                if resp.error_msg:
+                    msg = (
+                        f"Error posting order in position {index} \n"
+                        f"Details: {resp.error_msg}"
+                    )
+                    logger.warning(msg)
+        except httpx.HTTPStatusError as exc:
+            msg = (
+                f"Client Error '{exc.response.status_code} {exc.response.reason_phrase}' while posting order\n"
+                f"Details: {exc.response.text}"
+            )
+            logger.warning(msg)
+            return None
+        else:
+            return order_responses
+
+    async def post_orders_batched(
+        self,
+        args: list[PostOrdersArgs],
+        batch_size: int = MAX_POST_ORDERS_BATCH,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[OrderPostResponse]:
+        """
+        Posts any number of SignedOrders, split into batches of at most batch_size sent concurrently.
+
+        Returns one OrderPostResponse per order in input order - orders of a failed batch get success=False and the error in error_msg.
+        A batch whose response does not hold one entry per order counts as failed too, its orders may still have been placed.
+        """
+        pages, errors = await arun_chunked(
+            self.__post_orders_batch,
+            args,
+            batch_size,
+            max_concurrency,
+            item_id=lambda arg: arg.order.signature,
+            one_per_item=True,
+        )
+        return _align_post_responses(pages, errors)
+
+    async def create_and_post_orders(
+        self,
+        args: list[OrderArgs],
+        order_types: list[OrderType],
+        executor: Executor | None = None,
+    ) -> list[OrderPostResponse] | None:
+        """Utility function to create and publish multiple orders at once."""
+        orders = await self.create_orders(args, executor=executor)
+        return await self.post_orders(
+            [
+                PostOrdersArgs(order=order, order_type=order_type)
+                for order, order_type in zip(orders, order_types, strict=True)
+            ],
+        )
+
+    async def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """Calculates the matching price considering an amount and the current orderbook."""
+        book = await self.get_order_book(token_id)
+        if book is None:
+            msg = "Order book is None"
+            raise MissingOrderbookError(msg)
+        if side == "BUY":
+            if book.asks is None:
+                msg = "No ask orders available"
+                raise LiquidityError(msg)
+            return self.builder.calculate_buy_market_price(
+                book.asks,
+                amount,
+                order_type,
+            )
+        if side == "SELL":
+            if book.bids is None:
+                msg = "No bid orders available"
+                raise LiquidityError(msg)
+            return self.builder.calculate_sell_market_price(
+                book.bids,
+                amount,
+                order_type,
+            )
+        msg = 'Side must be "BUY" or "SELL"'
+        raise ValueError(msg)
+
+    async def create_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+    ) -> SignedOrder:
+        """Creates and signs a market order."""
+        tick_size = await self.__resolve_tick_size(
+            order_args.token_id,
+            options.tick_size if options else None,
+        )
+
+        if order_args.price is None or order_args.price <= 0:
+            order_args.price = await self.calculate_market_price(
+                order_args.token_id,
+                order_args.side,
+                order_args.amount,
+                order_args.order_type,
+            )
+
+        if not price_valid(order_args.price, tick_size):
+            msg = f"price ({order_args.price}), min: {tick_size} - max: {1 - float(tick_size)}"
+            raise InvalidPriceError(msg)
+
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk is not None
+            else await self.get_neg_risk(order_args.token_id)
+        )
+
+        # fee rate
+        fee_rate_bps = await self.__resolve_fee_rate(
+            order_args.token_id, order_args.fee_rate_bps
+        )
+        order_args.fee_rate_bps = fee_rate_bps
+
+        return self.builder.create_market_order(
+            order_args,
+            CreateOrderOptions(
+                tick_size=tick_size,
+                neg_risk=neg_risk,
+            ),
+        )
+
+    async def create_and_post_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+        order_type: OrderType = OrderType.FOK,
+    ) -> OrderPostResponse | None:
+        """Utility function to create and publish a market order."""
+        order = await self.create_market_order(order_args, options)
+        return await self.post_order(order=order, order_type=order_type)
+
+    async def cancel_order(self, order_id: Keccak256) -> OrderCancelResponse:
+        """Cancels an order."""
+        body = {"orderID": order_id}
+        content = serialize_body(body)
+
+        request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
+        headers = await self._level_2_headers(request_args, content)
+
+        response = await self.client.request(
+            "DELETE",
+            self._build_url(CANCEL),
+            headers=headers,
+            content=content,
+        )
+        response.raise_for_status()
+        return OrderCancelResponse(**response.json())
+
+    async def cancel_orders(self, order_ids: list[Keccak256]) -> OrderCancelResponse:
+        """Cancels orders."""
+        body = order_ids
+        content = serialize_body(body)
+
+        request_args = RequestArgs(
+            method="DELETE",
+            request_path=CANCEL_ORDERS,
+            body=body,
+        )
+        headers = await self._level_2_headers(request_args, content)
+
+        response = await self.client.request(
+            "DELETE",
+            self._build_url(CANCEL_ORDERS),
+            headers=headers,
+            content=content,
+        )
+        response.raise_for_status()
+        return OrderCancelResponse(**response.json())
+
+    async def cancel_orders_batched(
+        self,
+        order_ids: list[Keccak256],
+        batch_size: int = MAX_CANCEL_ORDERS_BATCH,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> OrderCancelResponse:
+        """Cancels any number of orders in concurrent batches - ids of a failed batch are reported in not_canceled with the error."""
+        pages, errors = await arun_chunked(
+            self.cancel_orders, order_ids, batch_size, max_concurrency
+        )
+        return _merge_cancel_responses(pages, errors)
+
+    async def cancel_all(self) -> OrderCancelResponse:
+        """Cancels all available orders for the user."""
+        request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
+        headers = await self._level_2_headers(request_args)
+
+        response = await self.client.delete(
+            self._build_url(CANCEL_ALL), headers=headers
+        )
+        response.raise_for_status()
+        return OrderCancelResponse(**response.json())
+
+    async def is_order_scoring(self, order_id: Keccak256) -> bool:
+        """Check if the order is currently scoring."""
+        request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
+        headers = await self._level_2_headers(request_args)
+
+        response = await self.client.get(
+            self._build_url(IS_ORDER_SCORING),
+            headers=headers,
+            params={"order_id": order_id},
+        )
+        response.raise_for_status()
+        return cast("bool", response.json()["scoring"])
+
+    async def are_orders_scoring(
+        self, order_ids: list[Keccak256]
+    ) -> dict[Keccak256, bool]:
+        """Check if the orders are currently scoring."""
+        body = order_ids
+        content = serialize_body(body)
+        request_args = RequestArgs(
+            method="POST",
+            request_path=ARE_ORDERS_SCORING,
+            body=body,
+        )
+        headers = await self._level_2_headers(request_args, content)
+        headers["Content-Type"] = "application/json"
+
+        response = await self.client.post(
+            self._build_url(ARE_ORDERS_SCORING), headers=headers, content=content
+        )
+        response.raise_for_status()
+        return cast("dict[Keccak256, bool]", response.json())
+
+    async def get_market_rewards(self, condition_id: Keccak256) -> MarketRewards:
+        """
+        Get the MarketRewards for a given market (condition_id).
+
+        - metadata, tokens, max_spread, min_size, rewards_config, market_competitiveness.
+        """
+        request_args = RequestArgs(method="GET", request_path="/rewards/markets/")
+        headers = await self._level_2_headers(request_args)
+
+        response = await self.client.get(
+            self._build_url("/rewards/markets/" + condition_id), headers=headers
+        )
+        response.raise_for_status()
+        return next(MarketRewards(**market) for market in response.json()["data"])
+
+    async def get_trades(
+        self,
+        condition_id: Keccak256 | None = None,
+        token_id: str | None = None,
+        trade_id: str | None = None,
+        before: datetime | None = None,
+        after: datetime | None = None,
+        address: EthAddress | None = None,
+        next_cursor: str | None = "MA==",
+    ) -> list[PolygonTrade]:
+        """Fetches the trade history for a user."""
+        params: dict[str, str | int] = {}
+        if condition_id:
+            params["market"] = condition_id
+        if token_id:
+            params["asset_id"] = token_id
+        if trade_id:
+            params["id"] = trade_id
+        if before:
+            params["before"] = int(before.replace(microsecond=0).timestamp())
+        if after:
+            params["after"] = int(after.replace(microsecond=0).timestamp())
+        if address:
+            params["maker_address"] = address
+
+        request_args = RequestArgs(method="GET", request_path=TRADES)
+        headers = await self._level_2_headers(request_args)
+
+        results = []
+        next_cursor_str: str = next_cursor if next_cursor is not None else "MA=="
+        while next_cursor_str != END_CURSOR:
+            params["next_cursor"] = next_cursor_str
+            response = await self.client.get(
+                self._build_url(TRADES), headers=headers, params=params
+            )
+            response.raise_for_status()
+            next_cursor_str = response.json()["next_cursor"]
+            results += [PolygonTrade(**trade) for trade in response.json()["data"]]
+
+        return results
+
+    async def get_total_rewards(
+        self, date: datetime | None = None
+    ) -> DailyEarnedReward:
+        """Get the total rewards earned on a given date (seems to only hold the 6 most recent data points)."""
+        if date is None:
+            date = datetime.now(UTC)
+        params = {
+            "authenticationType": "magic",
+            "date": f"{date.strftime('%Y-%m-%d')}",
+        }
+
+        request_args = RequestArgs(method="GET", request_path="/rewards/user/total")
+        headers = await self._level_2_headers(request_args)
+        params["l2Headers"] = json.dumps(headers)
+
+        response = await self.client.get(
+            "https://polymarket.com/api/rewards/totalEarnings", params=params
+        )
+        response.raise_for_status()
+        if response.json():
+            return DailyEarnedReward(**response.json()[0])
+        return DailyEarnedReward(
+            date=date,
+            asset_address="0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174",
+            maker_address=self.address,
+            earnings=0.0,
+            asset_rate=0.0,
+        )
+
+    async def get_reward_markets(
+        self,
+        query: str | None = None,
+        sort_by: Literal[
+            "market",
+            "max_spread",
+            "min_size",
+            "rate_per_day",
+            "spread",
+            "price",
+            "earnings",
+            "earning_percentage",
+        ]
+        | None = "market",
+        sort_direction: Literal["ASC", "DESC"] | None = None,
+        show_favorites: bool = False,
+    ) -> list[RewardMarket]:
+        """Search through markets that offer rewards (polymarket.com/rewards items) by query, sorted by different metrics. See PolymarketClobClient.get_reward_markets."""
+        results = []
+        desc = {"ASC": False, "DESC": True}
+        params: dict[str, bool | str] = {
+            "authenticationType": "magic",
+            "showFavorites": show_favorites,
+        }
+        if sort_by:
+            params["orderBy"] = sort_by
+        if query:
+            params["query"] = query
+            params["desc"] = False
+        if sort_direction:
+            params["desc"] = desc[sort_direction]
+
+        request_args = RequestArgs(method="GET", request_path="/rewards/user/markets")
+        headers = await self._level_2_headers(request_args)
+        params["l2Headers"] = json.dumps(headers)
+
+        next_cursor = "MA=="
+        while next_cursor != END_CURSOR:
+            params["nextCursor"] = next_cursor
+            response = await self.client.get(
+                "https://polymarket.com/api/rewards/markets", params=params
+            )
+            response.raise_for_status()
+            next_cursor = response.json()["next_cursor"]
+            results += [RewardMarket(**reward) for reward in response.json()["data"]]
+
+        return results
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        await self._get_creds()
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.client.aclose()
@@ -1,11 +1,13 @@
 import json
 import random
 import string
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Literal, Optional, Union
+from typing import Any, Literal, Optional, Self, Union, overload
 from urllib.parse import urljoin
 
 import httpx
+from pydantic import BaseModel
 
 from ..types.common import EthAddress
 from ..types.gamma_types import (
@@ -19,6 +21,9 @@ from ..types.gamma_types import (
     TagRelation,
     Team,
 )
+from ..utilities.batching import apaginate_offsets, paginate_offsets
+from ..utilities.constants import DEFAULT_PAGE_CONCURRENCY
+from ..utilities.projection import project_model
 
 
 def generate_random_id(length: int = 16) -> str:
@@ -27,6 +32,375 @@ def generate_random_id(length: int = 16) -> str:
     return random_id
 
 
+# query building and parsing shared by PolymarketGammaClient and AsyncPolymarketGammaClient
+
+
+def _search_params(
+    query: str,
+    cache: Optional[bool],
+    status: Optional[str],
+    limit_per_type: Optional[int],
+    page: Optional[int],
+    tags: Optional[list[str]],
+    keep_closed_markets: Optional[bool],
+    sort: Optional[str],
+    ascending: Optional[bool],
+    search_tags: Optional[bool],
+    search_profiles: Optional[bool],
+    recurrence: Optional[str],
+    exclude_tag_ids: Optional[list[int]],
+    optimized: Optional[bool],
+) -> dict[str, str | list[str] | int | bool]:
+    params: dict[str, str | list[str] | int | bool] = {
+        "q": query,
+    }
+    if cache is not None:
+        params["cache"] = str(cache).lower()
+    if status:
+        params["events_status"] = status
+    if limit_per_type:
+        params["limit_per_type"] = limit_per_type
+    if page:
+        params["page"] = page
+    if tags:
+        params["events_tag"] = json.dumps([json.dumps(item) for item in tags])
+    if keep_closed_markets is not None:
+        params["keep_closed_markets"] = keep_closed_markets
+    if sort:
+        params["sort"] = sort
+    if ascending is not None:
+        params["ascending"] = str(ascending).lower()
+    if search_tags is not None:
+        params["search_tags"] = str(search_tags).lower()
+    if search_profiles is not None:
+        params["search_profiles"] = str(search_profiles).lower()
+    if recurrence:
+        params["recurrence"] = recurrence
+    if exclude_tag_ids:
+        params["exclude_tag_id"] = [str(i) for i in exclude_tag_ids]
+    if optimized is not None:
+        params["optimized"] = str(optimized).lower()
+    return params
+
+
+def _markets_params(
+    limit: int | None,
+    offset: int | None,
+    order: str | None,
+    ascending: bool,
+    archived: bool | None,
+    active: bool | None,
+    closed: bool | None,
+    slugs: list[str] | None,
+    market_ids: list[int] | None,
+    token_ids: list[str] | None,
+    condition_ids: list[str] | None,
+    tag_id: int | None,
+    related_tags: bool | None,
+    liquidity_num_min: float | None,
+    liquidity_num_max: float | None,
+    volume_num_min: float | None,
+    volume_num_max: float | None,
+    start_date_min: datetime | None,
+    start_date_max: datetime | None,
+    end_date_min: datetime | None,
+    end_date_max: datetime | None,
+) -> dict[str, float | int | list[int] | str | list[str] | bool]:
+    params: dict[str, float | int | list[int] | str | list[str] | bool] = {}
+    if limit:
+        params["limit"] = limit
+    if offset:
+        params["offset"] = offset
+    if order:
+        params["order"] = order
+        params["ascending"] = ascending
+    if slugs:
+        params["slug"] = slugs
+    if archived is not None:
+        params["archived"] = archived
+    if active is not None:
+        params["active"] = active
+    if closed is not None:
+        params["closed"] = closed
+    if market_ids:
+        params["id"] = market_ids
+    if token_ids:
+        params["clob_token_ids"] = token_ids
+    if condition_ids:
+        params["condition_ids"] = condition_ids
+    if liquidity_num_min:
+        params["liquidity_num_min"] = liquidity_num_min
+    if liquidity_num_max:
+        params["liquidity_num_max"] = liquidity_num_max
+    if volume_num_min:
+        params["volume_num_min"] = volume_num_min
+    if volume_num_max:
+        params["volume_num_max"] = volume_num_max
+    if start_date_min:
+        params["start_date_min"] = start_date_min.isoformat()
+    if start_date_max:
+        params["start_date_max"] = start_date_max.isoformat()
+    if end_date_min:
+        params["end_date_min"] = end_date_min.isoformat()
+    if end_date_max:
+        params["end_date_max"] = end_date_max.isoformat()
+    if tag_id:
+        params["tag_id"] = tag_id
+        if related_tags:
+            params["related_tags"] = related_tags
+    return params
+
+
+def _events_params(
+    limit: int,
+    offset: int,
+    order: Optional[str],
+    ascending: bool,
+    event_ids: Optional[Union[str, list[str]]],
+    slugs: Optional[list[str]],
+    archived: Optional[bool],
+    active: Optional[bool],
+    closed: Optional[bool],
+    liquidity_min: Optional[float],
+    liquidity_max: Optional[float],
+    volume_min: Optional[float],
+    volume_max: Optional[float],
+    start_date_min: Optional[datetime],
+    start_date_max: Optional[datetime],
+    end_date_min: Optional[datetime],
+    end_date_max: Optional[datetime],
+    tag: Optional[str],
+    tag_id: Optional[int],
+    tag_slug: Optional[str],
+    related_tags: bool,
+) -> dict[str, int | str | list[str] | float]:
+    params: dict[str, int | str | list[str] | float] = {
+        "limit": limit,
+        "offset": offset,
+    }
+    if order:
+        params["order"] = order
+        params["ascending"] = ascending
+    if event_ids:
+        params["id"] = event_ids
+    if slugs:
+        params["slug"] = slugs
+    if archived is not None:
+        params["archived"] = archived
+    if active is not None:
+        params["active"] = active
+    if closed is not None:
+        params["closed"] = closed
+    if liquidity_min:
+        params["liquidity_min"] = liquidity_min
+    if liquidity_max:
+        params["liquidity_max"] = liquidity_max
+    if volume_min:
+        params["volume_min"] = volume_min
+    if volume_max:
+        params["volume_max"] = volume_max
+    if start_date_min:
+        params["start_date_min"] = start_date_min.isoformat()
+    if start_date_max:
+        params["start_date_max"] = start_date_max.isoformat()
+    if end_date_min:
+        params["end_date_min"] = end_date_min.isoformat()
+    if end_date_max:
+        params["end_date_max"] = end_date_max.isoformat()
+    if tag:
+        params["tag"] = tag
+    elif tag_id:
+        params["tag_id"] = tag_id
+        if related_tags:
+            params["related_tags"] = related_tags
+    elif tag_slug:
+        params["tag_slug"] = tag_slug
+    return params
+
+
+def _page_params(
+    limit: int, offset: int, order: Optional[str], ascending: bool
+) -> dict[str, str | int]:
+    params: dict[str, str | int] = {
+        "limit": limit,
+        "offset": offset,
+    }
+    if order:
+        params["order"] = order
+        params["ascending"] = str(ascending).lower()
+    return params
+
+
+def _teams_params(
+    limit: int,
+    offset: int,
+    order: Optional[str],
+    ascending: bool,
+    league: Optional[str],
+    name: Optional[str],
+    abbreviation: Optional[str],
+) -> dict[str, str | int]:
+    params = _page_params(limit, offset, order, ascending)
+    if league:
+        params["league"] = league.lower()
+    if name:
+        params["name"] = name
+    if abbreviation:
+        params["abbreviation"] = abbreviation.lower()
+    return params
+
+
+def _tags_params(
+    limit: int,
+    offset: int,
+    order: Optional[str],
+    ascending: bool,
+    include_templates: Optional[bool],
+    is_carousel: Optional[bool],
+) -> dict[str, str | int]:
+    params = _page_params(limit, offset, order, ascending)
+    if include_templates is not None:
+        params["include_templates"] = str(include_templates).lower()
+    if is_carousel is not None:
+        params["is_carousel"] = str(is_carousel).lower()
+    return params
+
+
+def _series_params(
+    limit: int,
+    offset: int,
+    order: Optional[str],
+    ascending: bool,
+    slug: Optional[str],
+    closed: Optional[bool],
+    include_chat: Optional[bool],
+    recurrence: Optional[str],
+) -> dict[str, str | int]:
+    params = _page_params(limit, offset, order, ascending)
+    if slug:
+        params["slug"] = slug
+    if closed is not None:
+        params["closed"] = str(closed).lower()
+    if include_chat is not None:
+        params["include_chat"] = str(include_chat).lower()
+    if recurrence is not None:
+        params["recurrence"] = str(recurrence).lower()
+    return params
+
+
+def _comments_params(
+    parent_entity_type: str,
+    parent_entity_id: int,
+    limit: int,
+    offset: int,
+    order: Optional[str],
+    ascending: bool,
+    get_positions: Optional[bool],
+    holders_only: Optional[bool],
+) -> dict[str, str | int]:
+    params: dict[str, str | int] = {
+        "parent_entity_type": parent_entity_type,
+        "parent_entity_id": parent_entity_id,
+    }
+    params.update(_page_params(limit, offset, order, ascending))
+    if get_positions is not None:
+        params["get_positions"] = str(get_positions).lower()
+    if holders_only is not None:
+        params["holders_only"] = str(holders_only).lower()
+    return params
+
+
+def _flag_params(**flags: Optional[bool]) -> dict[str, str]:
+    return {
+        key: str(value).lower() for key, value in flags.items() if value is not None
+    }
+
+
+def _truthy_params(**flags: Optional[bool]) -> dict[str, bool]:
+    return {key: value for key, value in flags.items() if value}
+
+
+def _related_tags_params(
+    omit_empty: Optional[bool], status: Optional[str]
+) -> dict[str, str]:
+    params = _flag_params(omit_empty=omit_empty)
+    if status:
+        params["status"] = status
+    return params
+
+
+def _parse_page[M: BaseModel](
+    model: type[M], data: list[Any], fields: Optional[Iterable[str]]
+) -> list[M] | list[BaseModel]:
+    if fields:
+        projected = project_model(model, fields)
+        return [projected(**item) for item in data]
+    return [model(**item) for item in data]
+
+
+def _page_fields(fields: Optional[Iterable[str]]) -> Optional[frozenset[str]]:
+    # id is needed to de-duplicate pages
+    return frozenset(fields) | {"id"} if fields else None
+
+
+_GROK_EVENT_SUMMARY_URL = "https://polymarket.com/api/grok/event-summary"
+_GROK_ELECTION_EXPLANATION_URL = (
+    "https://polymarket.com/api/grok/election-market-explanation"
+)
+_GROK_SOURCES_PREFIX = "__SOURCES__:"
+
+
+def _grok_summary_payload() -> dict[str, Any]:
+    return {
+        "id": generate_random_id(),
+        "messages": [{"role": "user", "content": "", "parts": []}],
+    }
+
+
+def _grok_explanation_payload(
+    candidate_name: str, election_title: str
+) -> dict[str, Any]:
+    text = f"Provide candidate information for {candidate_name} in the {election_title} on Polymarket."
+    return {
+        "id": generate_random_id(),
+        "messages": [
+            {
+                "role": "user",
+                "content": text,
+                "parts": [{"type": "text", "text": text}],
+            },
+        ],
+    }
+
+
+def _add_grok_sources(
+    line: str, citations: list[dict[str, Any]], seen_urls: set[str]
+) -> bool:
+    """Collect the new sources of a __SOURCES__ line, False for a text line."""
+    if not line.startswith(_GROK_SOURCES_PREFIX):
+        return False
+    try:
+        sources_obj = json.loads(line[len(_GROK_SOURCES_PREFIX) :])
+    except json.JSONDecodeError:
+        return True
+    for source in sources_obj.get("sources", []):
+        url = source.get("url")
+        if url and url not in seen_urls:
+            citations.append(source)
+            seen_urls.add(url)
+    return True
+
+
+def _format_grok_explanation(text: str) -> str:
+    lines = []
+    parts = [p.strip() for p in text.split("**") if p.strip()]
+    for i, part in enumerate(parts):
+        if ":" in part and i != 0:
+            lines.append("")
+        lines.append(part)
+    return "\n".join(lines)
+
+
 class PolymarketGammaClient:
     def __init__(self, base_url: str = "https://gamma-api.polymarket.com"):
         self.base_url = base_url
@@ -63,35 +437,22 @@ class PolymarketGammaClient:
         exclude_tag_ids: Optional[list[int]] = None,
         optimized: Optional[bool] = None,
     ) -> SearchResult:
-        params: dict[str, str | list[str] | int | bool] = {
-            "q": query,
-        }
-        if cache is not None:
-            params["cache"] = str(cache).lower()
-        if status:
-            params["events_status"] = status
-        if limit_per_type:
-            params["limit_per_type"] = limit_per_type
-        if page:
-            params["page"] = page
-        if tags:
-            params["events_tag"] = json.dumps([json.dumps(item) for item in tags])
-        if keep_closed_markets is not None:
-            params["keep_closed_markets"] = keep_closed_markets
-        if sort:
-            params["sort"] = sort
-        if ascending is not None:
-            params["ascending"] = str(ascending).lower()
-        if search_tags is not None:
-            params["search_tags"] = str(search_tags).lower()
-        if search_profiles is not None:
-            params["search_profiles"] = str(search_profiles).lower()
-        if recurrence:
-            params["recurrence"] = recurrence
-        if exclude_tag_ids:
-            params["exclude_tag_id"] = [str(i) for i in exclude_tag_ids]
-        if optimized is not None:
-            params["optimized"] = str(optimized).lower()
+        params = _search_params(
+            query=query,
+            cache=cache,
+            status=status,
+            limit_per_type=limit_per_type,
+            page=page,
+            tags=tags,
+            keep_closed_markets=keep_closed_markets,
+            sort=sort,
+            ascending=ascending,
+            search_tags=search_tags,
+            search_profiles=search_profiles,
+            recurrence=recurrence,
+            exclude_tag_ids=exclude_tag_ids,
+            optimized=optimized,
+        )
         response = self.client.get(self._build_url("/public-search"), params=params)
         response.raise_for_status()
         return SearchResult(**response.json())
@@ -102,7 +463,947 @@ class PolymarketGammaClient:
         response.raise_for_status()
         return GammaMarket(**response.json())
 
-    def get_markets(
+    @overload
+    def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        fields: None = None,
+    ) -> list[GammaMarket]: ...
+
+    @overload
+    def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        *,
+        fields: Iterable[str],
+    ) -> list[BaseModel]: ...
+
+    @overload
+    def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[GammaMarket] | list[BaseModel]: ...
+
+    def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[GammaMarket] | list[BaseModel]:
+        """Markets page, with fields only those are validated into slim models (see utilities.projection)."""
+        params = _markets_params(
+            limit=limit,
+            offset=offset,
+            order=order,
+            ascending=ascending,
+            archived=archived,
+            active=active,
+            closed=closed,
+            slugs=slugs,
+            market_ids=market_ids,
+            token_ids=token_ids,
+            condition_ids=condition_ids,
+            tag_id=tag_id,
+            related_tags=related_tags,
+            liquidity_num_min=liquidity_num_min,
+            liquidity_num_max=liquidity_num_max,
+            volume_num_min=volume_num_min,
+            volume_num_max=volume_num_max,
+            start_date_min=start_date_min,
+            start_date_max=start_date_max,
+            end_date_min=end_date_min,
+            end_date_max=end_date_max,
+        )
+        response = self.client.get(self._build_url("/markets"), params=params)
+        response.raise_for_status()
+        return _parse_page(GammaMarket, response.json(), fields)
+
+    def get_market_by_id(
+        self, market_id: str, include_tag: Optional[bool] = None
+    ) -> GammaMarket:
+        params = _truthy_params(include_tag=include_tag)
+        response = self.client.get(
+            self._build_url(f"/markets/{market_id}"), params=params
+        )
+        response.raise_for_status()
+        return GammaMarket(**response.json())
+
+    def get_market_tags(self, market_id: str) -> list[Tag]:
+        response = self.client.get(self._build_url(f"/markets/{market_id}/tags"))
+        response.raise_for_status()
+        return [Tag(**tag) for tag in response.json()]
+
+    def get_market_by_slug(
+        self, slug: str, include_tag: Optional[bool] = None
+    ) -> GammaMarket:
+        params = _truthy_params(include_tag=include_tag)
+        response = self.client.get(
+            self._build_url(f"/markets/slug/{slug}"), params=params
+        )
+        response.raise_for_status()
+        return GammaMarket(**response.json())
+
+    @overload
+    def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: None = None,
+    ) -> list[Event]: ...
+
+    @overload
+    def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        *,
+        fields: Iterable[str],
+    ) -> list[BaseModel]: ...
+
+    @overload
+    def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[Event] | list[BaseModel]: ...
+
+    def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[Event] | list[BaseModel]:
+        """Events page, with fields only those are validated into slim models (see utilities.projection)."""
+        params = _events_params(
+            limit=limit,
+            offset=offset,
+            order=order,
+            ascending=ascending,
+            event_ids=event_ids,
+            slugs=slugs,
+            archived=archived,
+            active=active,
+            closed=closed,
+            liquidity_min=liquidity_min,
+            liquidity_max=liquidity_max,
+            volume_min=volume_min,
+            volume_max=volume_max,
+            start_date_min=start_date_min,
+            start_date_max=start_date_max,
+            end_date_min=end_date_min,
+            end_date_max=end_date_max,
+            tag=tag,
+            tag_id=tag_id,
+            tag_slug=tag_slug,
+            related_tags=related_tags,
+        )
+        response = self.client.get(self._build_url("/events"), params=params)
+        response.raise_for_status()
+        return _parse_page(Event, response.json(), fields)
+
+    @overload
+    def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: None = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Event]: ...
+
+    @overload
+    def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        *,
+        fields: Iterable[str],
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[BaseModel]: ...
+
+    @overload
+    def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Event] | list[BaseModel]: ...
+
+    def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Event] | list[BaseModel]:
+        """All pages of get_events, up to max_concurrency pages are fetched at once."""
+        selected = _page_fields(fields)
+
+        def fetch_page(offset: int) -> list[Any]:
+            return self.get_events(
+                offset=offset,
+                order=order,
+                ascending=ascending,
+                event_ids=event_ids,
+                slugs=slugs,
+                archived=archived,
+                active=active,
+                closed=closed,
+                liquidity_min=liquidity_min,
+                liquidity_max=liquidity_max,
+                volume_min=volume_min,
+                volume_max=volume_max,
+                start_date_min=start_date_min,
+                start_date_max=start_date_max,
+                end_date_min=end_date_min,
+                end_date_max=end_date_max,
+                tag=tag,
+                tag_id=tag_id,
+                tag_slug=tag_slug,
+                related_tags=related_tags,
+                fields=selected,
+            )
+
+        return paginate_offsets(
+            fetch_page,
+            page_size=500,
+            max_concurrency=max_concurrency,
+            key=lambda event: event.id,
+        )
+
+    def get_event_by_id(
+        self,
+        event_id: int,
+        include_chat: Optional[bool] = None,
+        include_template: Optional[bool] = None,
+    ) -> Event:
+        params = _truthy_params(
+            include_chat=include_chat, include_template=include_template
+        )
+        response = self.client.get(
+            self._build_url(f"/events/{event_id}"), params=params
+        )
+        response.raise_for_status()
+        return Event(**response.json())
+
+    def get_event_by_slug(
+        self,
+        slug: str,
+        include_chat: Optional[bool] = None,
+        include_template: Optional[bool] = None,
+    ) -> Event:
+        params = _truthy_params(
+            include_chat=include_chat, include_template=include_template
+        )
+        response = self.client.get(
+            self._build_url(f"/events/slug/{slug}"), params=params
+        )
+        response.raise_for_status()
+        return Event(**response.json())
+
+    def get_event_tags(self, event_id: int) -> list[Tag]:
+        response = self.client.get(self._build_url(f"/events/{event_id}/tags"))
+        response.raise_for_status()
+        return [Tag(**tag) for tag in response.json()]
+
+    def get_teams(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[
+            Literal[
+                "id",
+                "name",
+                "league",
+                "record",
+                "logo",
+                "abbreviation",
+                "alias",
+                "createdAt",
+                "updatedAt",
+            ]
+        ] = None,
+        ascending: bool = True,
+        league: Optional[str] = None,
+        name: Optional[str] = None,
+        abbreviation: Optional[str] = None,
+    ) -> list[Team]:
+        params = _teams_params(
+            limit, offset, order, ascending, league, name, abbreviation
+        )
+        response = self.client.get(self._build_url("/teams"), params=params)
+        response.raise_for_status()
+        return [Team(**team) for team in response.json()]
+
+    def get_all_teams(
+        self,
+        order: Optional[
+            Literal[
+                "id",
+                "name",
+                "league",
+                "record",
+                "logo",
+                "abbreviation",
+                "alias",
+                "createdAt",
+                "updatedAt",
+            ]
+        ] = None,
+        ascending: bool = True,
+        league: Optional[str] = None,
+        name: Optional[str] = None,
+        abbreviation: Optional[str] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Team]:
+        """All pages of get_teams, up to max_concurrency pages are fetched at once."""
+        return paginate_offsets(
+            lambda offset: self.get_teams(
+                offset=offset,
+                order=order,
+                ascending=ascending,
+                league=league,
+                name=name,
+                abbreviation=abbreviation,
+            ),
+            page_size=500,
+            max_concurrency=max_concurrency,
+            key=lambda team: team.id,
+        )
+
+    def get_sports_metadata(
+        self,
+    ) -> list[Sport]:
+        response = self.client.get(self._build_url("/sports"))
+        response.raise_for_status()
+        return [Sport(**sport) for sport in response.json()]
+
+    def get_tags(
+        self,
+        limit: int = 300,
+        offset: int = 0,
+        order: Optional[
+            Literal[
+                "id",
+                "label",
+                "slug",
+                "forceShow",
+                "forceHide",
+                "isCarousel",
+                "createdAt",
+                "updatedAt",
+                "createdBy",
+                "updatedBy",
+            ]
+        ] = None,
+        ascending: bool = True,
+        include_templates: Optional[bool] = None,
+        is_carousel: Optional[bool] = None,
+    ) -> list[Tag]:
+        params = _tags_params(
+            limit, offset, order, ascending, include_templates, is_carousel
+        )
+        response = self.client.get(self._build_url("/tags"), params=params)
+        response.raise_for_status()
+        return [Tag(**tag) for tag in response.json()]
+
+    def get_all_tags(
+        self,
+        order: Optional[
+            Literal[
+                "id",
+                "label",
+                "slug",
+                "forceShow",
+                "forceHide",
+                "isCarousel",
+                "createdAt",
+                "updatedAt",
+                "createdBy",
+                "updatedBy",
+            ]
+        ] = None,
+        ascending: bool = True,
+        include_templates: Optional[bool] = None,
+        is_carousel: Optional[bool] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Tag]:
+        """All pages of get_tags, up to max_concurrency pages are fetched at once."""
+        return paginate_offsets(
+            lambda offset: self.get_tags(
+                offset=offset,
+                order=order,
+                ascending=ascending,
+                include_templates=include_templates,
+                is_carousel=is_carousel,
+            ),
+            page_size=300,
+            max_concurrency=max_concurrency,
+            key=lambda tag: tag.id,
+        )
+
+    def get_tag(self, tag_id: str, include_template: Optional[bool] = None) -> Tag:
+        params = _flag_params(include_template=include_template)
+        response = self.client.get(self._build_url(f"/tags/{tag_id}"), params=params)
+        response.raise_for_status()
+        return Tag(**response.json())
+
+    def get_related_tag_ids_by_tag_id(
+        self,
+        tag_id: int,
+        omit_empty: Optional[bool] = None,
+        status: Optional[Literal["active", "closed", "all"]] = None,
+    ) -> list[TagRelation]:
+        params = _related_tags_params(omit_empty, status)
+        response = self.client.get(
+            self._build_url(f"/tags/{tag_id}/related-tags"), params=params
+        )
+        response.raise_for_status()
+        return [TagRelation(**tag) for tag in response.json()]
+
+    def get_related_tag_ids_by_slug(
+        self,
+        slug: str,
+        omit_empty: Optional[bool] = None,
+        status: Optional[Literal["active", "closed", "all"]] = None,
+    ) -> list[TagRelation]:
+        params = _related_tags_params(omit_empty, status)
+        response = self.client.get(
+            self._build_url(f"/tags/slug/{slug}/related-tags"), params=params
+        )
+        response.raise_for_status()
+        return [TagRelation(**tag) for tag in response.json()]
+
+    def get_related_tags_by_tag_id(
+        self,
+        tag_id: int,
+        omit_empty: Optional[bool] = None,
+        status: Optional[Literal["active", "closed", "all"]] = None,
+    ) -> list[Tag]:
+        params = _related_tags_params(omit_empty, status)
+        response = self.client.get(
+            self._build_url(f"/tags/{tag_id}/related-tags/tags"), params=params
+        )
+        response.raise_for_status()
+        return [Tag(**tag) for tag in response.json()]
+
+    def get_related_tags_by_slug(
+        self,
+        slug: str,
+        omit_empty: Optional[bool] = None,
+        status: Optional[Literal["active", "closed", "all"]] = None,
+    ) -> list[Tag]:
+        params = _related_tags_params(omit_empty, status)
+        response = self.client.get(
+            self._build_url(f"/tags/slug/{slug}/related-tags/tags"), params=params
+        )
+        response.raise_for_status()
+        return [Tag(**tag) for tag in response.json()]
+
+    def get_series(
+        self,
+        limit: int = 300,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        slug: Optional[str] = None,
+        closed: Optional[bool] = None,
+        include_chat: Optional[bool] = None,
+        recurrence: Optional[
+            Literal[
+                "hourly", "daily", "weekly", "monthly", "annual"
+            ]  # results also contain "15m" but the server returns a 422 Unprocessable Content
+        ] = None,
+    ) -> list[Series]:
+        params = _series_params(
+            limit,
+            offset,
+            order,
+            ascending,
+            slug,
+            closed,
+            include_chat,
+            recurrence,
+        )
+        response = self.client.get(self._build_url("/series"), params=params)
+        response.raise_for_status()
+        return [Series(**series) for series in response.json()]
+
+    def get_all_series(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        slug: Optional[str] = None,
+        closed: Optional[bool] = None,
+        include_chat: Optional[bool] = None,
+        recurrence: Optional[
+            Literal["hourly", "daily", "weekly", "monthly", "annual"]
+        ] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Series]:
+        """All pages of get_series, up to max_concurrency pages are fetched at once."""
+        return paginate_offsets(
+            lambda offset: self.get_series(
+                offset=offset,
+                order=order,
+                ascending=ascending,
+                slug=slug,
+                closed=closed,
+                include_chat=include_chat,
+                recurrence=recurrence,
+            ),
+            page_size=300,
+            max_concurrency=max_concurrency,
+            key=lambda series: series.id,
+        )
+
+    def get_series_by_id(self, series_id: str) -> Series:
+        response = self.client.get(self._build_url(f"/series/{series_id}"))
+        response.raise_for_status()
+        return Series(**response.json())
+
+    def get_comments(
+        self,
+        parent_entity_type: Literal["Event", "Series", "market"],
+        parent_entity_id: int,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        get_positions: Optional[bool] = None,
+        holders_only: Optional[bool] = None,
+    ) -> list[Comment]:
+        """Warning, the server doesn't give back the right amount of comments you asked for."""
+        params = _comments_params(
+            parent_entity_type,
+            parent_entity_id,
+            limit,
+            offset,
+            order,
+            ascending,
+            get_positions,
+            holders_only,
+        )
+        response = self.client.get(self._build_url("/comments"), params=params)
+        response.raise_for_status()
+        return [Comment(**comment) for comment in response.json()]
+
+    def get_comments_by_id(
+        self, comment_id: str, get_positions: Optional[bool] = None
+    ) -> list[Comment]:
+        """Returns all comments that belong to the comment's thread."""
+        params = _flag_params(get_positions=get_positions)
+        response = self.client.get(
+            self._build_url(f"/comments/{comment_id}"), params=params
+        )
+        response.raise_for_status()
+        return [Comment(**comment) for comment in response.json()]
+
+    def get_comments_by_user_address(
+        self,
+        user_address: EthAddress,  # warning, this is the base address, not the proxy address
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+    ) -> list[Comment]:
+        params = _page_params(limit, offset, order, ascending)
+        response = self.client.get(
+            self._build_url(f"/comments/user_address/{user_address}"), params=params
+        )
+        response.raise_for_status()
+        return [Comment(**comment) for comment in response.json()]
+
+    def grok_event_summary(self, event_slug: str) -> None:
+        with self.client.stream(
+            method="POST",
+            url=_GROK_EVENT_SUMMARY_URL,
+            params={"prompt": event_slug},
+            json=_grok_summary_payload(),
+        ) as stream:
+            citations: list[dict[str, Any]] = []
+            seen_urls: set[str] = set()
+
+            for line in stream.iter_lines():
+                if not _add_grok_sources(line, citations, seen_urls):
+                    print(line, end="")  # or handle message text as needed
+
+        # After reading streamed lines:
+        if citations:
+            print("\n\nSources:")
+            for source in citations:
+                print(f"- {source.get('url', 'Unknown URL')}")
+
+    def grok_election_market_explanation(
+        self, candidate_name: str, election_title: str
+    ) -> None:
+        response = self.client.post(
+            url=_GROK_ELECTION_EXPLANATION_URL,
+            json=_grok_explanation_payload(candidate_name, election_title),
+        )
+        response.raise_for_status()
+        print(_format_grok_explanation(response.text))
+
+    def __enter__(self) -> object:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.client.close()
+
+
+class AsyncPolymarketGammaClient:
+    """
+    Asynchronous counterpart of PolymarketGammaClient.
+
+    Same methods and models, every call is awaitable and goes through a single HTTP/2
+    httpx.AsyncClient, so many lookups can run concurrently on one event loop.
+    """
+
+    def __init__(self, base_url: str = "https://gamma-api.polymarket.com"):
+        self.base_url = base_url
+        self.client = httpx.AsyncClient(http2=True, timeout=30.0)
+
+    def _build_url(self, endpoint: str) -> str:
+        return urljoin(self.base_url, endpoint)
+
+    async def search(
+        self,
+        query: str,
+        cache: Optional[bool] = None,
+        status: Optional[Literal["active", "resolved"]] = None,
+        limit_per_type: Optional[int] = None,  # max is 50
+        page: Optional[int] = None,
+        tags: Optional[list[str]] = None,
+        keep_closed_markets: Optional[bool] = None,
+        sort: Optional[
+            Literal[
+                "volume",
+                "volume_24hr",
+                "liquidity",
+                "start_date",
+                "end_date",
+                "competitive",
+            ]
+        ] = None,
+        ascending: Optional[bool] = None,
+        search_tags: Optional[bool] = None,
+        search_profiles: Optional[bool] = None,
+        recurrence: Optional[
+            Literal["hourly", "daily", "weekly", "monthly", "annual"]
+        ] = None,
+        exclude_tag_ids: Optional[list[int]] = None,
+        optimized: Optional[bool] = None,
+    ) -> SearchResult:
+        params = _search_params(
+            query=query,
+            cache=cache,
+            status=status,
+            limit_per_type=limit_per_type,
+            page=page,
+            tags=tags,
+            keep_closed_markets=keep_closed_markets,
+            sort=sort,
+            ascending=ascending,
+            search_tags=search_tags,
+            search_profiles=search_profiles,
+            recurrence=recurrence,
+            exclude_tag_ids=exclude_tag_ids,
+            optimized=optimized,
+        )
+        response = await self.client.get(
+            self._build_url("/public-search"), params=params
+        )
+        response.raise_for_status()
+        return SearchResult(**response.json())
+
+    async def get_market(self, market_id: str) -> GammaMarket:
+        """Get a GammaMarket by market_id."""
+        response = await self.client.get(self._build_url(f"/markets/{market_id}"))
+        response.raise_for_status()
+        return GammaMarket(**response.json())
+
+    @overload
+    async def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        fields: None = None,
+    ) -> list[GammaMarket]: ...
+
+    @overload
+    async def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        *,
+        fields: Iterable[str],
+    ) -> list[BaseModel]: ...
+
+    @overload
+    async def get_markets(
         self,
         limit: int | None = None,
         offset: int | None = None,
@@ -125,84 +1426,89 @@ class PolymarketGammaClient:
         start_date_max: datetime | None = None,
         end_date_min: datetime | None = None,
         end_date_max: datetime | None = None,
-    ) -> list[GammaMarket]:
-        params: dict[str, float | int | list[int] | str | list[str] | bool] = {}
-        if limit:
-            params["limit"] = limit
-        if offset:
-            params["offset"] = offset
-        if order:
-            params["order"] = order
-            params["ascending"] = ascending
-        if slugs:
-            params["slug"] = slugs
-        if archived is not None:
-            params["archived"] = archived
-        if active is not None:
-            params["active"] = active
-        if closed is not None:
-            params["closed"] = closed
-        if market_ids:
-            params["id"] = market_ids
-        if token_ids:
-            params["clob_token_ids"] = token_ids
-        if condition_ids:
-            params["condition_ids"] = condition_ids
-        if liquidity_num_min:
-            params["liquidity_num_min"] = liquidity_num_min
-        if liquidity_num_max:
-            params["liquidity_num_max"] = liquidity_num_max
-        if volume_num_min:
-            params["volume_num_min"] = volume_num_min
-        if volume_num_max:
-            params["volume_num_max"] = volume_num_max
-        if start_date_min:
-            params["start_date_min"] = start_date_min.isoformat()
-        if start_date_max:
-            params["start_date_max"] = start_date_max.isoformat()
-        if end_date_min:
-            params["end_date_min"] = end_date_min.isoformat()
-        if end_date_max:
-            params["end_date_max"] = end_date_max.isoformat()
-        if tag_id:
-            params["tag_id"] = tag_id
-            if related_tags:
-                params["related_tags"] = related_tags
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[GammaMarket] | list[BaseModel]: ...
 
-        response = self.client.get(self._build_url("/markets"), params=params)
+    async def get_markets(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order: str | None = None,
+        ascending: bool = True,
+        archived: bool | None = None,
+        active: bool | None = None,
+        closed: bool | None = None,
+        slugs: list[str] | None = None,
+        market_ids: list[int] | None = None,
+        token_ids: list[str] | None = None,
+        condition_ids: list[str] | None = None,
+        tag_id: int | None = None,
+        related_tags: bool | None = False,
+        liquidity_num_min: float | None = None,
+        liquidity_num_max: float | None = None,
+        volume_num_min: float | None = None,
+        volume_num_max: float | None = None,
+        start_date_min: datetime | None = None,
+        start_date_max: datetime | None = None,
+        end_date_min: datetime | None = None,
+        end_date_max: datetime | None = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[GammaMarket] | list[BaseModel]:
+        """Markets page, with fields only those are validated into slim models (see utilities.projection)."""
+        params = _markets_params(
+            limit=limit,
+            offset=offset,
+            order=order,
+            ascending=ascending,
+            archived=archived,
+            active=active,
+            closed=closed,
+            slugs=slugs,
+            market_ids=market_ids,
+            token_ids=token_ids,
+            condition_ids=condition_ids,
+            tag_id=tag_id,
+            related_tags=related_tags,
+            liquidity_num_min=liquidity_num_min,
+            liquidity_num_max=liquidity_num_max,
+            volume_num_min=volume_num_min,
+            volume_num_max=volume_num_max,
+            start_date_min=start_date_min,
+            start_date_max=start_date_max,
+            end_date_min=end_date_min,
+            end_date_max=end_date_max,
+        )
+        response = await self.client.get(self._build_url("/markets"), params=params)
         response.raise_for_status()
-        return [GammaMarket(**market) for market in response.json()]
+        return _parse_page(GammaMarket, response.json(), fields)
 
-    def get_market_by_id(
+    async def get_market_by_id(
         self, market_id: str, include_tag: Optional[bool] = None
     ) -> GammaMarket:
-        params = {}
-        if include_tag:
-            params["include_tag"] = include_tag
-        response = self.client.get(
+        params = _truthy_params(include_tag=include_tag)
+        response = await self.client.get(
             self._build_url(f"/markets/{market_id}"), params=params
         )
         response.raise_for_status()
         return GammaMarket(**response.json())
 
-    def get_market_tags(self, market_id: str) -> list[Tag]:
-        response = self.client.get(self._build_url(f"/markets/{market_id}/tags"))
+    async def get_market_tags(self, market_id: str) -> list[Tag]:
+        response = await self.client.get(self._build_url(f"/markets/{market_id}/tags"))
         response.raise_for_status()
         return [Tag(**tag) for tag in response.json()]
 
-    def get_market_by_slug(
+    async def get_market_by_slug(
         self, slug: str, include_tag: Optional[bool] = None
     ) -> GammaMarket:
-        params = {}
-        if include_tag:
-            params["include_tag"] = include_tag
-        response = self.client.get(
+        params = _truthy_params(include_tag=include_tag)
+        response = await self.client.get(
             self._build_url(f"/markets/slug/{slug}"), params=params
         )
         response.raise_for_status()
         return GammaMarket(**response.json())
 
-    def get_events(
+    @overload
+    async def get_events(
         self,
         limit: int = 500,
         offset: int = 0,
@@ -225,54 +1531,197 @@ class PolymarketGammaClient:
         tag_id: Optional[int] = None,
         tag_slug: Optional[str] = None,
         related_tags: bool = False,
-    ) -> list[Event]:
-        params: dict[str, int | str | list[str] | float] = {
-            "limit": limit,
-            "offset": offset,
-        }
-        if order:
-            params["order"] = order
-            params["ascending"] = ascending
-        if event_ids:
-            params["id"] = event_ids
-        if slugs:
-            params["slug"] = slugs
-        if archived is not None:
-            params["archived"] = archived
-        if active is not None:
-            params["active"] = active
-        if closed is not None:
-            params["closed"] = closed
-        if liquidity_min:
-            params["liquidity_min"] = liquidity_min
-        if liquidity_max:
-            params["liquidity_max"] = liquidity_max
-        if volume_min:
-            params["volume_min"] = volume_min
-        if volume_max:
-            params["volume_max"] = volume_max
-        if start_date_min:
-            params["start_date_min"] = start_date_min.isoformat()
-        if start_date_max:
-            params["start_date_max"] = start_date_max.isoformat()
-        if end_date_min:
-            params["end_date_min"] = end_date_min.isoformat()
-        if end_date_max:
-            params["end_date_max"] = end_date_max.isoformat()
-        if tag:
-            params["tag"] = tag
-        elif tag_id:
-            params["tag_id"] = tag_id
-            if related_tags:
-                params["related_tags"] = related_tags
-        elif tag_slug:
-            params["tag_slug"] = tag_slug
+        fields: None = None,
+    ) -> list[Event]: ...
 
-        response = self.client.get(self._build_url("/events"), params=params)
+    @overload
+    async def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        *,
+        fields: Iterable[str],
+    ) -> list[BaseModel]: ...
+
+    @overload
+    async def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[Event] | list[BaseModel]: ...
+
+    async def get_events(
+        self,
+        limit: int = 500,
+        offset: int = 0,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list[Event] | list[BaseModel]:
+        """Events page, with fields only those are validated into slim models (see utilities.projection)."""
+        params = _events_params(
+            limit=limit,
+            offset=offset,
+            order=order,
+            ascending=ascending,
+            event_ids=event_ids,
+            slugs=slugs,
+            archived=archived,
+            active=active,
+            closed=closed,
+            liquidity_min=liquidity_min,
+            liquidity_max=liquidity_max,
+            volume_min=volume_min,
+            volume_max=volume_max,
+            start_date_min=start_date_min,
+            start_date_max=start_date_max,
+            end_date_min=end_date_min,
+            end_date_max=end_date_max,
+            tag=tag,
+            tag_id=tag_id,
+            tag_slug=tag_slug,
+            related_tags=related_tags,
+        )
+        response = await self.client.get(self._build_url("/events"), params=params)
         response.raise_for_status()
-        return [Event(**event) for event in response.json()]
+        return _parse_page(Event, response.json(), fields)
 
-    def get_all_events(
+    @overload
+    async def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: None = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Event]: ...
+
+    @overload
+    async def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        *,
+        fields: Iterable[str],
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[BaseModel]: ...
+
+    @overload
+    async def get_all_events(
+        self,
+        order: Optional[str] = None,
+        ascending: bool = True,
+        event_ids: Optional[Union[str, list[str]]] = None,
+        slugs: Optional[list[str]] = None,
+        archived: Optional[bool] = None,
+        active: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        liquidity_min: Optional[float] = None,
+        liquidity_max: Optional[float] = None,
+        volume_min: Optional[float] = None,
+        volume_max: Optional[float] = None,
+        start_date_min: Optional[datetime] = None,
+        start_date_max: Optional[datetime] = None,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        tag_id: Optional[int] = None,
+        tag_slug: Optional[str] = None,
+        related_tags: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Event] | list[BaseModel]: ...
+
+    async def get_all_events(
         self,
         order: Optional[str] = None,
         ascending: bool = True,
@@ -293,12 +1742,14 @@ class PolymarketGammaClient:
         tag_id: Optional[int] = None,
         tag_slug: Optional[str] = None,
         related_tags: bool = False,
-    ) -> list[Event]:
-        offset = 0
-        events = []
+        fields: Optional[Iterable[str]] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Event] | list[BaseModel]:
+        """All pages of get_events, up to max_concurrency pages are fetched at once."""
+        selected = _page_fields(fields)
 
-        while True:
-            part = self.get_events(
+        async def fetch_page(offset: int) -> list[Any]:
+            return await self.get_events(
                 offset=offset,
                 order=order,
                 ascending=ascending,
@@ -319,56 +1770,52 @@ class PolymarketGammaClient:
                 tag_id=tag_id,
                 tag_slug=tag_slug,
                 related_tags=related_tags,
+                fields=selected,
             )
-            events.extend(part)
-
-            if len(part) < 500:
-                break
-
-            offset += 500
 
-        return events
+        return await apaginate_offsets(
+            fetch_page,
+            page_size=500,
+            max_concurrency=max_concurrency,
+            key=lambda event: event.id,
+        )
 
-    def get_event_by_id(
+    async def get_event_by_id(
         self,
         event_id: int,
         include_chat: Optional[bool] = None,
         include_template: Optional[bool] = None,
     ) -> Event:
-        params = {}
-        if include_chat:
-            params["include_chat"] = include_chat
-        if include_template:
-            params["include_template"] = include_template
-        response = self.client.get(
+        params = _truthy_params(
+            include_chat=include_chat, include_template=include_template
+        )
+        response = await self.client.get(
             self._build_url(f"/events/{event_id}"), params=params
         )
         response.raise_for_status()
         return Event(**response.json())
 
-    def get_event_by_slug(
+    async def get_event_by_slug(
         self,
         slug: str,
         include_chat: Optional[bool] = None,
         include_template: Optional[bool] = None,
     ) -> Event:
-        params = {}
-        if include_chat:
-            params["include_chat"] = include_chat
-        if include_template:
-            params["include_template"] = include_template
-        response = self.client.get(
+        params = _truthy_params(
+            include_chat=include_chat, include_template=include_template
+        )
+        response = await self.client.get(
             self._build_url(f"/events/slug/{slug}"), params=params
         )
         response.raise_for_status()
         return Event(**response.json())
 
-    def get_event_tags(self, event_id: int) -> list[Tag]:
-        response = self.client.get(self._build_url(f"/events/{event_id}/tags"))
+    async def get_event_tags(self, event_id: int) -> list[Tag]:
+        response = await self.client.get(self._build_url(f"/events/{event_id}/tags"))
         response.raise_for_status()
         return [Tag(**tag) for tag in response.json()]
 
-    def get_teams(
+    async def get_teams(
         self,
         limit: int = 500,
         offset: int = 0,
@@ -390,24 +1837,14 @@ class PolymarketGammaClient:
         name: Optional[str] = None,
         abbreviation: Optional[str] = None,
     ) -> list[Team]:
-        params: dict[str, int | str] = {
-            "limit": limit,
-            "offset": offset,
-        }
-        if order:
-            params["order"] = order
-            params["ascending"] = str(ascending).lower()
-        if league:
-            params["league"] = league.lower()
-        if name:
-            params["name"] = name
-        if abbreviation:
-            params["abbreviation"] = abbreviation.lower()
-        response = self.client.get(self._build_url("/teams"), params=params)
+        params = _teams_params(
+            limit, offset, order, ascending, league, name, abbreviation
+        )
+        response = await self.client.get(self._build_url("/teams"), params=params)
         response.raise_for_status()
         return [Team(**team) for team in response.json()]
 
-    def get_all_teams(
+    async def get_all_teams(
         self,
         order: Optional[
             Literal[
@@ -426,36 +1863,31 @@ class PolymarketGammaClient:
         league: Optional[str] = None,
         name: Optional[str] = None,
         abbreviation: Optional[str] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
     ) -> list[Team]:
-        offset = 0
-        teams = []
-
-        while True:
-            part = self.get_teams(
+        """All pages of get_teams, up to max_concurrency pages are fetched at once."""
+        return await apaginate_offsets(
+            lambda offset: self.get_teams(
                 offset=offset,
                 order=order,
                 ascending=ascending,
                 league=league,
                 name=name,
                 abbreviation=abbreviation,
-            )
-            teams.extend(part)
-
-            if len(part) < 500:
-                break
-
-            offset += 500
-
-        return teams
+            ),
+            page_size=500,
+            max_concurrency=max_concurrency,
+            key=lambda team: team.id,
+        )
 
-    def get_sports_metadata(
+    async def get_sports_metadata(
         self,
     ) -> list[Sport]:
-        response = self.client.get(self._build_url("/sports"))
+        response = await self.client.get(self._build_url("/sports"))
         response.raise_for_status()
         return [Sport(**sport) for sport in response.json()]
 
-    def get_tags(
+    async def get_tags(
         self,
         limit: int = 300,
         offset: int = 0,
@@ -477,22 +1909,14 @@ class PolymarketGammaClient:
         include_templates: Optional[bool] = None,
         is_carousel: Optional[bool] = None,
     ) -> list[Tag]:
-        params: dict[str, int | str] = {
-            "limit": limit,
-            "offset": offset,
-        }
-        if order:
-            params["order"] = order
-            params["ascending"] = str(ascending).lower()
-        if include_templates is not None:
-            params["include_templates"] = str(include_templates).lower()
-        if is_carousel is not None:
-            params["is_carousel"] = str(is_carousel).lower()
-        response = self.client.get(self._build_url("/tags"), params=params)
+        params = _tags_params(
+            limit, offset, order, ascending, include_templates, is_carousel
+        )
+        response = await self.client.get(self._build_url("/tags"), params=params)
         response.raise_for_status()
         return [Tag(**tag) for tag in response.json()]
 
-    def get_all_tags(
+    async def get_all_tags(
         self,
         order: Optional[
             Literal[
@@ -511,104 +1935,85 @@ class PolymarketGammaClient:
         ascending: bool = True,
         include_templates: Optional[bool] = None,
         is_carousel: Optional[bool] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
     ) -> list[Tag]:
-        offset = 0
-        tags = []
-
-        while True:
-            part = self.get_tags(
+        """All pages of get_tags, up to max_concurrency pages are fetched at once."""
+        return await apaginate_offsets(
+            lambda offset: self.get_tags(
                 offset=offset,
                 order=order,
                 ascending=ascending,
                 include_templates=include_templates,
                 is_carousel=is_carousel,
-            )
-            tags.extend(part)
-
-            if len(part) < 300:
-                break
-
-            offset += 300
-
-        return tags
+            ),
+            page_size=300,
+            max_concurrency=max_concurrency,
+            key=lambda tag: tag.id,
+        )
 
-    def get_tag(self, tag_id: str, include_template: Optional[bool] = None) -> Tag:
-        params = {}
-        if include_template is not None:
-            params = {"include_template": str(include_template).lower()}
-        response = self.client.get(self._build_url(f"/tags/{tag_id}"), params=params)
+    async def get_tag(
+        self, tag_id: str, include_template: Optional[bool] = None
+    ) -> Tag:
+        params = _flag_params(include_template=include_template)
+        response = await self.client.get(
+            self._build_url(f"/tags/{tag_id}"), params=params
+        )
         response.raise_for_status()
         return Tag(**response.json())
 
-    def get_related_tag_ids_by_tag_id(
+    async def get_related_tag_ids_by_tag_id(
         self,
         tag_id: int,
         omit_empty: Optional[bool] = None,
         status: Optional[Literal["active", "closed", "all"]] = None,
     ) -> list[TagRelation]:
-        params = {}
-        if omit_empty is not None:
-            params["omit_empty"] = str(omit_empty).lower()
-        if status:
-            params["status"] = status
-        response = self.client.get(
+        params = _related_tags_params(omit_empty, status)
+        response = await self.client.get(
             self._build_url(f"/tags/{tag_id}/related-tags"), params=params
         )
         response.raise_for_status()
         return [TagRelation(**tag) for tag in response.json()]
 
-    def get_related_tag_ids_by_slug(
+    async def get_related_tag_ids_by_slug(
         self,
         slug: str,
         omit_empty: Optional[bool] = None,
         status: Optional[Literal["active", "closed", "all"]] = None,
     ) -> list[TagRelation]:
-        params = {}
-        if omit_empty is not None:
-            params["omit_empty"] = str(omit_empty).lower()
-        if status:
-            params["status"] = status
-        response = self.client.get(
+        params = _related_tags_params(omit_empty, status)
+        response = await self.client.get(
             self._build_url(f"/tags/slug/{slug}/related-tags"), params=params
         )
         response.raise_for_status()
         return [TagRelation(**tag) for tag in response.json()]
 
-    def get_related_tags_by_tag_id(
+    async def get_related_tags_by_tag_id(
         self,
         tag_id: int,
         omit_empty: Optional[bool] = None,
         status: Optional[Literal["active", "closed", "all"]] = None,
     ) -> list[Tag]:
-        params = {}
-        if omit_empty is not None:
-            params["omit_empty"] = str(omit_empty).lower()
-        if status:
-            params["status"] = status
-        response = self.client.get(
+        params = _related_tags_params(omit_empty, status)
+        response = await self.client.get(
             self._build_url(f"/tags/{tag_id}/related-tags/tags"), params=params
         )
         response.raise_for_status()
         return [Tag(**tag) for tag in response.json()]
 
-    def get_related_tags_by_slug(
+    async def get_related_tags_by_slug(
         self,
         slug: str,
         omit_empty: Optional[bool] = None,
         status: Optional[Literal["active", "closed", "all"]] = None,
     ) -> list[Tag]:
-        params = {}
-        if omit_empty is not None:
-            params["omit_empty"] = str(omit_empty).lower()
-        if status:
-            params["status"] = status
-        response = self.client.get(
+        params = _related_tags_params(omit_empty, status)
+        response = await self.client.get(
             self._build_url(f"/tags/slug/{slug}/related-tags/tags"), params=params
         )
         response.raise_for_status()
         return [Tag(**tag) for tag in response.json()]
 
-    def get_series(
+    async def get_series(
         self,
         limit: int = 300,
         offset: int = 0,
@@ -623,27 +2028,21 @@ class PolymarketGammaClient:
             ]  # results also contain "15m" but the server returns a 422 Unprocessable Content
         ] = None,
     ) -> list[Series]:
-        params: dict[str, str | int | list[int]] = {
-            "limit": limit,
-            "offset": offset,
-        }
-        if order:
-            params["order"] = order
-            params["ascending"] = str(ascending).lower()
-        if slug:
-            params["slug"] = slug
-        if closed is not None:
-            params["closed"] = str(closed).lower()
-        if include_chat is not None:
-            params["include_chat"] = str(include_chat).lower()
-        if recurrence is not None:
-            params["recurrence"] = str(recurrence).lower()
-
-        response = self.client.get(self._build_url("/series"), params=params)
+        params = _series_params(
+            limit,
+            offset,
+            order,
+            ascending,
+            slug,
+            closed,
+            include_chat,
+            recurrence,
+        )
+        response = await self.client.get(self._build_url("/series"), params=params)
         response.raise_for_status()
         return [Series(**series) for series in response.json()]
 
-    def get_all_series(
+    async def get_all_series(
         self,
         order: Optional[str] = None,
         ascending: bool = True,
@@ -653,12 +2052,11 @@ class PolymarketGammaClient:
         recurrence: Optional[
             Literal["hourly", "daily", "weekly", "monthly", "annual"]
         ] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
     ) -> list[Series]:
-        offset = 0
-        series = []
-
-        while True:
-            part = self.get_series(
+        """All pages of get_series, up to max_concurrency pages are fetched at once."""
+        return await apaginate_offsets(
+            lambda offset: self.get_series(
                 offset=offset,
                 order=order,
                 ascending=ascending,
@@ -666,21 +2064,18 @@ class PolymarketGammaClient:
                 closed=closed,
                 include_chat=include_chat,
                 recurrence=recurrence,
-            )
-            series.extend(part)
-
-            if len(part) < 300:
-                break
-
-            offset += 300
-        return series
+            ),
+            page_size=300,
+            max_concurrency=max_concurrency,
+            key=lambda series: series.id,
+        )
 
-    def get_series_by_id(self, series_id: str) -> Series:
-        response = self.client.get(self._build_url(f"/series/{series_id}"))
+    async def get_series_by_id(self, series_id: str) -> Series:
+        response = await self.client.get(self._build_url(f"/series/{series_id}"))
         response.raise_for_status()
         return Series(**response.json())
 
-    def get_comments(
+    async def get_comments(
         self,
         parent_entity_type: Literal["Event", "Series", "market"],
         parent_entity_id: int,
@@ -692,37 +2087,32 @@ class PolymarketGammaClient:
         holders_only: Optional[bool] = None,
     ) -> list[Comment]:
         """Warning, the server doesn't give back the right amount of comments you asked for."""
-        params: dict[str, str | int] = {
-            "parent_entity_type": parent_entity_type,
-            "parent_entity_id": parent_entity_id,
-            "limit": limit,
-            "offset": offset,
-        }
-        if order:
-            params["order"] = order
-            params["ascending"] = str(ascending).lower()
-        if get_positions is not None:
-            params["get_positions"] = str(get_positions).lower()
-        if holders_only is not None:
-            params["holders_only"] = str(holders_only).lower()
-        response = self.client.get(self._build_url("/comments"), params=params)
+        params = _comments_params(
+            parent_entity_type,
+            parent_entity_id,
+            limit,
+            offset,
+            order,
+            ascending,
+            get_positions,
+            holders_only,
+        )
+        response = await self.client.get(self._build_url("/comments"), params=params)
         response.raise_for_status()
         return [Comment(**comment) for comment in response.json()]
 
-    def get_comments_by_id(
+    async def get_comments_by_id(
         self, comment_id: str, get_positions: Optional[bool] = None
     ) -> list[Comment]:
         """Returns all comments that belong to the comment's thread."""
-        params = {}
-        if get_positions is not None:
-            params["get_positions"] = str(get_positions).lower()
-        response = self.client.get(
+        params = _flag_params(get_positions=get_positions)
+        response = await self.client.get(
             self._build_url(f"/comments/{comment_id}"), params=params
         )
         response.raise_for_status()
         return [Comment(**comment) for comment in response.json()]
 
-    def get_comments_by_user_address(
+    async def get_comments_by_user_address(
         self,
         user_address: EthAddress,  # warning, this is the base address, not the proxy address
         limit: int = 500,
@@ -730,93 +2120,51 @@ class PolymarketGammaClient:
         order: Optional[str] = None,
         ascending: bool = True,
     ) -> list[Comment]:
-        params: dict[str, str | int] = {
-            "limit": limit,
-            "offset": offset,
-        }
-        if order:
-            params["order"] = order
-            params["ascending"] = str(ascending).lower()
-        response = self.client.get(
+        params = _page_params(limit, offset, order, ascending)
+        response = await self.client.get(
             self._build_url(f"/comments/user_address/{user_address}"), params=params
         )
         response.raise_for_status()
         return [Comment(**comment) for comment in response.json()]
 
-    def grok_event_summary(self, event_slug: str) -> None:
-        json_payload = {
-            "id": generate_random_id(),
-            "messages": [{"role": "user", "content": "", "parts": []}],
-        }
-
-        params = {
-            "prompt": event_slug,
-        }
-
-        with self.client.stream(
+    async def grok_event_summary(
+        self, event_slug: str
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Streamed summary text of the event and its de-duplicated sources."""
+        async with self.client.stream(
             method="POST",
-            url="https://polymarket.com/api/grok/event-summary",
-            params=params,
-            json=json_payload,
+            url=_GROK_EVENT_SUMMARY_URL,
+            params={"prompt": event_slug},
+            json=_grok_summary_payload(),
         ) as stream:
-            messages = []
-            citations = []
-            seen_urls = set()
-
-            for line_bytes in stream.iter_lines():
-                line = (
-                    line_bytes.decode() if isinstance(line_bytes, bytes) else line_bytes
-                )
-                if line.startswith("__SOURCES__:"):
-                    sources_json_str = line[len("__SOURCES__:") :]
-                    try:
-                        sources_obj = json.loads(sources_json_str)
-                        for source in sources_obj.get("sources", []):
-                            url = source.get("url")
-                            if url and url not in seen_urls:
-                                citations.append(source)
-                                seen_urls.add(url)
-                    except json.JSONDecodeError:
-                        pass
-                else:
+            messages: list[str] = []
+            citations: list[dict[str, Any]] = []
+            seen_urls: set[str] = set()
+
+            async for line in stream.aiter_lines():
+                if not _add_grok_sources(line, citations, seen_urls):
                     messages.append(line)
-                    print(line, end="")  # or handle message text as needed
 
-        # After reading streamed lines:
-        if citations:
-            print("\n\nSources:")
-            for source in citations:
-                print(f"- {source.get('url', 'Unknown URL')}")
+        return "".join(messages), citations
 
-    def grok_election_market_explanation(
+    async def grok_election_market_explanation(
         self, candidate_name: str, election_title: str
-    ) -> None:
-        text = f"Provide candidate information for {candidate_name} in the {election_title} on Polymarket."
-        json_payload = {
-            "id": generate_random_id(),
-            "messages": [
-                {
-                    "role": "user",
-                    "content": text,
-                    "parts": [{"type": "text", "text": text}],
-                },
-            ],
-        }
-
-        response = self.client.post(
-            url="https://polymarket.com/api/grok/election-market-explanation",
-            json=json_payload,
+    ) -> str:
+        """Explanation text, one section per paragraph."""
+        response = await self.client.post(
+            url=_GROK_ELECTION_EXPLANATION_URL,
+            json=_grok_explanation_payload(candidate_name, election_title),
         )
         response.raise_for_status()
+        return _format_grok_explanation(response.text)
 
-        parts = [p.strip() for p in response.text.split("**") if p.strip()]
-        for i, part in enumerate(parts):
-            if ":" in part and i != 0:
-                print()
-            print(part)
+    async def aclose(self) -> None:
+        await self.client.aclose()
 
-    def __enter__(self) -> object:
+    async def __aenter__(self) -> Self:
         return self
 
-    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
-        self.client.close()
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.client.aclose()
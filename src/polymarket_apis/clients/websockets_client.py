@@ -1,11 +1,22 @@
-from collections.abc import Callable
+import asyncio
+import contextlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from functools import partial
 from json import JSONDecodeError
 from typing import Any, cast
 
 from lomond import WebSocket
+from lomond.errors import WebSocketError
 from lomond.events import Text
 from lomond.persist import persist
 from pydantic import ValidationError
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, WebSocketException
 
 from ..types.clob_types import ApiCreds
 from ..types.websockets_types import (
@@ -16,6 +27,8 @@ from ..types.websockets_types import (
     BestBidAskEvent,
     CommentEvent,
     LastTradePriceEvent,
+    LiveDataChannelEvent,
+    MarketChannelEvent,
     MarketResolvedEvent,
     NewMarketEvent,
     OrderBookSummaryEvent,
@@ -26,91 +39,251 @@ from ..types.websockets_types import (
     RequestEvent,
     TickSizeChangeEvent,
     TradeEvent,
+    UserChannelEvent,
 )
+from ..utilities.dispatch import AsyncEventQueue
+from ..utilities.fast_decode import (
+    construct_market_item,
+    construct_or_validate,
+    construct_user_item,
+    loads,
+)
+from ..utilities.hash_ring import ConsistentHashRing
+from ..utilities.latency import FeedLatency, event_type_of
+from ..utilities.market_cache import MarketMetadataCache
 
+logger = logging.getLogger(__name__)
 
-def _process_market_event(event: Text) -> None:
-    try:
-        message = event.json
-        if isinstance(message, list):
-            for item in message:
-                try:
-                    print(OrderBookSummaryEvent(**item), "\n")
-                except ValidationError as e:
-                    print(item.text)
-                    print(e.errors())
-            return
-        match message["event_type"]:
-            case "book":
-                print(OrderBookSummaryEvent(**message), "\n")
-            case "price_change":
-                print(PriceChangeEvent(**message), "\n")
-            case "tick_size_change":
-                print(TickSizeChangeEvent(**message), "\n")
-            case "last_trade_price":
-                print(LastTradePriceEvent(**message), "\n")
-            case "best_bid_ask":
-                print(BestBidAskEvent(**message), "\n")
-            case "new_market":
-                print(NewMarketEvent(**message), "\n")
-            case "market_resolved":
-                print(MarketResolvedEvent(**message), "\n")
-            case _:
-                print(message)
-    except JSONDecodeError:
-        print(event.text)
-    except ValidationError as e:
-        print(e.errors())
-        print(event.json)
 
+def parse_market_item(item: dict[str, Any]) -> MarketChannelEvent | None:
+    """Typed event for one market channel message, None for unknown event types."""
+    match item.get("event_type"):
+        case "book":
+            return OrderBookSummaryEvent(**item)
+        case "price_change":
+            return PriceChangeEvent(**item)
+        case "tick_size_change":
+            return TickSizeChangeEvent(**item)
+        case "last_trade_price":
+            return LastTradePriceEvent(**item)
+        case "best_bid_ask":
+            return BestBidAskEvent(**item)
+        case "new_market":
+            return NewMarketEvent(**item)
+        case "market_resolved":
+            return MarketResolvedEvent(**item)
+        case _:
+            return None
 
-def _process_user_event(event: Text) -> None:
+
+def parse_user_item(item: dict[str, Any]) -> UserChannelEvent | None:
+    """Typed event for one user channel message, None for unknown event types."""
+    match item.get("event_type"):
+        case "order":
+            return OrderEvent(**item)
+        case "trade":
+            return TradeEvent(**item)
+        case _:
+            return None
+
+
+def parse_live_data_item(item: dict[str, Any]) -> LiveDataChannelEvent | None:
+    """Typed event for one live data message, None for unknown message types."""
+    match item.get("type"):
+        case "trades":
+            return ActivityTradeEvent(**item)
+        case "orders_matched":
+            return ActivityOrderMatchEvent(**item)
+        case "comment_created" | "comment_removed":
+            return CommentEvent(**item)
+        case "reaction_created" | "reaction_removed":
+            return ReactionEvent(**item)
+        case (
+            "request_created"
+            | "request_edited"
+            | "request_canceled"
+            | "request_expired"
+        ):
+            return RequestEvent(**item)
+        case "quote_created" | "quote_edited" | "quote_canceled" | "quote_expired":
+            return QuoteEvent(**item)
+        case "subscribe":
+            return AssetPriceSubscribeEvent(**item)
+        case "update":
+            return AssetPriceUpdateEvent(**item)
+        case _:
+            return None
+
+
+def _items(message: Any) -> list[dict[str, Any]]:
+    # frames carry either a single message or a list of them
+    return message if isinstance(message, list) else [message]
+
+
+def parse_market_message(
+    text: str | bytes, validate: bool = True
+) -> list[MarketChannelEvent]:
+    """
+    Typed events of a raw market channel frame, raises JSONDecodeError / ValidationError.
+
+    With validate=False, book / price_change / tick_size_change / last_trade_price / best_bid_ask
+    events are decoded on the fast path (see utilities.fast_decode) instead of full pydantic validation.
+    """
+    if validate:
+        events = (parse_market_item(item) for item in _items(json.loads(text)))
+    else:
+        events = (
+            construct_or_validate(item, construct_market_item, parse_market_item)
+            for item in _items(loads(text))
+        )
+    return [event for event in events if event is not None]
+
+
+def parse_user_message(
+    text: str | bytes, validate: bool = True
+) -> list[UserChannelEvent]:
+    """Typed events of a raw user channel frame, raises JSONDecodeError / ValidationError - validate=False as in parse_market_message."""
+    if validate:
+        events = (parse_user_item(item) for item in _items(json.loads(text)))
+    else:
+        events = (
+            construct_or_validate(item, construct_user_item, parse_user_item)
+            for item in _items(loads(text))
+        )
+    return [event for event in events if event is not None]
+
+
+def parse_live_data_message(text: str | bytes) -> list[LiveDataChannelEvent]:
+    """Typed events of a raw live data frame, raises JSONDecodeError / ValidationError."""
+    events = (parse_live_data_item(item) for item in _items(json.loads(text)))
+    return [event for event in events if event is not None]
+
+
+def _print_events(
+    event: Text, parse_item: Callable[[dict[str, Any]], object | None]
+) -> None:
     try:
-        message = event.json
-        match message["event_type"]:
-            case "order":
-                print(OrderEvent(**message), "\n")
-            case "trade":
-                print(TradeEvent(**message), "\n")
+        for item in _items(event.json):
+            parsed = parse_item(item)
+            print(parsed if parsed is not None else item, "\n")
     except JSONDecodeError:
         print(event.text)
     except ValidationError as e:
-        print(event.text)
         print(e.errors(), "\n")
+        print(event.text)
+
+
+def _process_market_event(event: Text) -> None:
+    _print_events(event, parse_market_item)
+
+
+def _process_user_event(event: Text) -> None:
+    _print_events(event, parse_user_item)
 
 
 def _process_live_data_event(event: Text) -> None:
+    _print_events(event, parse_live_data_item)
+
+
+class MarketSubscription:
+    """
+    Token ids of a market socket that can change while it is connected.
+
+    subscribe / unsubscribe send only the difference on the live connection (no reconnect, no
+    fresh book snapshots for the other tokens), and every (re)connect subscribes the current set.
+    Thread safe, pass it to market_socket / market_events in place of a token id list.
+    """
+
+    def __init__(
+        self, token_ids: Iterable[str] = (), custom_feature_enabled: bool = True
+    ):
+        self.custom_feature_enabled = custom_feature_enabled
+        # insertion ordered set
+        self._token_ids: dict[str, None] = dict.fromkeys(token_ids)
+        self._lock = threading.Lock()
+        self._send: Callable[[dict[str, Any]], None] | None = None
+
+    @property
+    def token_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._token_ids)
+
+    def __contains__(self, token_id: str) -> bool:
+        return token_id in self._token_ids
+
+    def __len__(self) -> int:
+        return len(self._token_ids)
+
+    def subscribe(self, token_ids: Iterable[str]) -> list[str]:
+        """Add token ids, returns the ones that were not subscribed yet."""
+        with self._lock:
+            added = [
+                token_id
+                for token_id in dict.fromkeys(token_ids)
+                if token_id not in self._token_ids
+            ]
+            self._token_ids.update(dict.fromkeys(added))
+            self._update(added, "subscribe")
+        return added
+
+    def unsubscribe(self, token_ids: Iterable[str]) -> list[str]:
+        """Remove token ids, returns the ones that were subscribed."""
+        with self._lock:
+            removed = [
+                token_id
+                for token_id in dict.fromkeys(token_ids)
+                if token_id in self._token_ids
+            ]
+            for token_id in removed:
+                del self._token_ids[token_id]
+            self._update(removed, "unsubscribe")
+        return removed
+
+    def _update(self, token_ids: list[str], operation: str) -> None:
+        if token_ids and self._send is not None:
+            self._send(
+                {
+                    "assets_ids": token_ids,
+                    "operation": operation,
+                    "custom_feature_enabled": self.custom_feature_enabled,
+                }
+            )
+
+    def attach(self, send: Callable[[dict[str, Any]], None]) -> None:
+        """Called by the socket once connected - sends the full set and routes later changes to send."""
+        with self._lock:
+            self._send = send
+            send(
+                {
+                    "assets_ids": list(self._token_ids),
+                    "custom_feature_enabled": self.custom_feature_enabled,
+                }
+            )
+
+    def detach(self) -> None:
+        """Called by the socket on disconnect - changes only update the set until the next attach."""
+        with self._lock:
+            self._send = None
+
+
+def _send_json(websocket: WebSocket, payload: dict[str, Any]) -> None:
     try:
-        message = event.json
-        match message["type"]:
-            case "trades":
-                print(ActivityTradeEvent(**message), "\n")
-            case "orders_matched":
-                print(ActivityOrderMatchEvent(**message), "\n")
-            case "comment_created" | "comment_removed":
-                print(CommentEvent(**message), "\n")
-            case "reaction_created" | "reaction_removed":
-                print(ReactionEvent(**message), "\n")
-            case (
-                "request_created"
-                | "request_edited"
-                | "request_canceled"
-                | "request_expired"
-            ):
-                print(RequestEvent(**message), "\n")
-            case "quote_created" | "quote_edited" | "quote_canceled" | "quote_expired":
-                print(QuoteEvent(**message), "\n")
-            case "subscribe":
-                print(AssetPriceSubscribeEvent(**message), "\n")
-            case "update":
-                print(AssetPriceUpdateEvent(**message), "\n")
-            case _:
-                print(message)
-    except JSONDecodeError:
-        print(event.text)
-    except ValidationError as e:
-        print(e.errors(), "\n")
-        print(event.text)
+        websocket.send_json(payload)
+    except WebSocketError as exc:
+        # the connection is going away, the next ready event resubscribes the current set
+        logger.debug("could not send %s: %s", payload, exc)
+
+
+def _process(
+    process_event: Callable[[Text], None],
+    event: Text,
+    channel: str,
+    latency: FeedLatency | None,
+) -> None:
+    if latency is None:
+        process_event(event)
+    else:
+        latency.observe_frame(channel, event, process_event)
 
 
 class PolymarketWebsocketsClient:
@@ -121,34 +294,52 @@ class PolymarketWebsocketsClient:
 
     def market_socket(
         self,
-        token_ids: list[str],
+        token_ids: list[str] | MarketSubscription,
         custom_feature_enabled: bool = True,
         process_event: Callable[[Text], None] = _process_market_event,
+        metadata_cache: MarketMetadataCache | None = None,
+        on_reconnect: Callable[[], None] | None = None,
+        latency: FeedLatency | None = None,
     ) -> None:
         """
         Connect to the market websocket and subscribe to market events for specific token IDs.
 
         Args:
-            token_ids: List of token IDs to subscribe to
-            custom_feature_enabled: Enables best_bid_ask, new_market and market_resolved event types
+            token_ids: List of token IDs to subscribe to, or a MarketSubscription to change them while connected
+            custom_feature_enabled: Enables best_bid_ask, new_market and market_resolved event types (ignored for a MarketSubscription)
             process_event: Callback function to process received events
+            metadata_cache: Cache (e.g. a clob client's metadata_cache) to update on tick_size_change events
+            on_reconnect: Called when the connection is back after a drop, before resubscribing (e.g. OrderBookManager.on_reconnect)
+            latency: Histograms to record network and callback (consumer decoding included) latency in
 
         """
         websocket = WebSocket(self.url_market)
+        subscription = (
+            token_ids
+            if isinstance(token_ids, MarketSubscription)
+            else MarketSubscription(token_ids, custom_feature_enabled)
+        )
+        connected_before = False
 
         for event in persist(websocket):  # persist automatically reconnects
             if event.name == "ready":
-                websocket.send_json(
-                    assets_ids=token_ids,
-                    custom_feature_enabled=custom_feature_enabled
-                )
+                if connected_before and on_reconnect is not None:
+                    on_reconnect()
+                connected_before = True
+                subscription.attach(partial(_send_json, websocket))
+            elif event.name == "disconnected":
+                subscription.detach()
             elif event.name == "text":
-                process_event(cast("Text", event))
+                if metadata_cache is not None:
+                    metadata_cache.process_market_message(cast("Text", event).text)
+                _process(process_event, cast("Text", event), "market", latency)
 
     def user_socket(
         self,
         creds: ApiCreds,
         process_event: Callable[[Text], None] = _process_user_event,
+        latency: FeedLatency | None = None,
+        on_reconnect: Callable[[], None] | None = None,
     ) -> None:
         """
         Connect to the user websocket and subscribe to user events.
@@ -156,22 +347,29 @@ class PolymarketWebsocketsClient:
         Args:
             creds: API credentials for authentication
             process_event: Callback function to process received events
+            latency: Histograms to record network and callback (consumer decoding included) latency in
+            on_reconnect: Called when the connection is back after a drop, before resubscribing (e.g. OrderStateStore.on_reconnect)
 
         """
         websocket = WebSocket(self.url_user)
+        connected_before = False
 
         for event in persist(websocket):
             if event.name == "ready":
+                if connected_before and on_reconnect is not None:
+                    on_reconnect()
+                connected_before = True
                 websocket.send_json(
                     auth=creds.model_dump(by_alias=True),
                 )
             elif event.name == "text":
-                process_event(cast("Text", event))
+                _process(process_event, cast("Text", event), "user", latency)
 
     def live_data_socket(
         self,
         subscriptions: list[dict[str, Any]],
         process_event: Callable[[Text], None] = _process_live_data_event,
+        latency: FeedLatency | None = None,
     ) -> None:
         # info on how to subscribe found at https://github.com/Polymarket/real-time-data-client?tab=readme-ov-file#subscribe
         """
@@ -180,6 +378,7 @@ class PolymarketWebsocketsClient:
         Args:
             subscriptions: List of subscription configurations
             process_event: Callback function to process received events
+            latency: Histograms to record network and callback (consumer decoding included) latency in
 
         """
         websocket = WebSocket(self.url_live_data)
@@ -194,4 +393,354 @@ class PolymarketWebsocketsClient:
                 websocket.send_json(**payload)
 
             elif event.name == "text":
-                process_event(cast("Text", event))
+                _process(process_event, cast("Text", event), "live_data", latency)
+
+
+def _parse_or_skip[E](parse: Callable[[str], list[E]], text: str) -> list[E]:
+    try:
+        return parse(text)
+    except JSONDecodeError:
+        # PONG and other non json frames
+        return []
+    except ValidationError as exc:
+        logger.warning("skipping websocket message that failed validation: %s", exc)
+        return []
+
+
+def decode_market_frame(event: Text) -> list[MarketChannelEvent]:
+    """Fast path typed events of a market socket frame, for EventDispatcher(decode=...)."""
+    return _parse_or_skip(partial(parse_market_message, validate=False), event.text)
+
+
+def decode_user_frame(event: Text) -> list[UserChannelEvent]:
+    """Fast path typed events of a user socket frame, for EventDispatcher(decode=...)."""
+    return _parse_or_skip(partial(parse_user_message, validate=False), event.text)
+
+
+def decode_live_data_frame(event: Text) -> list[LiveDataChannelEvent]:
+    """Typed events of a live data socket frame, for EventDispatcher(decode=...)."""
+    return _parse_or_skip(parse_live_data_message, event.text)
+
+
+class AsyncPolymarketWebsocketsClient:
+    """
+    asyncio counterpart of PolymarketWebsocketsClient.
+
+    Every channel is an async iterator of typed events. The connection is kept alive with
+    PING frames and re-established (and resubscribed) with exponential backoff when it drops,
+    so any number of sockets can share one event loop with the async REST clients.
+    """
+
+    def __init__(
+        self,
+        ping_interval: float = 10.0,
+        min_reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        validate: bool = False,
+        latency: FeedLatency | None = None,
+    ):
+        self.url_market = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+        self.url_user = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+        self.url_live_data = "wss://ws-live-data.polymarket.com"
+        self.ping_interval = ping_interval
+        self.min_reconnect_delay = min_reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        # full pydantic validation of market/user events instead of the fast path, for debugging
+        self.validate = validate
+        # network / decode / consumer latency histograms, None to skip the bookkeeping
+        self.latency = latency
+        # pending MarketSubscription sends, referenced until done
+        self._sends: set[asyncio.Task[None]] = set()
+
+    async def _keepalive(self, websocket: ClientConnection) -> None:
+        with contextlib.suppress(ConnectionClosed):
+            while True:
+                await asyncio.sleep(self.ping_interval)
+                await websocket.send("PING")
+
+    def _sender(self, websocket: ClientConnection) -> Callable[[dict[str, Any]], None]:
+        # MarketSubscription changes may come from any thread, the send runs on the loop
+        loop = asyncio.get_running_loop()
+
+        async def send(text: str) -> None:
+            with contextlib.suppress(ConnectionClosed):
+                await websocket.send(text)
+
+        def spawn(text: str) -> None:
+            task = loop.create_task(send(text))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+
+        def sender(payload: dict[str, Any]) -> None:
+            loop.call_soon_threadsafe(spawn, json.dumps(payload))
+
+        return sender
+
+    async def messages(
+        self,
+        url: str,
+        subscription: dict[str, Any] | MarketSubscription,
+        on_reconnect: Callable[[], Awaitable[None] | None] | None = None,
+    ) -> AsyncIterator[str]:
+        """Raw text frames from url, sending subscription on every (re)connect (after calling and awaiting on_reconnect)."""
+        delay = self.min_reconnect_delay
+        connected_before = False
+        while True:
+            try:
+                async with connect(url, max_size=None) as websocket:
+                    keepalive = asyncio.create_task(self._keepalive(websocket))
+                    try:
+                        if connected_before and on_reconnect is not None:
+                            result = on_reconnect()
+                            if inspect.isawaitable(result):
+                                await result
+                        connected_before = True
+                        if isinstance(subscription, MarketSubscription):
+                            subscription.attach(self._sender(websocket))
+                        else:
+                            await websocket.send(json.dumps(subscription))
+                        delay = self.min_reconnect_delay
+                        async for message in websocket:
+                            yield (
+                                message
+                                if isinstance(message, str)
+                                else message.decode("utf-8")
+                            )
+                    finally:
+                        keepalive.cancel()
+                        if isinstance(subscription, MarketSubscription):
+                            subscription.detach()
+            except (OSError, TimeoutError, WebSocketException) as exc:
+                logger.warning(
+                    "websocket %s disconnected (%s), reconnecting in %.1fs",
+                    url,
+                    exc,
+                    delay,
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def market_events(
+        self,
+        token_ids: list[str] | MarketSubscription,
+        custom_feature_enabled: bool = True,
+        metadata_cache: MarketMetadataCache | None = None,
+        on_reconnect: Callable[[], None] | None = None,
+    ) -> AsyncIterator[MarketChannelEvent]:
+        """
+        Market events for specific token IDs.
+
+        Args:
+            token_ids: List of token IDs to subscribe to, or a MarketSubscription to change them while connected
+            custom_feature_enabled: Enables best_bid_ask, new_market and market_resolved event types (ignored for a MarketSubscription)
+            metadata_cache: Cache (e.g. a clob client's metadata_cache) to update on tick_size_change events
+            on_reconnect: Called when the connection is back after a drop, before resubscribing (e.g. OrderBookManager.on_reconnect)
+
+        """
+        subscription = (
+            token_ids
+            if isinstance(token_ids, MarketSubscription)
+            else MarketSubscription(token_ids, custom_feature_enabled)
+        )
+        parse = partial(parse_market_message, validate=self.validate)
+        texts = self.messages(self.url_market, subscription, on_reconnect)
+        async for event in self._typed_events(
+            "market",
+            texts,
+            parse,
+            metadata_cache.process_market_message if metadata_cache else None,
+        ):
+            yield event
+
+    async def _typed_events[E](
+        self,
+        channel: str,
+        texts: AsyncIterator[str],
+        parse: Callable[[str], list[E]],
+        on_text: Callable[[str], None] | None = None,
+    ) -> AsyncIterator[E]:
+        async for text in texts:
+            if on_text is not None:
+                on_text(text)
+            latency = self.latency
+            if latency is None:
+                for event in _parse_or_skip(parse, text):
+                    yield event
+                continue
+            received_time = time.time()
+            start = time.perf_counter()
+            events = _parse_or_skip(parse, text)
+            decode_time = time.perf_counter() - start
+            if not events:
+                continue
+            latency.record(channel, event_type_of(events[0]), "decode", decode_time)
+            for event in events:
+                latency.record_network(channel, event, received_time)
+            for event in events:
+                # the consumer runs between yield and the next iteration
+                start = time.perf_counter()
+                yield event
+                latency.record(
+                    channel,
+                    event_type_of(event),
+                    "callback",
+                    time.perf_counter() - start,
+                )
+
+    def sharded_market_socket(
+        self,
+        token_ids: list[str],
+        shards: int = 4,
+        custom_feature_enabled: bool = True,
+        metadata_cache: MarketMetadataCache | None = None,
+        queue: AsyncEventQueue[MarketChannelEvent] | None = None,
+        on_reconnect: Callable[[list[str]], None] | None = None,
+    ) -> "ShardedMarketSocket":
+        """Market events for a large token universe spread over several connections - iterate with `async for`."""
+        return ShardedMarketSocket(
+            self,
+            token_ids,
+            shards=shards,
+            custom_feature_enabled=custom_feature_enabled,
+            metadata_cache=metadata_cache,
+            queue=queue,
+            on_reconnect=on_reconnect,
+        )
+
+    async def user_events(
+        self,
+        creds: ApiCreds,
+        on_reconnect: Callable[[], Awaitable[None] | None] | None = None,
+    ) -> AsyncIterator[UserChannelEvent]:
+        """Order and trade events of the user owning creds, on_reconnect as in market_events (or async, e.g. OrderStateStore.aon_reconnect)."""
+        subscription = {"auth": creds.model_dump(by_alias=True)}
+        parse = partial(parse_user_message, validate=self.validate)
+        texts = self.messages(self.url_user, subscription, on_reconnect)
+        async for event in self._typed_events("user", texts, parse):
+            yield event
+
+    async def live_data_events(
+        self, subscriptions: list[dict[str, Any]]
+    ) -> AsyncIterator[LiveDataChannelEvent]:
+        # info on how to subscribe found at https://github.com/Polymarket/real-time-data-client?tab=readme-ov-file#subscribe
+        """Live data events for the given subscription configurations."""
+        subscription = {"action": "subscribe", "subscriptions": subscriptions}
+        texts = self.messages(self.url_live_data, subscription)
+        async for event in self._typed_events(
+            "live_data", texts, parse_live_data_message
+        ):
+            yield event
+
+
+class ShardedMarketSocket:
+    """
+    Market channel subscription spread over several connections.
+
+    Token ids are placed on shards with a consistent hash ring, each shard is its own connection
+    that reconnects independently, and the events of all shards are merged into one stream.
+    All events of a token come from the same shard, so they stay in order. subscribe / unsubscribe
+    change the tokens of the owning shards only, without touching the other connections (call them
+    from the event loop running the stream). A shard whose last token is removed is disconnected
+    and connects again on its next subscribe.
+    """
+
+    def __init__(
+        self,
+        client: AsyncPolymarketWebsocketsClient,
+        token_ids: list[str],
+        shards: int = 4,
+        custom_feature_enabled: bool = True,
+        metadata_cache: MarketMetadataCache | None = None,
+        virtual_nodes: int = 160,
+        queue: AsyncEventQueue[MarketChannelEvent] | None = None,
+        on_reconnect: Callable[[list[str]], None] | None = None,
+    ):
+        if shards < 1:
+            msg = f"shards must be positive, got {shards}"
+            raise ValueError(msg)
+        self.client = client
+        self.metadata_cache = metadata_cache
+        # called with the token ids of a shard that reconnected (e.g. OrderBookManager.mark_stale)
+        self.on_reconnect = on_reconnect
+        # shards only enqueue, the queue policy decides what a slow consumer loses
+        self.queue: AsyncEventQueue[MarketChannelEvent] = (
+            queue if queue is not None else AsyncEventQueue()
+        )
+        self.ring: ConsistentHashRing[int] = ConsistentHashRing(
+            range(shards), virtual_nodes
+        )
+        self.subscriptions: dict[int, MarketSubscription] = {
+            shard: MarketSubscription(tokens, custom_feature_enabled)
+            for shard, tokens in self.ring.assign(dict.fromkeys(token_ids)).items()
+        }
+        # shards are connected once they have tokens, their event sources by shard
+        self._connected: dict[int, AsyncIterator[MarketChannelEvent]] = {}
+        self._streaming = False
+
+    @property
+    def assignments(self) -> dict[int, list[str]]:
+        """Token ids per shard, shards without tokens left out."""
+        return {
+            shard: subscription.token_ids
+            for shard, subscription in self.subscriptions.items()
+            if len(subscription)
+        }
+
+    def shard_of(self, token_id: str) -> int:
+        return self.ring.get(token_id)
+
+    def subscribe(self, token_ids: Iterable[str]) -> list[str]:
+        """Add token ids on their shards' live connections, returns the ones not subscribed yet."""
+        added = []
+        for shard, tokens in self.ring.assign(dict.fromkeys(token_ids)).items():
+            added += self.subscriptions[shard].subscribe(tokens)
+            if self._streaming:
+                self._connect(shard)
+        return added
+
+    def unsubscribe(self, token_ids: Iterable[str]) -> list[str]:
+        """Remove token ids from their shards, returns the ones that were subscribed."""
+        removed = []
+        for shard, tokens in self.ring.assign(dict.fromkeys(token_ids)).items():
+            removed += self.subscriptions[shard].unsubscribe(tokens)
+            if not len(self.subscriptions[shard]) and shard in self._connected:
+                # an empty shard would keep reconnecting with no tokens
+                self.queue.remove_source(self._connected.pop(shard))
+        return removed
+
+    def _shard_events(self, shard: int) -> AsyncIterator[MarketChannelEvent]:
+        subscription = self.subscriptions[shard]
+        on_reconnect = self.on_reconnect
+        source = self.client.market_events(
+            subscription,
+            metadata_cache=self.metadata_cache,
+            on_reconnect=(
+                (lambda: on_reconnect(subscription.token_ids))
+                if on_reconnect is not None
+                else None
+            ),
+        )
+        self._connected[shard] = source
+        return source
+
+    def _connect(self, shard: int) -> None:
+        if shard not in self._connected and len(self.subscriptions[shard]):
+            self.queue.add_source(self._shard_events(shard))
+
+    async def events(self) -> AsyncIterator[MarketChannelEvent]:
+        sources = [
+            self._shard_events(shard)
+            for shard, subscription in self.subscriptions.items()
+            if len(subscription)
+        ]
+        self._streaming = True
+        try:
+            # kept open so that shards getting their first tokens can join later
+            async for event in self.queue.stream(*sources, keep_open=True):
+                yield event
+        finally:
+            self._streaming = False
+            self._connected.clear()
+
+    def __aiter__(self) -> AsyncIterator[MarketChannelEvent]:
+        return self.events()
@@ -9,8 +9,10 @@ the Polymarket APIs.
 from .clob_types import (
     ApiCreds,
     AssetType,
+    BatchResponse,
     BidAsk,
     BookParams,
+    ChunkError,
     ClobMarket,
     ContractConfig,
     CreateOrderOptions,
@@ -74,6 +76,8 @@ from .websockets_types import (
     CommentEvent,
     ErrorEvent,
     LastTradePriceEvent,
+    LiveDataChannelEvent,
+    MarketChannelEvent,
     MarketResolvedEvent,
     NewMarketEvent,
     OrderBookSummaryEvent,
@@ -84,6 +88,7 @@ from .websockets_types import (
     RequestEvent,
     TickSizeChangeEvent,
     TradeEvent,
+    UserChannelEvent,
 )
 
 __all__ = [
@@ -94,9 +99,11 @@ __all__ = [
     "AssetPriceSubscribeEvent",
     "AssetPriceUpdateEvent",
     "AssetType",
+    "BatchResponse",
     "BestBidAskEvent",
     "BidAsk",
     "BookParams",
+    "ChunkError",
     "ClobMarket",
     "ClobReward",
     "CommentEvent",
@@ -113,6 +120,8 @@ __all__ = [
     "HolderResponse",
     "Keccak256",
     "LastTradePriceEvent",
+    "LiveDataChannelEvent",
+    "MarketChannelEvent",
     "MarketOrderArgs",
     "MarketResolvedEvent",
     "MarketRewards",
@@ -153,6 +162,7 @@ __all__ = [
     "Trade",
     "TradeEvent",
     "User",
+    "UserChannelEvent",
     "UserMetric",
     "UserRank",
     "ValueResponse",
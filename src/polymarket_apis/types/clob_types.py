@@ -95,6 +95,18 @@ class PaginatedResponse[T](BaseModel):
     count: int
 
 
+class ChunkError(BaseModel):
+    index: int  # position of the chunk in the batch
+    items: list[str]  # ids sent in the failed chunk
+    error: str
+    status_code: Optional[int] = None
+
+
+class BatchResponse[T](BaseModel):
+    data: T  # merged results of the successful chunks, in input order
+    errors: list[ChunkError]
+
+
 class RewardRate(BaseModel):
     asset_address: str
     rewards_daily_rate: float
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Literal, Optional, cast
+from typing import Literal, Optional, Union, cast
 
 from pydantic import AliasChoices, BaseModel, Field, field_validator
 
@@ -331,3 +331,26 @@ class ErrorEvent(BaseModel):
     message: str
     connection_id: str = Field(alias="connectionId")
     request_id: str = Field(alias="requestId")
+
+
+# Typed events yielded per websocket channel
+MarketChannelEvent = Union[
+    OrderBookSummaryEvent,
+    PriceChangeEvent,
+    TickSizeChangeEvent,
+    LastTradePriceEvent,
+    BestBidAskEvent,
+    NewMarketEvent,
+    MarketResolvedEvent,
+]
+UserChannelEvent = Union[OrderEvent, TradeEvent]
+LiveDataChannelEvent = Union[
+    ActivityTradeEvent,
+    ActivityOrderMatchEvent,
+    CommentEvent,
+    ReactionEvent,
+    RequestEvent,
+    QuoteEvent,
+    AssetPriceSubscribeEvent,
+    AssetPriceUpdateEvent,
+]
@@ -0,0 +1,215 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Sequence, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import cast
+
+import httpx
+from pydantic import ValidationError
+
+from ..types.clob_types import ChunkError
+
+
+def chunked[T](items: Sequence[T], size: int) -> list[list[T]]:
+    """Split items into consecutive chunks of at most size elements."""
+    if size < 1:
+        msg = f"chunk size must be positive, got {size}"
+        raise ValueError(msg)
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be positive, got {max_concurrency}"
+        raise ValueError(msg)
+
+
+def _chunk_error(index: int, items: list[str], exc: Exception) -> ChunkError:
+    status_code = None
+    error = f"{type(exc).__name__}: {exc}"
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        # keep the server's explanation (e.g. {"error": "..."}) next to the status
+        if exc.response.text:
+            error += f"\nResponse: {exc.response.text}"
+    return ChunkError(
+        index=index,
+        items=items,
+        error=error,
+        status_code=status_code,
+    )
+
+
+def _short_page_error[T, R](
+    chunk: list[T], result: R, item_id: Callable[[T], str]
+) -> ChunkError | None:
+    # a page that does not hold one result per item would shift every later result
+    count = len(cast("Sized", result))
+    if count == len(chunk):
+        return None
+    return ChunkError(
+        index=-1,
+        items=[item_id(item) for item in chunk],
+        error=f"expected {len(chunk)} results, got {count}",
+    )
+
+
+def run_chunked[T, R](
+    fetch: Callable[[list[T]], R],
+    items: Sequence[T],
+    chunk_size: int,
+    max_concurrency: int,
+    item_id: Callable[[T], str] = str,
+    one_per_item: bool = False,
+) -> tuple[list[R], list[ChunkError]]:
+    """
+    Call fetch once per chunk of items on a thread pool of max_concurrency workers.
+
+    Returns the results of the successful chunks in chunk order and one ChunkError per failed chunk.
+    With one_per_item, fetch must return one result per item of its chunk, a page of another
+    length is turned into a ChunkError.
+    """
+    _check_concurrency(max_concurrency)
+    chunks = chunked(items, chunk_size)
+    if not chunks:
+        return [], []
+
+    def call(chunk: list[T]) -> R | ChunkError:
+        try:
+            result = fetch(chunk)
+        except (httpx.HTTPError, ValidationError) as exc:
+            return _chunk_error(-1, [item_id(item) for item in chunk], exc)
+        if one_per_item:
+            return _short_page_error(chunk, result, item_id) or result
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as pool:
+        outcomes = list(pool.map(call, chunks))
+
+    return _split_outcomes(outcomes)
+
+
+async def arun_chunked[T, R](
+    fetch: Callable[[list[T]], Awaitable[R]],
+    items: Sequence[T],
+    chunk_size: int,
+    max_concurrency: int,
+    item_id: Callable[[T], str] = str,
+    one_per_item: bool = False,
+) -> tuple[list[R], list[ChunkError]]:
+    """Async version of run_chunked - at most max_concurrency chunks are in flight at once."""
+    _check_concurrency(max_concurrency)
+    chunks = chunked(items, chunk_size)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(chunk: list[T]) -> R | ChunkError:
+        async with semaphore:
+            try:
+                result = await fetch(chunk)
+            except (httpx.HTTPError, ValidationError) as exc:
+                return _chunk_error(-1, [item_id(item) for item in chunk], exc)
+        if one_per_item:
+            return _short_page_error(chunk, result, item_id) or result
+        return result
+
+    outcomes = await asyncio.gather(*(call(chunk) for chunk in chunks))
+    return _split_outcomes(list(outcomes))
+
+
+def _split_outcomes[R](
+    outcomes: list[R | ChunkError],
+) -> tuple[list[R], list[ChunkError]]:
+    results: list[R] = []
+    errors: list[ChunkError] = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, ChunkError):
+            outcome.index = index
+            errors.append(outcome)
+        else:
+            results.append(outcome)
+    return results, errors
+
+
+class _Pages[T]:
+    # collects pages in offset order, de-duplicating rows that shifted into the next window
+
+    def __init__(self, page_size: int, key: Callable[[T], Hashable | None] | None):
+        if page_size < 1:
+            msg = f"page size must be positive, got {page_size}"
+            raise ValueError(msg)
+        self.page_size = page_size
+        self.key = key
+        self.items: list[T] = []
+        self.seen: set[Hashable] = set()
+
+    def add(self, page: list[T]) -> bool:
+        """Append page, False once it is the last one (short)."""
+        for item in page:
+            if self.key is not None:
+                item_key = self.key(item)
+                if item_key is not None:
+                    if item_key in self.seen:
+                        continue
+                    self.seen.add(item_key)
+            self.items.append(item)
+        return len(page) >= self.page_size
+
+
+def paginate_offsets[T](
+    fetch_page: Callable[[int], list[T]],
+    page_size: int,
+    max_concurrency: int,
+    key: Callable[[T], Hashable | None] | None = None,
+) -> list[T]:
+    """
+    All rows of an offset paginated endpoint, fetching up to max_concurrency pages at once.
+
+    fetch_page(offset) returns one page. Pages are consumed in offset order and fetching stops at
+    the first short page, so the result is ordered like a serial loop - minus rows with a key
+    already seen, which shifted between windows while paging.
+    """
+    _check_concurrency(max_concurrency)
+    pages = _Pages(page_size, key)
+    pool = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        in_flight: deque[Future[list[T]]] = deque(
+            pool.submit(fetch_page, index * page_size)
+            for index in range(max_concurrency)
+        )
+        next_offset = len(in_flight) * page_size
+        while in_flight:
+            if not pages.add(in_flight.popleft().result()):
+                break
+            in_flight.append(pool.submit(fetch_page, next_offset))
+            next_offset += page_size
+    finally:
+        # pages past the end (or after a failure) are not needed, do not wait for running ones
+        pool.shutdown(wait=False, cancel_futures=True)
+    return pages.items
+
+
+async def apaginate_offsets[T](
+    fetch_page: Callable[[int], Awaitable[list[T]]],
+    page_size: int,
+    max_concurrency: int,
+    key: Callable[[T], Hashable | None] | None = None,
+) -> list[T]:
+    """Async version of paginate_offsets."""
+    _check_concurrency(max_concurrency)
+    pages = _Pages(page_size, key)
+    in_flight: deque[asyncio.Task[list[T]]] = deque(
+        asyncio.ensure_future(fetch_page(index * page_size))
+        for index in range(max_concurrency)
+    )
+    next_offset = len(in_flight) * page_size
+    try:
+        while in_flight:
+            if not pages.add(await in_flight.popleft()):
+                break
+            in_flight.append(asyncio.ensure_future(fetch_page(next_offset)))
+            next_offset += page_size
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+    return pages.items
@@ -0,0 +1,232 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from itertools import accumulate
+from typing import Literal, Optional
+
+from ..types.clob_types import OrderBookSummary, OrderSummary, OrderType
+from .exceptions import LiquidityError
+from .order_book import LocalOrderBook
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only the batch queries use it
+    np = None  # type: ignore[assignment]
+
+
+class BookSideArrays:
+    """
+    One side of a book as contiguous float arrays ordered from best to worst price.
+
+    cum_size[i] and cum_notional[i] hold the shares and usdc available at levels 0..i,
+    so fill price, VWAP and depth lookups are binary searches over them. Batch queries
+    run vectorized over the same buffers when numpy is installed.
+    """
+
+    __slots__ = ("cum_notional", "cum_size", "descending", "keys", "prices", "sizes")
+
+    def __init__(
+        self, prices: Sequence[float], sizes: Sequence[float], descending: bool
+    ):
+        # True for bids - prices fall from best to worst, keys are negated so they always ascend
+        self.descending = descending
+        sign = -1.0 if descending else 1.0
+        self.prices = array("d", prices)
+        self.sizes = array("d", sizes)
+        self.cum_size = array("d", accumulate(self.sizes))
+        self.cum_notional = array(
+            "d",
+            accumulate(p * s for p, s in zip(self.prices, self.sizes, strict=True)),
+        )
+        self.keys = array("d", (p * sign for p in self.prices))
+
+    @classmethod
+    def from_levels(
+        cls, levels: Iterable[OrderSummary], descending: bool
+    ) -> "BookSideArrays":
+        """Build from OrderSummary levels in the server order (worst to best)."""
+        prices: list[float] = []
+        sizes: list[float] = []
+        for level in levels:
+            prices.append(level.price)
+            sizes.append(level.size)
+        prices.reverse()
+        sizes.reverse()
+        return cls(prices, sizes, descending)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def best_price(self) -> Optional[float]:
+        return float(self.prices[0]) if len(self.prices) else None
+
+    def total_size(self) -> float:
+        return float(self.cum_size[-1]) if len(self.cum_size) else 0.0
+
+    def total_notional(self) -> float:
+        return float(self.cum_notional[-1]) if len(self.cum_notional) else 0.0
+
+    def fill_index(self, amount: float, in_notional: bool = False) -> int:
+        """Index of the level that completes a fill of amount shares (or usdc), len(self) if the side is too thin."""
+        cumulative = self.cum_notional if in_notional else self.cum_size
+        return bisect_left(cumulative, amount)
+
+    def fill_price(self, amount: float, in_notional: bool = False) -> Optional[float]:
+        """Worst price touched when filling amount shares (or usdc), None if the side is too thin."""
+        index = self.fill_index(amount, in_notional)
+        if index >= len(self.prices):
+            return None
+        return float(self.prices[index])
+
+    def cost(self, size: float) -> Optional[float]:
+        """Usdc paid (or received) for size shares walking the book, None if the side is too thin."""
+        if size <= 0:
+            return 0.0
+        index = self.fill_index(size)
+        if index >= len(self.prices):
+            return None
+        filled_size = self.cum_size[index - 1] if index else 0.0
+        filled_notional = self.cum_notional[index - 1] if index else 0.0
+        return float(filled_notional + (size - filled_size) * self.prices[index])
+
+    def vwap(self, size: float) -> Optional[float]:
+        """Volume weighted average price of size shares, None if the side is too thin."""
+        if size <= 0:
+            return self.best_price()
+        cost = self.cost(size)
+        return cost / size if cost is not None else None
+
+    def vwap_many(self, sizes: Sequence[float]) -> list[Optional[float]]:
+        """VWAP for each of sizes, vectorized when numpy is available."""
+        if np is None or not len(self.prices):
+            return [self.vwap(size) for size in sizes]
+        # zero copy views over the array buffers
+        prices = np.frombuffer(self.prices, dtype=np.float64)
+        cum_size = np.frombuffer(self.cum_size, dtype=np.float64)
+        cum_notional = np.frombuffer(self.cum_notional, dtype=np.float64)
+        targets = np.asarray(sizes, dtype=np.float64)
+        indexes = np.searchsorted(cum_size, targets, side="left")
+        in_book = indexes < len(prices)
+        clipped = np.minimum(indexes, len(prices) - 1)
+        previous = clipped - 1
+        filled_size = np.where(clipped > 0, cum_size[previous], 0.0)
+        filled_notional = np.where(clipped > 0, cum_notional[previous], 0.0)
+        cost = filled_notional + (targets - filled_size) * prices[clipped]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwaps = np.where(targets > 0, cost / targets, prices[0])
+        return [
+            float(vwap) if ok else None
+            for vwap, ok in zip(vwaps.tolist(), in_book.tolist(), strict=True)
+        ]
+
+    def depth_at(self, price: float) -> float:
+        """Shares available at price or better."""
+        key = -price if self.descending else price
+        # tolerance so that best +/- distance still includes a level sitting exactly on the boundary
+        index = bisect_right(self.keys, key + 1e-9)
+        return float(self.cum_size[index - 1]) if index else 0.0
+
+    def depth_within(self, distance: float) -> float:
+        """Shares available within distance of the best price."""
+        best = self.best_price()
+        if best is None:
+            return 0.0
+        return self.depth_at(best - distance if self.descending else best + distance)
+
+
+class CompactOrderBook:
+    """
+    Read only, array backed snapshot of an order book for fast market order evaluation.
+
+    Build it once per book update with from_summary / from_local_book and query it as often as needed.
+    """
+
+    __slots__ = ("asks", "bids", "token_id")
+
+    def __init__(self, token_id: str, bids: BookSideArrays, asks: BookSideArrays):
+        self.token_id = token_id
+        self.bids = bids
+        self.asks = asks
+
+    @classmethod
+    def from_summary(cls, book: OrderBookSummary) -> "CompactOrderBook":
+        return cls(
+            book.token_id,
+            BookSideArrays.from_levels(book.bids, descending=True),
+            BookSideArrays.from_levels(book.asks, descending=False),
+        )
+
+    @classmethod
+    def from_local_book(cls, book: LocalOrderBook) -> "CompactOrderBook":
+        bid_prices = book.bids.prices[::-1]
+        ask_prices = book.asks.prices
+        return cls(
+            book.token_id,
+            BookSideArrays(
+                bid_prices,
+                [book.bids.sizes[price] for price in bid_prices],
+                descending=True,
+            ),
+            BookSideArrays(
+                ask_prices,
+                [book.asks.sizes[price] for price in ask_prices],
+                descending=False,
+            ),
+        )
+
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best_price()
+
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best_price()
+
+    def midpoint(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    def _taker_side(self, side: Literal["BUY", "SELL"]) -> BookSideArrays:
+        if side == "BUY":
+            return self.asks
+        if side == "SELL":
+            return self.bids
+        msg = 'Side must be "BUY" or "SELL"'
+        raise ValueError(msg)
+
+    def market_price(
+        self,
+        side: Literal["BUY", "SELL"],
+        amount: float,
+        order_type: OrderType = OrderType.FOK,
+    ) -> float:
+        """
+        Matching price for a market order, same semantics as OrderBuilder.calculate_buy/sell_market_price.
+
+        amount is in usdc for BUY and in shares for SELL.
+        """
+        book_side = self._taker_side(side)
+        if not len(book_side):
+            msg = f"No {'ask' if side == 'BUY' else 'bid'} orders available"
+            raise LiquidityError(msg)
+        price = book_side.fill_price(amount, in_notional=side == "BUY")
+        if price is not None:
+            return price
+        if order_type == OrderType.FOK:
+            msg = "no match"
+            raise ValueError(msg)
+        return float(book_side.prices[-1])
+
+    def vwap(self, side: Literal["BUY", "SELL"], size: float) -> Optional[float]:
+        """Average price for a taker buying (or selling) size shares, None if the book is too thin."""
+        return self._taker_side(side).vwap(size)
+
+    def depth_within_spread(self, distance: float) -> tuple[float, float]:
+        """Bid and ask shares resting within distance of the respective best price."""
+        return self.bids.depth_within(distance), self.asks.depth_within(distance)
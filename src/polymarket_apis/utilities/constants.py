@@ -23,5 +23,14 @@ AMOY: Literal[80002] = 80002
 POLYGON: Literal[137] = 137
 END_CURSOR = "LTE="
 
+# Batched requests
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 8
+# offset pages fetched at once - the pages past the end of the results are wasted requests
+DEFAULT_PAGE_CONCURRENCY = 4
+# server side limits of POST /orders and DELETE /orders
+MAX_POST_ORDERS_BATCH = 15
+MAX_CANCEL_ORDERS_BATCH = 3000
+
 BUY = "BUY"
 SELL = "SELL"
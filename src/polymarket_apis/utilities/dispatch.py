@@ -0,0 +1,345 @@
+"""
+Bounded queues between a websocket reader and a (possibly slow) consumer.
+
+The reader only enqueues, so a slow consumer only holds it up once the queue is full. What
+happens then is set by the overflow policy:
+
+- "block" (the default): the producer waits for room - nothing is lost, but the socket reader
+  stalls behind the consumer, pick drop_oldest or conflate to keep reading frames
+- "drop_oldest": the oldest queued event is discarded
+- "conflate": queued events with the same key (e.g. token id) are replaced by the newest one,
+  the oldest key is discarded when the queue is full - for consumers that only care about the
+  latest state, not for rebuilding books from price_change deltas
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+from itertools import count
+from typing import Any, Literal, Optional
+
+from .exceptions import QueueClosedError
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop_oldest", "conflate"]
+
+
+def market_event_key(event: Any) -> Hashable:
+    """Conflation key of a market channel event - its type and token (condition for price_change)."""
+    token_id = getattr(event, "token_id", None)
+    if token_id is None:
+        token_id = getattr(event, "condition_id", None)
+    return getattr(event, "event_type", None), token_id
+
+
+class DispatchStats:
+    """Counters of one queue, lagged counts the puts that found it full."""
+
+    __slots__ = (
+        "conflated",
+        "delivered",
+        "dropped",
+        "enqueued",
+        "high_water",
+        "lagged",
+    )
+
+    def __init__(self) -> None:
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.lagged = 0
+        self.high_water = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        counters = ", ".join(
+            f"{name}={value}" for name, value in self.as_dict().items()
+        )
+        return f"DispatchStats({counters})"
+
+
+class _Pending[T]:
+    # policy bookkeeping shared by the thread and asyncio queues, not synchronized itself
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: OverflowPolicy,
+        key: Optional[Callable[[T], Hashable]],
+    ):
+        if maxsize < 1:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        if policy not in {"block", "drop_oldest", "conflate"}:
+            msg = f'policy must be "block", "drop_oldest" or "conflate", got {policy!r}'
+            raise ValueError(msg)
+        if policy == "conflate" and key is None:
+            msg = "the conflate policy needs a key function"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.items: OrderedDict[Hashable, T] = OrderedDict()
+        self.stats = DispatchStats()
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def full(self) -> bool:
+        return len(self.items) >= self.maxsize
+
+    def push(self, item: T, waited: bool = False) -> bool:
+        """Queue item, False if the policy is block and there is no room."""
+        if self.policy == "conflate":
+            slot = (True, self.key(item))  # type: ignore[misc]
+            if slot in self.items:
+                # newest value, keeps the position of the first queued one
+                self.items[slot] = item
+                self.stats.enqueued += 1
+                self.stats.conflated += 1
+                return True
+        else:
+            slot = (False, next(self._sequence))
+        if self.full():
+            if not waited:
+                self.stats.lagged += 1
+            if self.policy == "block":
+                return False
+            self.items.popitem(last=False)
+            self.stats.dropped += 1
+        self.items[slot] = item
+        self.stats.enqueued += 1
+        self.stats.high_water = max(self.stats.high_water, len(self.items))
+        return True
+
+    def pop(self) -> T:
+        self.stats.delivered += 1
+        return self.items.popitem(last=False)[1]
+
+
+class EventQueue[T]:
+    """Thread safe bounded queue with an overflow policy, see the module docstring."""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        policy: OverflowPolicy = "block",
+        key: Optional[Callable[[T], Hashable]] = None,
+    ):
+        self._pending: _Pending[T] = _Pending(maxsize, policy, key)
+        self._condition = threading.Condition()
+        self.closed = False
+
+    @property
+    def stats(self) -> DispatchStats:
+        return self._pending.stats
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, item: T, timeout: Optional[float] = None) -> bool:
+        """Queue item, False if the block policy timed out waiting for room."""
+        with self._condition:
+            if self.closed:
+                msg = "put on a closed queue"
+                raise QueueClosedError(msg)
+            if not self._pending.push(item):
+                if not self._condition.wait_for(
+                    lambda: self.closed or not self._pending.full(), timeout
+                ):
+                    return False
+                if self.closed:
+                    msg = "put on a closed queue"
+                    raise QueueClosedError(msg)
+                self._pending.push(item, waited=True)
+            self._condition.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """Next item, raises TimeoutError after timeout and QueueClosedError once closed and drained."""
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self.closed or len(self._pending) > 0, timeout
+            ):
+                msg = "no event within the timeout"
+                raise TimeoutError(msg)
+            if not len(self._pending):
+                msg = "queue closed"
+                raise QueueClosedError(msg)
+            item = self._pending.pop()
+            self._condition.notify_all()
+            return item
+
+    def close(self) -> None:
+        """Stop accepting items, the queued ones can still be taken."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class EventDispatcher[T]:
+    """
+    Calls handler on a worker thread fed through a bounded EventQueue.
+
+    An instance is a drop in process_event callback for PolymarketWebsocketsClient sockets - the
+    lomond receive loop only decodes and enqueues (and waits for room once the queue is full under
+    the block policy). decode turns each received item into the events
+    to queue (e.g. websockets_client.decode_market_frame, needed to conflate per token).
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[T], None],
+        maxsize: int = 10_000,
+        policy: OverflowPolicy = "block",
+        key: Optional[Callable[[T], Hashable]] = None,
+        decode: Optional[Callable[[Any], Iterable[T]]] = None,
+        name: str = "event-dispatcher",
+    ):
+        self.handler = handler
+        self.decode = decode
+        self.queue: EventQueue[T] = EventQueue(maxsize, policy, key)
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self) -> DispatchStats:
+        return self.queue.stats
+
+    def __call__(self, item: Any) -> None:
+        for event in self.decode(item) if self.decode is not None else (item,):
+            self.queue.put(event)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                event = self.queue.get()
+            except QueueClosedError:
+                return
+            try:
+                self.handler(event)
+            except Exception:
+                # a failing handler must not take the feed down with it
+                logger.exception("event handler failed")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting events and wait for the worker to drain the queue."""
+        self.queue.close()
+        self._worker.join(timeout)
+
+
+class AsyncEventQueue[T]:
+    """asyncio counterpart of EventQueue, stream() pumps async iterators into it."""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        policy: OverflowPolicy = "block",
+        key: Optional[Callable[[T], Hashable]] = None,
+    ):
+        self._pending: _Pending[T] = _Pending(maxsize, policy, key)
+        self._condition = asyncio.Condition()
+        self._error: Optional[Exception] = None
+        self._sources = 0
+        # pump task per source of the running stream()
+        self._tasks: Optional[dict[AsyncIterator[T], asyncio.Task[None]]] = None
+
+    @property
+    def stats(self) -> DispatchStats:
+        return self._pending.stats
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def put(self, item: T) -> None:
+        async with self._condition:
+            if not self._pending.push(item):
+                await self._condition.wait_for(lambda: not self._pending.full())
+                self._pending.push(item, waited=True)
+            self._condition.notify_all()
+
+    async def get(self) -> T:
+        async with self._condition:
+            await self._condition.wait_for(lambda: len(self._pending) > 0)
+            item = self._pending.pop()
+            self._condition.notify_all()
+            return item
+
+    async def _pump(self, source: AsyncIterator[T]) -> None:
+        try:
+            async for item in source:
+                await self.put(item)
+        except Exception as exc:
+            # handed to the consumer once the events queued before it are delivered
+            self._error = exc
+            raise
+        finally:
+            async with self._condition:
+                self._sources -= 1
+                self._condition.notify_all()
+
+    async def stream(
+        self, *sources: AsyncIterator[T], keep_open: bool = False
+    ) -> AsyncIterator[T]:
+        """
+        Merge sources through the queue, each read by its own task.
+
+        A slow consumer stalls the sources only once the queue is full and the policy is block.
+
+        Ends when every source is exhausted (unless keep_open, to wait for add_source), re-raises
+        the first source failure.
+        """
+        self._error = None
+        self._sources = 0
+        self._tasks = {}
+        for source in sources:
+            self.add_source(source)
+        try:
+            while True:
+                async with self._condition:
+                    await self._condition.wait_for(
+                        lambda: (
+                            len(self._pending) > 0
+                            or self._error is not None
+                            or (self._sources == 0 and not keep_open)
+                        )
+                    )
+                    if not len(self._pending):
+                        if self._error is not None:
+                            raise self._error
+                        return
+                    item = self._pending.pop()
+                    self._condition.notify_all()
+                yield item
+        finally:
+            tasks, self._tasks = list(self._tasks.values()), None
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def add_source(self, source: AsyncIterator[T]) -> None:
+        """Merge one more source into the running stream(), read under the same overflow policy."""
+        if self._tasks is None:
+            msg = "add_source needs a running stream()"
+            raise RuntimeError(msg)
+        self._sources += 1
+        self._tasks[source] = asyncio.create_task(self._pump(source))
+
+    def remove_source(self, source: AsyncIterator[T]) -> bool:
+        """Stop reading a source of the running stream(), False if it is not one."""
+        if self._tasks is None:
+            return False
+        task = self._tasks.pop(source, None)
+        if task is None:
+            return False
+        # the pump's cleanup drops it from the source count
+        task.cancel()
+        return True
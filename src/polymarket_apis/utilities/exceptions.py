@@ -25,3 +25,6 @@ class SafeAlreadyDeployedError(Exception):
 class BuilderRateLimitError(Exception):
     """Shared builder credentials have hit their rate limit."""
 
+
+class QueueClosedError(Exception):
+    """Event queue was closed (put after close, get once closed and drained)."""
@@ -0,0 +1,288 @@
+"""
+Fast path decoding of websocket messages.
+
+Messages are parsed with orjson when it is installed and turned into the regular event models
+without going through pydantic validation - only the numeric and timestamp fields are converted,
+the Keccak256/address checks are skipped. Callers fall back to full validation when a message
+does not have the expected shape (KeyError / TypeError / ValueError).
+"""
+
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from ..types.clob_types import MakerOrder, OrderSummary
+from ..types.websockets_types import (
+    BestBidAskEvent,
+    LastTradePriceEvent,
+    MarketChannelEvent,
+    OrderBookSummaryEvent,
+    OrderEvent,
+    PriceChange,
+    PriceChangeEvent,
+    TickSizeChangeEvent,
+    TradeEvent,
+    UserChannelEvent,
+)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+loads: Callable[[str | bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# fast path failures that mean "validate this message properly instead"
+SCHEMA_ERRORS = (KeyError, TypeError, ValueError)
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+def _construct[M: BaseModel](model: type[M], fields: dict[str, Any]) -> M:
+    # model_construct without the defaults / alias / extra handling, which costs more than
+    # pydantic-core validation itself - fields must be complete and already converted
+    instance = _new(model)
+    _set(instance, "__dict__", fields)
+    _set(instance, "__pydantic_fields_set__", set(fields))
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    return instance
+
+
+# book levels are plain floats, pydantic-core builds them faster than python can
+_levels = TypeAdapter(list[OrderSummary]).validate_python
+
+
+def unix_datetime(value: str | float) -> datetime:
+    """UTC datetime of a unix timestamp, seconds or - like pydantic, above 2e10 - milliseconds."""
+    number = float(value)
+    if abs(number) > 2e10:
+        number /= 1000
+    return datetime.fromtimestamp(number, tz=UTC)
+
+
+def _optional_datetime(value: Optional[str | float]) -> Optional[datetime]:
+    if value is None or value in {"", "0", 0}:
+        return None
+    return unix_datetime(value)
+
+
+def _optional_float(value: Optional[str | float]) -> Optional[float]:
+    return float(value) if value not in {None, ""} else None
+
+
+# price_change messages come with either the long or the short field names
+_PRICE_CHANGE_KEYS = (
+    ("market", "timestamp", "price_changes"),
+    ("best_ask", "best_bid", "price", "size", "side", "asset_id", "hash"),
+)
+_SHORT_PRICE_CHANGE_KEYS = (
+    ("m", "t", "pc"),
+    ("ba", "bb", "p", "s", "si", "a", "h"),
+)
+
+
+def _book(item: dict[str, Any]) -> OrderBookSummaryEvent:
+    return _construct(
+        OrderBookSummaryEvent,
+        {
+            "condition_id": item["market"],
+            "token_id": item["asset_id"],
+            "timestamp": unix_datetime(item["timestamp"]),
+            "hash": item["hash"],
+            "bids": _levels(item["bids"]),
+            "asks": _levels(item["asks"]),
+            "tick_size": item.get("tick_size"),
+            "last_trade_price": _optional_float(item.get("last_trade_price")),
+            "min_order_size": _optional_float(item.get("min_order_size")),
+            "neg_risk": item.get("neg_risk"),
+            "event_type": "book",
+        },
+    )
+
+
+def _price_change(item: dict[str, Any]) -> PriceChangeEvent:
+    event_keys, change_keys = (
+        _PRICE_CHANGE_KEYS if "price_changes" in item else _SHORT_PRICE_CHANGE_KEYS
+    )
+    market, timestamp, price_changes = event_keys
+    best_ask, best_bid, price, size, side, asset_id, hash_ = change_keys
+    return _construct(
+        PriceChangeEvent,
+        {
+            "condition_id": item[market],
+            "price_changes": [
+                _construct(
+                    PriceChange,
+                    {
+                        "best_ask": float(change[best_ask]),
+                        "best_bid": float(change[best_bid]),
+                        "price": float(change[price]),
+                        "size": float(change[size]),
+                        "side": change[side],
+                        "token_id": change[asset_id],
+                        "hash": change[hash_],
+                    },
+                )
+                for change in item[price_changes]
+            ],
+            "timestamp": unix_datetime(item[timestamp]),
+            "event_type": "price_change",
+        },
+    )
+
+
+def _tick_size_change(item: dict[str, Any]) -> TickSizeChangeEvent:
+    return _construct(
+        TickSizeChangeEvent,
+        {
+            "token_id": item["asset_id"],
+            "condition_id": item["market"],
+            "old_tick_size": item["old_tick_size"],
+            "new_tick_size": item["new_tick_size"],
+            "timestamp": unix_datetime(item["timestamp"]),
+            "event_type": "tick_size_change",
+        },
+    )
+
+
+def _last_trade_price(item: dict[str, Any]) -> LastTradePriceEvent:
+    return _construct(
+        LastTradePriceEvent,
+        {
+            "price": float(item["price"]),
+            "size": float(item["size"]),
+            "side": item["side"],
+            "token_id": item["asset_id"],
+            "condition_id": item["market"],
+            "fee_rate_bps": float(item["fee_rate_bps"]),
+            "timestamp": unix_datetime(item["timestamp"]),
+            "event_type": "last_trade_price",
+        },
+    )
+
+
+def _best_bid_ask(item: dict[str, Any]) -> BestBidAskEvent:
+    return _construct(
+        BestBidAskEvent,
+        {
+            "condition_id": item["market"],
+            "token_id": item["asset_id"],
+            "best_bid": float(item["best_bid"]),
+            "best_ask": float(item["best_ask"]),
+            "spread": float(item["spread"]),
+            "timestamp": unix_datetime(item["timestamp"]),
+            "event_type": "best_bid_ask",
+        },
+    )
+
+
+_MARKET_BUILDERS: dict[str, Callable[[dict[str, Any]], MarketChannelEvent]] = {
+    "book": _book,
+    "price_change": _price_change,
+    "tick_size_change": _tick_size_change,
+    "last_trade_price": _last_trade_price,
+    "best_bid_ask": _best_bid_ask,
+}
+
+
+def construct_market_item(item: dict[str, Any]) -> Optional[MarketChannelEvent]:
+    """Unvalidated event for the high volume market event types, None for the others."""
+    builder = _MARKET_BUILDERS.get(item.get("event_type", ""))
+    return builder(item) if builder is not None else None
+
+
+def _order(item: dict[str, Any]) -> OrderEvent:
+    return _construct(
+        OrderEvent,
+        {
+            "token_id": item["asset_id"],
+            "condition_id": item["market"],
+            "order_id": item["id"],
+            "associated_trades": item.get("associated_trades"),
+            "maker_address": item["maker_address"],
+            "order_owner": item["owner"],
+            "event_owner": item["owner"],
+            "price": float(item["price"]),
+            "side": item["side"],
+            "size_matched": float(item["size_matched"]),
+            "original_size": float(item["original_size"]),
+            "outcome": item["outcome"],
+            "order_type": item["order_type"],
+            "created_at": unix_datetime(item["created_at"]),
+            "expiration": _optional_datetime(item.get("expiration")),
+            "timestamp": _optional_datetime(item.get("timestamp")),
+            "event_type": item.get("event_type"),
+            "type": item["type"],
+            "status": item["status"],
+        },
+    )
+
+
+def _trade(item: dict[str, Any]) -> TradeEvent:
+    return _construct(
+        TradeEvent,
+        {
+            "token_id": item["asset_id"],
+            "condition_id": item["market"],
+            "taker_order_id": item["taker_order_id"],
+            "maker_orders": [
+                _construct(
+                    MakerOrder,
+                    {
+                        "token_id": maker["asset_id"],
+                        "order_id": maker["order_id"],
+                        "maker_address": maker["maker_address"],
+                        "owner": maker["owner"],
+                        "matched_amount": float(maker["matched_amount"]),
+                        "price": float(maker["price"]),
+                        "outcome": maker["outcome"],
+                        "fee_rate_bps": float(maker["fee_rate_bps"]),
+                    },
+                )
+                for maker in item["maker_orders"]
+            ],
+            "trade_id": item["id"],
+            "trade_owner": item["owner"],
+            "event_owner": item["owner"],
+            "price": float(item["price"]),
+            "size": float(item["size"]),
+            "side": item["side"],
+            "outcome": item["outcome"],
+            "last_update": unix_datetime(item["last_update"]),
+            "matchtime": _optional_datetime(item.get("matchtime")),
+            "timestamp": _optional_datetime(item.get("timestamp")),
+            "event_type": item.get("event_type"),
+            "type": item.get("type"),
+            "status": item["status"],
+        },
+    )
+
+
+_USER_BUILDERS: dict[str, Callable[[dict[str, Any]], UserChannelEvent]] = {
+    "order": _order,
+    "trade": _trade,
+}
+
+
+def construct_user_item(item: dict[str, Any]) -> Optional[UserChannelEvent]:
+    """Unvalidated order or trade event, None for other event types."""
+    builder = _USER_BUILDERS.get(item.get("event_type", ""))
+    return builder(item) if builder is not None else None
+
+
+def construct_or_validate[E](
+    item: dict[str, Any],
+    construct: Callable[[dict[str, Any]], E],
+    validate: Callable[[dict[str, Any]], E],
+) -> E:
+    """Fast path event, falling back to full validation for other types and unexpected shapes."""
+    try:
+        event = construct(item)
+    except SCHEMA_ERRORS:
+        event = None
+    return event if event is not None else validate(item)
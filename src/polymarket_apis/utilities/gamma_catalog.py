@@ -0,0 +1,506 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional, cast
+
+from pydantic import BaseModel
+
+from ..clients.gamma_client import PolymarketGammaClient
+from ..types.gamma_types import Event, GammaMarket, Tag
+from .constants import DEFAULT_PAGE_CONCURRENCY
+from .projection import project_model
+
+GAMMA_PAGE_SIZE = 500
+# fields the indexes read, always kept when the catalog holds projected models
+MARKET_INDEX_FIELDS = frozenset(
+    {
+        "id",
+        "slug",
+        "condition_id",
+        "token_ids",
+        "tags",
+        "events.id",
+        "updated_at",
+        "closed",
+    }
+)
+EVENT_INDEX_FIELDS = frozenset({"id", "slug", "tags", "updated_at", "closed"})
+SNAPSHOT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE events (id INTEGER PRIMARY KEY, market_ids TEXT NOT NULL, data TEXT NOT NULL);
+CREATE TABLE markets (id TEXT PRIMARY KEY, event_ids TEXT NOT NULL, data TEXT NOT NULL);
+"""
+
+
+def _tag_keys(tags: Optional[list[Tag]]) -> set[str]:
+    # a tag is looked up by id or slug
+    keys = set()
+    for tag in tags or ():
+        if tag.id is not None:
+            keys.add(str(tag.id))
+        if tag.slug is not None:
+            keys.add(tag.slug)
+    return keys
+
+
+def _add[K, V](index: dict[K, set[V]], keys: Iterable[K], value: V) -> None:
+    for key in keys:
+        index.setdefault(key, set()).add(value)
+
+
+def _discard[K, V](index: dict[K, set[V]], keys: Iterable[K], value: V) -> None:
+    for key in keys:
+        values = index.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del index[key]
+
+
+def _newest(
+    current: Optional[datetime], items: Iterable[GammaMarket | Event]
+) -> Optional[datetime]:
+    for item in items:
+        if item.updated_at is not None and (
+            current is None or item.updated_at > current
+        ):
+            current = item.updated_at
+    return current
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+class GammaCatalog:
+    """
+    In process catalog of Gamma events and markets with O(1) lookups.
+
+    Markets are indexed by market id, slug, condition id, clob token id, event id and tag (id or
+    slug), events by id, slug and tag. The first sync() loads every event with its markets
+    (get_all_events), later ones only pull the events and markets updated since the newest
+    updatedAt already seen - ordered by updatedAt descending, paging stops at the first older
+    row - so a sync costs one or two requests when little changed.
+
+    closed=False keeps only open markets and events, ones that close are dropped on the next sync.
+    With market_fields / event_fields the catalog holds slim models of only those fields (plus the
+    indexed ones) instead of the full GammaMarket / Event - see utilities.projection.
+
+    save() writes a SQLite snapshot (one JSON row per market and event, keyed by id, plus the sync
+    watermarks), load() restores it without any request, and the next sync() only pulls what
+    changed since the snapshot was taken.
+    """
+
+    def __init__(
+        self,
+        client: PolymarketGammaClient,
+        closed: Optional[bool] = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        overlap: timedelta = timedelta(minutes=1),
+        market_fields: Optional[Iterable[str]] = None,
+        event_fields: Optional[Iterable[str]] = None,
+    ):
+        self.client = client
+        self.closed = closed
+        self.max_concurrency = max_concurrency
+        # re-read this much before the watermark, rows can be committed with an older updatedAt
+        self.overlap = overlap
+        self.market_fields: Optional[frozenset[str]] = None
+        self.event_fields: Optional[frozenset[str]] = None
+        if market_fields is not None or event_fields is not None:
+            self.market_fields = MARKET_INDEX_FIELDS | set(market_fields or ())
+            # nested markets are stored as the catalog's markets
+            self.event_fields = (
+                EVENT_INDEX_FIELDS
+                | set(event_fields or ())
+                | {f"markets.{field}" for field in self.market_fields}
+            )
+        self.markets: dict[str, GammaMarket] = {}
+        self.events: dict[int, Event] = {}
+        # newest updatedAt seen, None until the first sync
+        self.markets_synced_until: Optional[datetime] = None
+        self.events_synced_until: Optional[datetime] = None
+        self._market_by_slug: dict[str, str] = {}
+        self._market_by_condition_id: dict[str, str] = {}
+        self._market_by_token_id: dict[str, str] = {}
+        self._markets_by_event: dict[int, set[str]] = {}
+        self._events_by_market: dict[str, set[int]] = {}
+        self._markets_by_tag: dict[str, set[str]] = {}
+        self._event_by_slug: dict[str, int] = {}
+        self._events_by_tag: dict[str, set[int]] = {}
+        # readers may run on other threads while sync() updates the indexes
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+    def _keep(self, item: GammaMarket | Event) -> bool:
+        return self.closed is None or bool(item.closed) == self.closed
+
+    def _remove_market(self, market_id: str) -> None:
+        market = self.markets.pop(market_id, None)
+        if market is None:
+            return
+        if market.slug is not None:
+            self._market_by_slug.pop(market.slug, None)
+        if market.condition_id is not None:
+            self._market_by_condition_id.pop(market.condition_id, None)
+        for token_id in market.token_ids or ():
+            self._market_by_token_id.pop(token_id, None)
+        _discard(self._markets_by_tag, _tag_keys(market.tags), market_id)
+
+    def _add_market(self, market: GammaMarket, event_ids: Iterable[int] = ()) -> None:
+        if market.id is None:
+            return
+        self._remove_market(market.id)
+        if not self._keep(market):
+            # closed, the event links go too
+            _discard(
+                self._markets_by_event,
+                self._events_by_market.pop(market.id, set()),
+                market.id,
+            )
+            return
+        self.markets[market.id] = market
+        if market.slug is not None:
+            self._market_by_slug[market.slug] = market.id
+        if market.condition_id is not None:
+            self._market_by_condition_id[market.condition_id] = market.id
+        for token_id in market.token_ids or ():
+            self._market_by_token_id[token_id] = market.id
+        _add(self._markets_by_tag, _tag_keys(market.tags), market.id)
+        event_ids = set(event_ids) | {event.id for event in market.events or ()}
+        if event_ids:
+            self._events_by_market.setdefault(market.id, set()).update(event_ids)
+            _add(self._markets_by_event, event_ids, market.id)
+
+    def _remove_event(self, event_id: int) -> None:
+        event = self.events.pop(event_id, None)
+        if event is None:
+            return
+        if event.slug is not None:
+            self._event_by_slug.pop(event.slug, None)
+        _discard(self._events_by_tag, _tag_keys(event.tags), event_id)
+
+    def _add_event(self, event: Event) -> None:
+        self._remove_event(event.id)
+        if not self._keep(event):
+            for market_id in self._markets_by_event.pop(event.id, set()):
+                _discard(self._events_by_market, [market_id], event.id)
+            return
+        self.events[event.id] = event
+        if event.slug is not None:
+            self._event_by_slug[event.slug] = event.id
+        _add(self._events_by_tag, _tag_keys(event.tags), event.id)
+        if event.markets is not None:
+            # markets no longer listed lose their link, the listed ones are relinked below
+            listed = {market.id for market in event.markets}
+            for market_id in self._markets_by_event.pop(event.id, set()) - listed:
+                _discard(self._events_by_market, [market_id], event.id)
+        for market in event.markets or ():
+            self._add_market(market, [event.id])
+
+    def add_events(self, events: Iterable[Event]) -> None:
+        """Index events and their nested markets, replacing the previous versions."""
+        events = list(events)
+        with self._lock:
+            for event in events:
+                self._add_event(event)
+            self.events_synced_until = _newest(self.events_synced_until, events)
+            self.markets_synced_until = _newest(
+                self.markets_synced_until,
+                (market for event in events for market in event.markets or ()),
+            )
+
+    def add_markets(self, markets: Iterable[GammaMarket]) -> None:
+        """Index markets, replacing the previous versions (their event links are kept)."""
+        markets = list(markets)
+        with self._lock:
+            for market in markets:
+                if market.id is None:
+                    continue
+                event_ids = list(self._events_by_market.get(market.id, ()))
+                self._add_market(market)
+                self._relink(market.id, event_ids)
+            self.markets_synced_until = _newest(self.markets_synced_until, markets)
+
+    def _relink(self, market_id: str, event_ids: Iterable[int]) -> None:
+        # Event.markets of the parent events hold the replaced (or dropped) market object
+        market = self.markets.get(market_id)
+        for event_id in event_ids:
+            event = self.events.get(event_id)
+            if event is None or event.markets is None:
+                continue
+            if market is None:
+                event.markets = [item for item in event.markets if item.id != market_id]
+            else:
+                event.markets = [
+                    market if item.id == market_id else item for item in event.markets
+                ]
+
+    def _models(self) -> tuple[type[BaseModel], type[BaseModel]]:
+        if self.market_fields is None or self.event_fields is None:
+            return GammaMarket, Event
+        return (
+            project_model(GammaMarket, self.market_fields),
+            project_model(Event, self.event_fields),
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write a snapshot of the catalog, replacing path atomically."""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        with self._lock:
+            meta: dict[str, Any] = {
+                "version": SNAPSHOT_VERSION,
+                "closed": self.closed,
+                "market_fields": sorted(self.market_fields)
+                if self.market_fields is not None
+                else None,
+                "event_fields": sorted(self.event_fields)
+                if self.event_fields is not None
+                else None,
+                "markets_synced_until": self.markets_synced_until.isoformat()
+                if self.markets_synced_until is not None
+                else None,
+                "events_synced_until": self.events_synced_until.isoformat()
+                if self.events_synced_until is not None
+                else None,
+            }
+            # nested markets are stored once, in the markets table
+            events = [
+                (
+                    event.id,
+                    json.dumps(
+                        [market.id for market in event.markets or () if market.id]
+                    ),
+                    event.model_dump_json(
+                        by_alias=True, exclude_none=True, exclude={"markets"}
+                    ),
+                )
+                for event in self.events.values()
+            ]
+            markets = [
+                (
+                    market_id,
+                    json.dumps(sorted(self._events_by_market.get(market_id, ()))),
+                    market.model_dump_json(by_alias=True, exclude_none=True),
+                )
+                for market_id, market in self.markets.items()
+            ]
+        connection = sqlite3.connect(tmp_path)
+        try:
+            with connection:
+                connection.executescript(_SCHEMA)
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [(key, json.dumps(value)) for key, value in meta.items()],
+                )
+                connection.executemany("INSERT INTO events VALUES (?, ?, ?)", events)
+                connection.executemany("INSERT INTO markets VALUES (?, ?, ?)", markets)
+        finally:
+            connection.close()
+        tmp_path.replace(path)
+
+    def load(self, path: str | Path) -> None:
+        """Replace the catalog with a snapshot written by save(), call sync() afterwards to catch up."""
+        connection = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True)
+        try:
+            # read the pages straight from the page cache
+            connection.execute("PRAGMA mmap_size = 1073741824")
+            meta = {
+                key: json.loads(value)
+                for key, value in connection.execute("SELECT key, value FROM meta")
+            }
+            self._check_snapshot(path, meta)
+            event_rows = connection.execute(
+                "SELECT market_ids, data FROM events"
+            ).fetchall()
+            market_rows = connection.execute(
+                "SELECT event_ids, data FROM markets"
+            ).fetchall()
+        finally:
+            connection.close()
+        market_model, event_model = self._models()
+        events = [
+            (json.loads(market_ids), event_model.model_validate_json(data))
+            for market_ids, data in event_rows
+        ]
+        markets = [
+            (json.loads(event_ids), market_model.model_validate_json(data))
+            for event_ids, data in market_rows
+        ]
+        with self._lock:
+            self._clear()
+            for _, event in events:
+                self._add_event(event)  # type: ignore[arg-type]
+            for event_ids, market in markets:
+                self._add_market(market, event_ids)  # type: ignore[arg-type]
+            for market_ids, event in events:
+                event.markets = [  # type: ignore[attr-defined]
+                    self.markets[market_id]
+                    for market_id in market_ids
+                    if market_id in self.markets
+                ]
+            self.markets_synced_until = _parse_time(meta["markets_synced_until"])
+            self.events_synced_until = _parse_time(meta["events_synced_until"])
+
+    def _check_snapshot(self, path: str | Path, meta: dict[str, Any]) -> None:
+        if meta.get("version") != SNAPSHOT_VERSION:
+            msg = f"{path} is a version {meta.get('version')} snapshot, expected {SNAPSHOT_VERSION}"
+            raise ValueError(msg)
+        if meta["closed"] is not None and meta["closed"] != self.closed:
+            msg = f"{path} holds closed={meta['closed']} items only, the catalog wants closed={self.closed}"
+            raise ValueError(msg)
+        for name, fields in (
+            ("market_fields", self.market_fields),
+            ("event_fields", self.event_fields),
+        ):
+            saved = meta[name]
+            if saved is not None and (fields is None or not fields <= set(saved)):
+                msg = f"{path} does not hold every field in {name}, saved: {saved}"
+                raise ValueError(msg)
+
+    def _clear(self) -> None:
+        self.markets.clear()
+        self.events.clear()
+        for index in (
+            self._market_by_slug,
+            self._market_by_condition_id,
+            self._market_by_token_id,
+            self._markets_by_event,
+            self._events_by_market,
+            self._markets_by_tag,
+            self._event_by_slug,
+            self._events_by_tag,
+        ):
+            index.clear()
+        self.markets_synced_until = None
+        self.events_synced_until = None
+
+    def _updated_since[T: (GammaMarket, Event)](
+        self, fetch_page: Callable[[int], list[T]], since: datetime
+    ) -> list[T]:
+        # pages are ordered by updatedAt descending, everything past the first older row is known
+        items: list[T] = []
+        offset = 0
+        while True:
+            page = fetch_page(offset)
+            for item in page:
+                if item.updated_at is not None and item.updated_at < since:
+                    return items
+                items.append(item)
+            if len(page) < GAMMA_PAGE_SIZE:
+                return items
+            offset += GAMMA_PAGE_SIZE
+
+    def sync(self) -> tuple[int, int]:
+        """Load the catalog, or pull what changed since the last sync - returns the (events, markets) applied."""
+        with self._lock:
+            events_since = self.events_synced_until
+            markets_since = self.markets_synced_until
+        # slim models carry every field the catalog reads, they stand in for the full ones
+        if events_since is None:
+            events = cast(
+                "list[Event]",
+                self.client.get_all_events(
+                    closed=self.closed,
+                    fields=self.event_fields,
+                    max_concurrency=self.max_concurrency,
+                ),
+            )
+        else:
+            events = self._updated_since(
+                lambda offset: cast(
+                    "list[Event]",
+                    self.client.get_events(
+                        offset=offset,
+                        order="updatedAt",
+                        ascending=False,
+                        fields=self.event_fields,
+                    ),
+                ),
+                events_since - self.overlap,
+            )
+        self.add_events(events)
+        markets: list[GammaMarket] = []
+        if markets_since is not None:
+            # market changes do not always bump the updatedAt of their event
+            markets = self._updated_since(
+                lambda offset: cast(
+                    "list[GammaMarket]",
+                    self.client.get_markets(
+                        limit=GAMMA_PAGE_SIZE,
+                        offset=offset,
+                        order="updatedAt",
+                        ascending=False,
+                        fields=self.market_fields,
+                    ),
+                ),
+                markets_since - self.overlap,
+            )
+            self.add_markets(markets)
+        return len(events), len(markets)
+
+    def get_market(self, market_id: str) -> Optional[GammaMarket]:
+        return self.markets.get(market_id)
+
+    def get_market_by_slug(self, slug: str) -> Optional[GammaMarket]:
+        market_id = self._market_by_slug.get(slug)
+        return self.markets.get(market_id) if market_id is not None else None
+
+    def get_market_by_condition_id(self, condition_id: str) -> Optional[GammaMarket]:
+        market_id = self._market_by_condition_id.get(condition_id)
+        return self.markets.get(market_id) if market_id is not None else None
+
+    def get_market_by_token_id(self, token_id: str) -> Optional[GammaMarket]:
+        market_id = self._market_by_token_id.get(token_id)
+        return self.markets.get(market_id) if market_id is not None else None
+
+    def get_event(self, event_id: int) -> Optional[Event]:
+        return self.events.get(event_id)
+
+    def get_event_by_slug(self, slug: str) -> Optional[Event]:
+        event_id = self._event_by_slug.get(slug)
+        return self.events.get(event_id) if event_id is not None else None
+
+    def get_markets_by_event(self, event_id: int) -> list[GammaMarket]:
+        with self._lock:
+            return [
+                self.markets[market_id]
+                for market_id in self._markets_by_event.get(event_id, ())
+                if market_id in self.markets
+            ]
+
+    def get_events_by_market(self, market_id: str) -> list[Event]:
+        with self._lock:
+            return [
+                self.events[event_id]
+                for event_id in self._events_by_market.get(market_id, ())
+                if event_id in self.events
+            ]
+
+    def get_events_by_tag(self, tag: str) -> list[Event]:
+        """Events tagged with a tag id or slug."""
+        with self._lock:
+            return [
+                self.events[event_id] for event_id in self._events_by_tag.get(tag, ())
+            ]
+
+    def get_markets_by_tag(self, tag: str) -> list[GammaMarket]:
+        """Markets tagged with a tag id or slug, directly or through their event."""
+        with self._lock:
+            market_ids = set(self._markets_by_tag.get(tag, ()))
+            for event_id in self._events_by_tag.get(tag, ()):
+                market_ids |= self._markets_by_event.get(event_id, set())
+            return [
+                self.markets[market_id]
+                for market_id in market_ids
+                if market_id in self.markets
+            ]
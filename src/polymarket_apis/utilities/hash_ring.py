@@ -0,0 +1,64 @@
+import hashlib
+from bisect import bisect_right, insort
+from collections.abc import Iterable
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing[N]:
+    """
+    Consistent hash ring mapping string keys (e.g. token ids) to nodes.
+
+    Every node is placed on the ring virtual_nodes times, so keys spread evenly and adding or
+    removing a node only moves the keys of that node.
+    """
+
+    def __init__(self, nodes: Iterable[N] = (), virtual_nodes: int = 160):
+        if virtual_nodes < 1:
+            msg = f"virtual_nodes must be positive, got {virtual_nodes}"
+            raise ValueError(msg)
+        self.virtual_nodes = virtual_nodes
+        self._points: list[int] = []
+        self._owners: dict[int, N] = {}
+        self.nodes: list[N] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: N) -> None:
+        if node in self.nodes:
+            return
+        self.nodes.append(node)
+        for replica in range(self.virtual_nodes):
+            point = _hash(f"{node}#{replica}")
+            if point in self._owners:
+                # 64 bit collision, keep the first owner
+                continue
+            self._owners[point] = node
+            insort(self._points, point)
+
+    def remove(self, node: N) -> None:
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        self._points = [point for point in self._points if self._owners[point] != node]
+        self._owners = {point: self._owners[point] for point in self._points}
+
+    def get(self, key: str) -> N:
+        """Node owning key - the first ring point clockwise from the key's hash."""
+        if not self._points:
+            msg = "hash ring has no nodes"
+            raise LookupError(msg)
+        index = bisect_right(self._points, _hash(key)) % len(self._points)
+        return self._owners[self._points[index]]
+
+    def assign(self, keys: Iterable[str]) -> dict[N, list[str]]:
+        """Group keys by owning node, keeping their input order within each node."""
+        groups: dict[N, list[str]] = {node: [] for node in self.nodes}
+        for key in keys:
+            groups[self.get(key)].append(key)
+        return groups
+
+    def __len__(self) -> int:
+        return len(self.nodes)
@@ -1,9 +1,11 @@
+import json
+import time
 from datetime import UTC, datetime
 from typing import Optional
 
 from ..types.clob_types import ApiCreds, RequestArgs
 from .signing.eip712 import sign_clob_auth_message
-from .signing.hmac import build_hmac_signature
+from .signing.hmac import HmacSigner, build_hmac_signature
 from .signing.signer import Signer
 
 POLY_ADDRESS = "POLY_ADDRESS"
@@ -68,3 +70,53 @@ def create_level_2_headers(
         POLY_API_KEY: creds.key,
         POLY_PASSPHRASE: creds.passphrase,
     }
+
+
+def serialize_body(body: object) -> bytes:
+    """Request body exactly as sent on the wire (and signed by Level2HeaderFactory)."""
+    return json.dumps(body).encode("utf-8")
+
+
+class Level2HeaderFactory:
+    """
+    Level 2 Poly headers for one set of api creds.
+
+    The secret is decoded once and the static header fields are built once,
+    so each request only costs a timestamp and one HMAC over the wire bytes.
+    """
+
+    def __init__(self, signer: Signer, creds: ApiCreds, builder: bool = False):
+        self.creds = creds
+        self.builder = builder
+        self._hmac = HmacSigner(creds.secret)
+        if builder:
+            self._signature_key = POLY_BUILDER_SIGNATURE
+            self._timestamp_key = POLY_BUILDER_TIMESTAMP
+            self._static = {
+                POLY_BUILDER_API_KEY: creds.key,
+                POLY_BUILDER_PASSPHRASE: creds.passphrase,
+            }
+        else:
+            self._signature_key = POLY_SIGNATURE
+            self._timestamp_key = POLY_TIMESTAMP
+            self._static = {
+                POLY_ADDRESS: signer.address(),
+                POLY_API_KEY: creds.key,
+                POLY_PASSPHRASE: creds.passphrase,
+            }
+
+    def create(
+        self, request_args: RequestArgs, content: Optional[bytes] = None
+    ) -> dict[str, str]:
+        """Headers for a request - pass the serialized body as content to avoid serializing it twice."""
+        if content is None and request_args.body is not None:
+            content = serialize_body(request_args.body)
+        timestamp = str(int(time.time()))
+        headers = {
+            self._signature_key: self._hmac.sign(
+                timestamp, request_args.method, request_args.request_path, content
+            ),
+            self._timestamp_key: timestamp,
+        }
+        headers.update(self._static)
+        return headers
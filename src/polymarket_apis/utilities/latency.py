@@ -0,0 +1,255 @@
+"""
+Latency histograms for the websocket feeds.
+
+LatencyHistogram buckets values HDR style - exact up to 2**precision_bits microseconds, then
+2**(precision_bits - 1) linear sub-buckets per power of two - so recording is an index computation
+and a counter increment, and percentiles stay within ~1/2**(precision_bits - 1) relative error.
+
+FeedLatency keeps one histogram per channel, event type and metric:
+
+- network: local receive time minus the exchange timestamp of the event (clock skew included)
+- decode: time the async client spends parsing a frame into typed events
+- callback: time spent in the consumer (process_event callback / async iterator body)
+
+The sync sockets hand raw frames to process_event and never parse them themselves, so there the
+callback time includes the consumer's own decoding and no decode metric is recorded. Their network
+latency comes from the first event_type and timestamp found in the frame text by a regex scan, a
+consumer that parses every item can call record_network with them for per item figures.
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from lomond.events import Text
+
+# first event type and exchange timestamp of a raw frame, without parsing it
+_EVENT_TYPE = re.compile(r'"(?:event_type|type)"\s*:\s*"([^"]+)"')
+_TIMESTAMP = re.compile(r'"(?:timestamp|t)"\s*:\s*"?(-?\d+(?:\.\d+)?)')
+
+Metric = Literal["network", "decode", "callback"]
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations, recorded in seconds and stored in microseconds."""
+
+    def __init__(self, precision_bits: int = 7, max_seconds: float = 3600.0):
+        if precision_bits < 2:
+            msg = f"precision_bits must be at least 2, got {precision_bits}"
+            raise ValueError(msg)
+        self.precision_bits = precision_bits
+        self.max_value = int(max_seconds * 1_000_000)
+        self._sub_count = 1 << precision_bits
+        self._half = self._sub_count >> 1
+        self.counts = [0] * (self._index(self.max_value) + 1)
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        # values below zero (e.g. exchange clock ahead of ours) are recorded as 0 and counted here
+        self.negative = 0
+        self._lock = threading.Lock()
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self.precision_bits
+        return (
+            self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+        )
+
+    def _bucket_bounds(self, index: int) -> tuple[int, int]:
+        if index < self._sub_count:
+            return index, index
+        shift, offset = divmod(index - self._sub_count, self._half)
+        shift += 1
+        lower = (offset + self._half) << shift
+        return lower, lower + (1 << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        value = int(seconds * 1_000_000)
+        with self._lock:
+            if value < 0:
+                self.negative += 1
+                value = 0
+            value = min(value, self.max_value)
+            self.counts[self._index(value)] += 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile, in seconds, None when empty."""
+        with self._lock:
+            if not self.count:
+                return None
+            target = max(1, round(self.count * percent / 100))
+            seen = 0
+            for index, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= target:
+                    upper = min(self._bucket_bounds(index)[1], self.max or 0)
+                    return upper / 1_000_000
+        return None  # pragma: no cover
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.count / 1_000_000 if self.count else None
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.precision_bits != self.precision_bits or len(other.counts) != len(
+            self.counts
+        ):
+            msg = "can only merge histograms with the same precision and range"
+            raise ValueError(msg)
+        with other._lock:  # noqa: SLF001
+            counts = list(other.counts)
+            count, total, negative = other.count, other.total, other.negative
+            low, high = other.min, other.max
+        with self._lock:
+            self.counts = [a + b for a, b in zip(self.counts, counts, strict=True)]
+            self.count += count
+            self.total += total
+            self.negative += negative
+            if low is not None and (self.min is None or low < self.min):
+                self.min = low
+            if high is not None and (self.max is None or high > self.max):
+                self.max = high
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * len(self.counts)
+            self.count = self.total = self.negative = 0
+            self.min = self.max = None
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Non empty buckets as (upper bound in seconds, count), for exporting the full distribution."""
+        with self._lock:
+            return [
+                (self._bucket_bounds(index)[1] / 1_000_000, bucket_count)
+                for index, bucket_count in enumerate(self.counts)
+                if bucket_count
+            ]
+
+    def summary(self) -> dict[str, Any]:
+        """Count, mean, min, max and p50/p90/p99/p99.9 in seconds."""
+        return {
+            "count": self.count,
+            "negative": self.negative,
+            "mean": self.mean(),
+            "min": self.min / 1_000_000 if self.min is not None else None,
+            "max": self.max / 1_000_000 if self.max is not None else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p99.9": self.percentile(99.9),
+        }
+
+
+def _exchange_time(value: Any) -> Optional[float]:
+    # unix seconds from a datetime or a (milli)second timestamp, as in the websocket payloads
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    number = float(value)
+    return number / 1000 if abs(number) > 2e10 else number
+
+
+def event_type_of(event: Any) -> str:
+    """event_type of a market/user event, type of a live data message."""
+    if isinstance(event, dict):
+        return str(event.get("event_type") or event.get("type") or "unknown")
+    return str(
+        getattr(event, "event_type", None)
+        or getattr(event, "type", None)
+        or type(event).__name__
+    )
+
+
+class FeedLatency:
+    """
+    Latency histograms per channel, event type and metric, see the module docstring.
+
+    Pass it as `latency=` to the websocket clients, read it with snapshot() / histogram().
+    """
+
+    def __init__(self, precision_bits: int = 7, max_seconds: float = 3600.0):
+        self.precision_bits = precision_bits
+        self.max_seconds = max_seconds
+        self.histograms: dict[tuple[str, str, Metric], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self, channel: str, event_type: str, metric: Metric
+    ) -> LatencyHistogram:
+        key = (channel, event_type, metric)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(
+                    key, LatencyHistogram(self.precision_bits, self.max_seconds)
+                )
+        return histogram
+
+    def record(
+        self, channel: str, event_type: str, metric: Metric, seconds: float
+    ) -> None:
+        self.histogram(channel, event_type, metric).record(seconds)
+
+    def record_network(self, channel: str, event: Any, received_time: float) -> None:
+        """Receive minus exchange time of a typed event or raw message dict, skipped without a timestamp."""
+        if isinstance(event, dict):
+            timestamp = event.get("timestamp", event.get("t"))
+        else:
+            timestamp = getattr(event, "timestamp", None)
+        try:
+            exchange_time = _exchange_time(timestamp)
+        except (TypeError, ValueError):
+            return
+        if exchange_time is not None:
+            self.record(
+                channel, event_type_of(event), "network", received_time - exchange_time
+            )
+
+    def observe_frame(
+        self, channel: str, event: Text, process_event: Callable[[Text], None]
+    ) -> None:
+        """Run process_event on a lomond frame, recording network and callback (decode included) latency."""
+        match = _EVENT_TYPE.search(event.text)
+        if match is None:
+            # PONG and other frames without events
+            process_event(event)
+            return
+        event_type = match.group(1)
+        timestamp = _TIMESTAMP.search(event.text)
+        if timestamp is not None:
+            exchange_time = _exchange_time(timestamp.group(1))
+            if exchange_time is not None:
+                self.record(
+                    channel, event_type, "network", event.received_time - exchange_time
+                )
+        start = time.perf_counter()
+        process_event(event)
+        self.record(channel, event_type, "callback", time.perf_counter() - start)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        """Summaries as {channel: {event_type: {metric: summary}}}."""
+        with self._lock:
+            histograms = list(self.histograms.items())
+        result: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        for (channel, event_type, metric), histogram in sorted(histograms):
+            result.setdefault(channel, {}).setdefault(event_type, {})[metric] = (
+                histogram.summary()
+            )
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.reset()
@@ -0,0 +1,148 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import cast, get_args
+
+from ..types.clob_types import ClobMarket, OrderBookSummary, TickSize
+from ..types.websockets_types import TickSizeChangeEvent
+from .fast_decode import SCHEMA_ERRORS
+
+logger = logging.getLogger(__name__)
+
+TICK_SIZES: tuple[str, ...] = get_args(TickSize)
+
+
+class TTLCache[K, V]:
+    """Thread safe mapping with LRU eviction past maxsize and per entry expiry after ttl seconds."""
+
+    def __init__(self, maxsize: int = 50_000, ttl: float | None = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        )
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return item[0] if item is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(cast("K", key)) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MarketMetadataCache:
+    """
+    Per token tick size, neg risk flag and fee rate used when creating orders.
+
+    Can be shared between clients, warmed in bulk from ClobMarket pages or order books (fee rates
+    with the clients' warm_fee_rates), and kept current by feeding it market websocket messages
+    (tick_size_change events). Fee rates expire after fee_rate_ttl - longer than ttl by default,
+    since a miss costs create_order a request to the fee rate endpoint.
+    Subclass and override the get/set methods to plug in a different store.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 50_000,
+        ttl: float | None = 3600.0,
+        fee_rate_ttl: float | None = 86_400.0,
+    ):
+        self.tick_sizes: TTLCache[str, TickSize] = TTLCache(maxsize, ttl)
+        self.neg_risk: TTLCache[str, bool] = TTLCache(maxsize, ttl)
+        self.fee_rates: TTLCache[str, int] = TTLCache(maxsize, fee_rate_ttl)
+
+    def get_tick_size(self, token_id: str) -> TickSize | None:
+        return self.tick_sizes.get(token_id)
+
+    def set_tick_size(self, token_id: str, tick_size: TickSize) -> None:
+        self.tick_sizes.set(token_id, tick_size)
+
+    def get_neg_risk(self, token_id: str) -> bool | None:
+        return self.neg_risk.get(token_id)
+
+    def set_neg_risk(self, token_id: str, neg_risk: bool) -> None:
+        self.neg_risk.set(token_id, neg_risk)
+
+    def get_fee_rate_bps(self, token_id: str) -> int | None:
+        return self.fee_rates.get(token_id)
+
+    def set_fee_rate_bps(self, token_id: str, fee_rate_bps: int) -> None:
+        self.fee_rates.set(token_id, fee_rate_bps)
+
+    def invalidate(self, token_id: str) -> None:
+        self.tick_sizes.pop(token_id)
+        self.neg_risk.pop(token_id)
+        self.fee_rates.pop(token_id)
+
+    def clear(self) -> None:
+        self.tick_sizes.clear()
+        self.neg_risk.clear()
+        self.fee_rates.clear()
+
+    def warm(self, markets: Iterable[ClobMarket]) -> None:
+        """Populate tick size and neg risk for every token of the given ClobMarkets (e.g. pages from get_markets)."""
+        for market in markets:
+            tick_size = f"{market.minimum_tick_size:g}"
+            for token in market.token_ids:
+                if tick_size in TICK_SIZES:
+                    self.set_tick_size(token.token_id, cast("TickSize", tick_size))
+                self.set_neg_risk(token.token_id, market.neg_risk)
+
+    def warm_from_books(self, books: Iterable[OrderBookSummary]) -> None:
+        """Populate tick size and neg risk from order book snapshots that carry them."""
+        for book in books:
+            if book.tick_size is not None:
+                self.set_tick_size(book.token_id, book.tick_size)
+            if book.neg_risk is not None:
+                self.set_neg_risk(book.token_id, book.neg_risk)
+
+    def apply_tick_size_change(self, event: TickSizeChangeEvent) -> None:
+        self.set_tick_size(event.token_id, event.new_tick_size)
+
+    def process_market_message(self, text: str) -> None:
+        """Apply any tick_size_change event contained in a raw market websocket message."""
+        if "tick_size_change" not in text:
+            return
+        try:
+            message = json.loads(text)
+        except ValueError:
+            logger.warning("skipping undecodable market message")
+            return
+        for item in message if isinstance(message, list) else [message]:
+            try:
+                if item.get("event_type") == "tick_size_change":
+                    self.apply_tick_size_change(TickSizeChangeEvent(**item))
+            except (*SCHEMA_ERRORS, AttributeError):
+                logger.warning("skipping malformed tick_size_change: %r", item)
@@ -0,0 +1,458 @@
+import inspect
+import json
+import logging
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from lomond.events import Text
+from pydantic import ValidationError
+
+from ..types.clob_types import OrderBookSummary, OrderSummary, TickSize
+from ..types.websockets_types import (
+    MarketChannelEvent,
+    OrderBookSummaryEvent,
+    PriceChange,
+    PriceChangeEvent,
+    TickSizeChangeEvent,
+)
+from .fast_decode import SCHEMA_ERRORS, construct_market_item, loads
+from .order_builder.helpers import generate_orderbook_summary_hash
+
+logger = logging.getLogger(__name__)
+
+
+def _item_token_ids(item: Any) -> list[str]:
+    # best effort token ids of a raw market item that could not be decoded
+    if not isinstance(item, dict):
+        return []
+    token_ids = [item.get("asset_id")]
+    changes = item.get("price_changes", item.get("pc"))
+    if isinstance(changes, list):
+        token_ids += [
+            change.get("asset_id", change.get("a"))
+            for change in changes
+            if isinstance(change, dict)
+        ]
+    return [token_id for token_id in token_ids if isinstance(token_id, str)]
+
+
+class BookSide:
+    """One side of an L2 book: price -> size map plus the prices kept sorted ascending."""
+
+    def __init__(self, descending: bool):
+        # True for bids - the best level is the highest price
+        self.descending = descending
+        self.sizes: dict[float, float] = {}
+        self.prices: list[float] = []
+
+    def clear(self) -> None:
+        self.sizes.clear()
+        self.prices.clear()
+
+    def set(self, price: float, size: float) -> None:
+        if size <= 0:
+            if self.sizes.pop(price, None) is not None:
+                del self.prices[bisect_left(self.prices, price)]
+            return
+        if price not in self.sizes:
+            insort(self.prices, price)
+        self.sizes[price] = size
+
+    def best(self) -> Optional[OrderSummary]:
+        if not self.prices:
+            return None
+        price = self.prices[-1] if self.descending else self.prices[0]
+        return OrderSummary(price=price, size=self.sizes[price])
+
+    def best_price(self) -> Optional[float]:
+        if not self.prices:
+            return None
+        return self.prices[-1] if self.descending else self.prices[0]
+
+    def size_at(self, price: float) -> float:
+        return self.sizes.get(price, 0.0)
+
+    def rank(self, price: float) -> int:
+        """Number of levels strictly better than price (0 for the best level)."""
+        if self.descending:
+            return len(self.prices) - bisect_right(self.prices, price)
+        return bisect_left(self.prices, price)
+
+    def levels(self, depth: Optional[int] = None) -> list[OrderSummary]:
+        """Levels from best to worst, up to depth."""
+        prices = reversed(self.prices) if self.descending else iter(self.prices)
+        result: list[OrderSummary] = []
+        for price in prices:
+            if depth is not None and len(result) >= depth:
+                break
+            result.append(OrderSummary(price=price, size=self.sizes[price]))
+        return result
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+class LocalOrderBook:
+    """L2 order book for one token, built from a `book` snapshot and kept current with `price_change` deltas."""
+
+    def __init__(self, token_id: str, condition_id: Optional[str] = None):
+        self.token_id = token_id
+        self.condition_id = condition_id
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.timestamp: Optional[datetime] = None
+        self.hash: Optional[str] = None
+        self.tick_size: Optional[TickSize] = None
+        self.min_order_size: Optional[float] = None
+        self.neg_risk: Optional[bool] = None
+        self.last_trade_price: Optional[float] = None
+
+    def apply_snapshot(self, book: OrderBookSummary) -> None:
+        self.condition_id = book.condition_id
+        self.bids.clear()
+        self.asks.clear()
+        for level in book.bids:
+            self.bids.set(level.price, level.size)
+        for level in book.asks:
+            self.asks.set(level.price, level.size)
+        self.timestamp = book.timestamp
+        self.hash = book.hash
+        self.tick_size = book.tick_size
+        self.min_order_size = book.min_order_size
+        self.neg_risk = book.neg_risk
+        self.last_trade_price = book.last_trade_price
+
+    def apply_price_change(
+        self, change: PriceChange, timestamp: Optional[datetime] = None
+    ) -> None:
+        side = self.bids if change.side == "BUY" else self.asks
+        side.set(change.price, change.size)
+        if timestamp is not None:
+            self.timestamp = timestamp
+        self.hash = change.hash
+
+    def best_bid(self) -> Optional[OrderSummary]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[OrderSummary]:
+        return self.asks.best()
+
+    def midpoint(self) -> Optional[float]:
+        bid, ask = self.bids.best_price(), self.asks.best_price()
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.bids.best_price(), self.asks.best_price()
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    def size_at(self, side: Literal["BUY", "SELL"], price: float) -> float:
+        return (self.bids if side == "BUY" else self.asks).size_at(price)
+
+    def to_summary(self) -> OrderBookSummary:
+        """Snapshot in the same shape and level order as the REST/websocket books (worst to best)."""
+        if self.condition_id is None or self.timestamp is None:
+            msg = f"order book for {self.token_id} has not received a snapshot yet"
+            raise ValueError(msg)
+        return OrderBookSummary(
+            market=self.condition_id,
+            asset_id=self.token_id,
+            timestamp=self.timestamp,
+            hash=self.hash or "",
+            bids=[
+                OrderSummary(price=price, size=self.bids.sizes[price])
+                for price in self.bids.prices
+            ],
+            asks=[
+                OrderSummary(price=price, size=self.asks.sizes[price])
+                for price in reversed(self.asks.prices)
+            ],
+            tick_size=self.tick_size,
+            last_trade_price=self.last_trade_price,
+            min_order_size=self.min_order_size,
+            neg_risk=self.neg_risk,
+        )
+
+    def compute_hash(self) -> str:
+        return generate_orderbook_summary_hash(self.to_summary())
+
+    def verify(self, expected_hash: Optional[str] = None) -> bool:
+        """Check the local state against the server hash (defaults to the last hash received)."""
+        expected = expected_hash if expected_hash is not None else self.hash
+        return expected is not None and self.compute_hash() == expected
+
+
+class OrderBookManager:
+    """
+    Maintains a LocalOrderBook per token from market websocket messages.
+
+    Pass `manager.process_event` as the process_event callback of PolymarketWebsocketsClient.market_socket
+    (and `manager.on_reconnect` as its on_reconnect callback), or feed typed events to apply_event.
+    With verify_hashes, every verify_every-th delta of a token is checked against the server hash
+    (hashing rebuilds the whole book, so checking every delta costs O(book) per delta) and
+    mismatching tokens are collected in `mismatched` (and reported to on_mismatch) until a new
+    snapshot arrives.
+    Messages are decoded on the fast path (utilities.fast_decode) unless validate is set.
+
+    Reconnects and hash mismatches mark books stale: their deltas are buffered until a fresh
+    snapshot arrives - from the socket, or fetched in bulk with resync (e.g. a sync clob client's
+    get_order_books) on a worker thread - and then replayed in order on top of it. A token that
+    still mismatches after such a fresh snapshot is resynced no more and its hashes are no longer
+    checked (it is listed in `unverified`).
+    """
+
+    def __init__(
+        self,
+        verify_hashes: bool = False,
+        verify_every: int = 100,
+        on_update: Optional[Callable[[LocalOrderBook], None]] = None,
+        on_mismatch: Optional[Callable[[LocalOrderBook], None]] = None,
+        validate: bool = False,
+        resync: Optional[Callable[[list[str]], list[OrderBookSummary]]] = None,
+        max_buffered: int = 10_000,
+    ):
+        self.books: dict[str, LocalOrderBook] = {}
+        if verify_every < 1:
+            msg = f"verify_every must be positive, got {verify_every}"
+            raise ValueError(msg)
+        self.verify_hashes = verify_hashes
+        self.verify_every = verify_every
+        # deltas applied per token since its last hash check
+        self._unchecked: dict[str, int] = {}
+        self.validate = validate
+        self.on_update = on_update
+        self.on_mismatch = on_mismatch
+        self.mismatched: set[str] = set()
+        self.unverified: set[str] = set()
+        # tokens resynced after a mismatch and not verified since
+        self._resynced: set[str] = set()
+        if inspect.iscoroutinefunction(resync):
+            msg = "resync must be a sync callable (e.g. PolymarketClobClient.get_order_books)"
+            raise ValueError(msg)
+        self.resync = resync
+        self.max_buffered = max_buffered
+        self.stale: set[str] = set()
+        # deltas of stale tokens (with their event timestamp) in arrival order
+        self._buffered: dict[str, deque[tuple[PriceChange, datetime]]] = {}
+        # the socket thread and the resync worker both update books
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._resync_scheduled = False
+
+    def get(self, token_id: str) -> Optional[LocalOrderBook]:
+        return self.books.get(token_id)
+
+    def _book(
+        self, token_id: str, condition_id: Optional[str] = None
+    ) -> LocalOrderBook:
+        book = self.books.get(token_id)
+        if book is None:
+            book = LocalOrderBook(token_id, condition_id)
+            self.books[token_id] = book
+        return book
+
+    def apply_snapshot(self, snapshot: OrderBookSummary) -> LocalOrderBook:
+        with self._lock:
+            book = self._book(snapshot.token_id, snapshot.condition_id)
+            book.apply_snapshot(snapshot)
+            self.mismatched.discard(snapshot.token_id)
+            self._unchecked.pop(snapshot.token_id, None)
+            if snapshot.token_id in self.stale:
+                self._replay_buffered(book, snapshot.timestamp)
+            if self.on_update:
+                self.on_update(book)
+            return book
+
+    def _replay_buffered(self, book: LocalOrderBook, since: datetime) -> None:
+        self.stale.discard(book.token_id)
+        changes = self._buffered.pop(book.token_id, ())
+        replayed = False
+        for change, timestamp in changes:
+            # price changes set absolute sizes, so the ones from the snapshot's millisecond are safe to repeat
+            if timestamp >= since:
+                book.apply_price_change(change, timestamp)
+                replayed = True
+        if replayed and self._checks(book.token_id):
+            self._verify(book)
+
+    def apply_price_changes(self, event: PriceChangeEvent) -> None:
+        with self._lock:
+            for change in event.price_changes:
+                book = self.books.get(change.token_id)
+                if book is None or book.timestamp is None:
+                    # deltas are meaningless without a snapshot to apply them to
+                    continue
+                if change.token_id in self.stale:
+                    self._buffered[change.token_id].append((change, event.timestamp))
+                    continue
+                book.apply_price_change(change, event.timestamp)
+                if self._checks(change.token_id) and self._check_due(change.token_id):
+                    self._verify(book, change.hash)
+                if self.on_update:
+                    self.on_update(book)
+
+    def _checks(self, token_id: str) -> bool:
+        return self.verify_hashes and token_id not in self.unverified
+
+    def _verify(
+        self, book: LocalOrderBook, expected_hash: Optional[str] = None
+    ) -> None:
+        if book.verify(expected_hash):
+            self._resynced.discard(book.token_id)
+        else:
+            self._mismatch(book)
+
+    def _check_due(self, token_id: str) -> bool:
+        unchecked = self._unchecked.get(token_id, 0) + 1
+        if unchecked < self.verify_every:
+            self._unchecked[token_id] = unchecked
+            return False
+        self._unchecked[token_id] = 0
+        return True
+
+    def apply_tick_size_change(self, event: TickSizeChangeEvent) -> None:
+        with self._lock:
+            book = self.books.get(event.token_id)
+            if book is not None:
+                book.tick_size = event.new_tick_size
+
+    def apply_event(self, event: MarketChannelEvent) -> None:
+        """Apply a typed market event (e.g. from AsyncPolymarketWebsocketsClient.market_events), others are ignored."""
+        if isinstance(event, OrderBookSummaryEvent):
+            self.apply_snapshot(event)
+        elif isinstance(event, PriceChangeEvent):
+            self.apply_price_changes(event)
+        elif isinstance(event, TickSizeChangeEvent):
+            self.apply_tick_size_change(event)
+
+    def _mismatch(self, book: LocalOrderBook) -> None:
+        if book.token_id not in self.mismatched:
+            logger.warning("order book hash mismatch for token %s", book.token_id)
+        self.mismatched.add(book.token_id)
+        if self.on_mismatch:
+            self.on_mismatch(book)
+        if book.token_id in self._resynced:
+            # a fresh snapshot did not line up either, resyncing again would loop forever
+            self._resynced.discard(book.token_id)
+            self.unverified.add(book.token_id)
+            logger.warning(
+                "order book for token %s still mismatches after a resync, no longer verifying it",
+                book.token_id,
+            )
+            return
+        self._resynced.add(book.token_id)
+        self.mark_stale([book.token_id])
+
+    def mark_stale(self, token_ids: Iterable[str]) -> None:
+        """Hold back the deltas of token_ids until a fresh snapshot, fetched with resync if set."""
+        with self._lock:
+            for token_id in token_ids:
+                book = self.books.get(token_id)
+                if book is None or book.timestamp is None or token_id in self.stale:
+                    continue
+                self.stale.add(token_id)
+                self._buffered[token_id] = deque(maxlen=self.max_buffered)
+            if self.stale and self.resync is not None:
+                self._schedule_resync()
+
+    def on_reconnect(self) -> None:
+        """Deltas were missed while disconnected, every book is stale."""
+        self.mark_stale(list(self.books))
+
+    def _schedule_resync(self) -> None:
+        if self._resync_scheduled:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="order-book-resync"
+            )
+        self._resync_scheduled = True
+        self._executor.submit(self._background_resync)
+
+    def _background_resync(self) -> None:
+        with self._lock:
+            self._resync_scheduled = False
+        try:
+            self.resync_stale()
+        except Exception:
+            # the books stay stale until a socket snapshot or the next resync
+            logger.exception("order book resync failed")
+
+    def resync_stale(self) -> list[str]:
+        """Fetch snapshots of the stale tokens with resync and apply them, returns the resynced token ids."""
+        if self.resync is None:
+            msg = "resync_stale needs a resync callable (e.g. clob_client.get_order_books)"
+            raise ValueError(msg)
+        with self._lock:
+            token_ids = sorted(self.stale)
+        if not token_ids:
+            return []
+        snapshots = self.resync(token_ids)
+        if inspect.isawaitable(snapshots):
+            if inspect.iscoroutine(snapshots):
+                snapshots.close()
+            msg = "resync returned an awaitable, it must be a sync callable"
+            raise TypeError(msg)
+        resynced = []
+        for snapshot in snapshots:
+            with self._lock:
+                # skip tokens a socket snapshot already brought back in the meantime
+                if snapshot.token_id in self.stale:
+                    self.apply_snapshot(snapshot)
+                    resynced.append(snapshot.token_id)
+        return resynced
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _decode[M: (OrderBookSummaryEvent, PriceChangeEvent, TickSizeChangeEvent)](
+        self, item: dict[str, Any], model: type[M]
+    ) -> M:
+        if not self.validate:
+            try:
+                event = construct_market_item(item)
+            except SCHEMA_ERRORS:
+                event = None
+            if isinstance(event, model):
+                return event
+        return model(**item)
+
+    def _decode_item(self, item: dict[str, Any]) -> Optional[MarketChannelEvent]:
+        match item.get("event_type"):
+            case "book":
+                return self._decode(item, OrderBookSummaryEvent)
+            case "price_change":
+                return self._decode(item, PriceChangeEvent)
+            case "tick_size_change":
+                return self._decode(item, TickSizeChangeEvent)
+        return None
+
+    def process_message(self, message: dict | list) -> None:
+        for item in message if isinstance(message, list) else [message]:
+            try:
+                event = self._decode_item(item)
+            except (*SCHEMA_ERRORS, AttributeError, ValidationError):
+                # one malformed item must not take the socket down, but its token missed an update
+                logger.warning("skipping malformed market item: %r", item)
+                self.mark_stale(_item_token_ids(item))
+                continue
+            if event is not None:
+                self.apply_event(event)
+
+    def process_event(self, event: Text) -> None:
+        try:
+            message = json.loads(event.text) if self.validate else loads(event.text)
+        except json.JSONDecodeError:
+            # PONG and other non json frames
+            return
+        self.process_message(message)
@@ -1,3 +1,4 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Literal
 
 from ens.ens import ChecksumAddress
@@ -14,6 +15,7 @@ from py_order_utils.model import (
     SELL as UTILS_SELL,
 )
 from py_order_utils.signer import Signer as UtilsSigner
+from py_order_utils.utils import generate_seed
 
 from ...types.clob_types import (
     CreateOrderOptions,
@@ -24,6 +26,7 @@ from ...types.clob_types import (
     RoundConfig,
     TickSize,
 )
+from ..batching import chunked
 from ..config import get_contract_config
 from ..constants import BUY, SELL
 from ..exceptions import LiquidityError
@@ -61,6 +64,28 @@ class OrderBuilder:
         # Defaults to the address of the signer
         self.funder = funder if funder is not None else self.signer.address()
 
+        # py_order_utils builders keyed by (chain_id, neg_risk), one per exchange contract.
+        # Building one derives the signing account and the EIP-712 domain separator,
+        # so they are created up front and reused for every order
+        self._utils_signer = UtilsSigner(key=self.signer.private_key)
+        self._exchange_builders: dict[tuple[int, bool], UtilsOrderBuilder] = {}
+        for neg_risk in (False, True):
+            self.get_exchange_builder(neg_risk)
+
+    def get_exchange_builder(self, neg_risk: bool) -> UtilsOrderBuilder:
+        """Returns the cached py_order_utils builder for the (neg risk) exchange contract."""
+        key = (self.signer.get_chain_id(), neg_risk)
+        order_builder = self._exchange_builders.get(key)
+        if order_builder is None:
+            contract_config = get_contract_config(*key)
+            order_builder = UtilsOrderBuilder(
+                contract_config.exchange,
+                key[0],
+                self._utils_signer,
+            )
+            self._exchange_builders[key] = order_builder
+        return order_builder
+
     def get_order_amounts(
         self,
         side: str,
@@ -137,12 +162,24 @@ class OrderBuilder:
         msg = f"order_args.side must be '{BUY}' or '{SELL}'"
         raise ValueError(msg)
 
+    def _build_signed_order(
+        self, data: OrderData, neg_risk: bool, salt: int | None = None
+    ) -> SignedOrder:
+        order_builder = self.get_exchange_builder(neg_risk)
+        if salt is None:
+            return order_builder.build_signed_order(data)
+
+        order = order_builder.build_order(data)
+        order["salt"] = salt
+        return SignedOrder(order, order_builder.build_order_signature(order))
+
     def create_order(
         self,
         order_args: OrderArgs,
         options: CreateOrderOptions,
+        salt: int | None = None,
     ) -> SignedOrder:
-        """Creates and signs an order."""
+        """Creates and signs an order, with a random salt unless one is given."""
         side, maker_amount, taker_amount = self.get_order_amounts(
             order_args.side,
             order_args.size,
@@ -164,25 +201,15 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(),
-            options.neg_risk,
-        )
-
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
-
-        return order_builder.build_signed_order(data)
+        return self._build_signed_order(data, options.neg_risk, salt)
 
     def create_market_order(
         self,
         order_args: MarketOrderArgs,
         options: CreateOrderOptions,
+        salt: int | None = None,
     ) -> SignedOrder:
-        """Creates and signs a market order."""
+        """Creates and signs a market order, with a random salt unless one is given."""
         side, maker_amount, taker_amount = self.get_market_order_amounts(
             order_args.side,
             order_args.amount,
@@ -204,18 +231,80 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(),
-            options.neg_risk,
+        return self._build_signed_order(data, options.neg_risk, salt)
+
+    def signing_pool(
+        self, max_workers: int | None = None, processes: bool = True
+    ) -> Executor:
+        """
+        Creates an executor for create_orders.
+
+        A process pool initializes one OrderBuilder per worker process, so the key and EIP-712 domains
+        are set up once per worker instead of once per order. A thread pool shares this builder.
+        """
+        if not processes:
+            return ThreadPoolExecutor(max_workers=max_workers)
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_signing_worker,
+            initargs=(
+                self.signer.private_key,
+                self.signer.get_chain_id(),
+                self.sig_type,
+                self.funder,
+            ),
         )
 
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
+    def _signing_identity(self) -> tuple[str, int, int, str]:
+        # what a signing_pool worker signs with, checked per task against the submitting builder
+        return (
+            self.signer.address(),
             self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
+            self.sig_type,
+            self.funder,
         )
 
-        return order_builder.build_signed_order(data)
+    def sign_orders(
+        self, batch: list[tuple[OrderArgs, CreateOrderOptions, int]]
+    ) -> list[SignedOrder]:
+        return [
+            self.create_order(order_args, options, salt)
+            for order_args, options, salt in batch
+        ]
+
+    def create_orders(
+        self,
+        order_args: list[OrderArgs],
+        options: list[CreateOrderOptions],
+        executor: Executor | None = None,
+        batch_size: int = 25,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs many orders, optionally spread over an executor made by signing_pool.
+
+        Salts are drawn here in input order, so the result is identical to calling create_order
+        serially with the same salts, whichever executor is used.
+        """
+        batch = [
+            (args, opts, int(generate_seed()))
+            for args, opts in zip(order_args, options, strict=True)
+        ]
+        if executor is None:
+            return self.sign_orders(batch)
+
+        if isinstance(executor, ProcessPoolExecutor):
+            identity = self._signing_identity()
+            futures = [
+                executor.submit(_sign_in_worker, identity, part)
+                for part in chunked(batch, batch_size)
+            ]
+        else:
+            futures = [
+                executor.submit(self.sign_orders, part)
+                for part in chunked(batch, batch_size)
+            ]
+
+        return [order for future in futures for order in future.result()]
 
     def calculate_buy_market_price(
         self,
@@ -264,3 +353,31 @@ class OrderBuilder:
             raise ValueError(msg)
 
         return float(bids[0].price)
+
+
+# OrderBuilder of the current signing_pool worker process
+_worker_state: dict[str, OrderBuilder] = {}
+
+
+def _init_signing_worker(
+    private_key: str, chain_id: int, sig_type: int, funder: ChecksumAddress
+) -> None:
+    _worker_state["builder"] = OrderBuilder(
+        signer=Signer(private_key=private_key, chain_id=chain_id),
+        sig_type=sig_type,
+        funder=funder,
+    )
+
+
+def _sign_in_worker(
+    identity: tuple[str, int, int, str],
+    batch: list[tuple[OrderArgs, CreateOrderOptions, int]],
+) -> list[SignedOrder]:
+    builder = _worker_state.get("builder")
+    if builder is None:
+        msg = "signing worker is not initialized, create the executor with OrderBuilder.signing_pool()"
+        raise RuntimeError(msg)
+    if builder._signing_identity() != identity:  # noqa: SLF001
+        msg = "signing pool belongs to another OrderBuilder (signer, chain, signature type or funder differ), create it with this builder's signing_pool()"
+        raise ValueError(msg)
+    return builder.sign_orders(batch)
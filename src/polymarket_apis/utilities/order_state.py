@@ -0,0 +1,509 @@
+import inspect
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from lomond.events import Text
+
+from ..types.clob_types import OpenOrder
+from ..types.websockets_types import OrderEvent, TradeEvent, UserChannelEvent
+from .fast_decode import SCHEMA_ERRORS, construct_user_item, loads
+
+logger = logging.getLogger(__name__)
+
+# trade statuses after which a fill no longer changes
+_FINAL_TRADE_STATUSES = {"CONFIRMED", "FAILED"}
+
+
+class TrackedOrder:
+    """Current state of one of our orders."""
+
+    __slots__ = (
+        "condition_id",
+        "created_at",
+        "expiration",
+        "order_id",
+        "order_type",
+        "original_size",
+        "outcome",
+        "price",
+        "side",
+        "size_matched",
+        "status",
+        "token_id",
+        "trade_ids",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        order_id: str,
+        token_id: str,
+        condition_id: str,
+        side: Literal["BUY", "SELL"],
+        price: float,
+        original_size: float,
+        size_matched: float,
+        status: str,
+        outcome: str,
+        order_type: str,
+        created_at: Optional[datetime] = None,
+        expiration: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        trade_ids: Optional[list[str]] = None,
+    ):
+        self.order_id = order_id
+        self.token_id = token_id
+        self.condition_id = condition_id
+        self.side = side
+        self.price = price
+        self.original_size = original_size
+        self.size_matched = size_matched
+        self.status = status
+        self.outcome = outcome
+        self.order_type = order_type
+        self.created_at = created_at
+        self.expiration = expiration
+        self.updated_at = updated_at
+        self.trade_ids = trade_ids if trade_ids is not None else []
+
+    @classmethod
+    def from_open_order(cls, order: OpenOrder) -> "TrackedOrder":
+        return cls(
+            order.order_id,
+            order.token_id,
+            order.condition_id,
+            order.side,
+            order.price,
+            order.original_size,
+            order.size_matched,
+            order.status,
+            order.outcome,
+            order.order_type,
+            order.created_at,
+            order.expiration,
+            trade_ids=list(order.associate_trades or []),
+        )
+
+    @property
+    def remaining(self) -> float:
+        return max(self.original_size - self.size_matched, 0.0)
+
+    @property
+    def is_open(self) -> bool:
+        return self.status == "LIVE" and self.remaining > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"TrackedOrder(order_id={self.order_id!r}, token_id={self.token_id!r}, "
+            f"side={self.side}, price={self.price}, size_matched={self.size_matched}/"
+            f"{self.original_size}, status={self.status})"
+        )
+
+
+class Fill:
+    """Our side of a trade - the taker order or one of the maker orders."""
+
+    __slots__ = (
+        "condition_id",
+        "last_update",
+        "match_time",
+        "order_id",
+        "outcome",
+        "price",
+        "side",
+        "size",
+        "status",
+        "token_id",
+        "trade_id",
+    )
+
+    def __init__(
+        self,
+        trade_id: str,
+        order_id: str,
+        token_id: str,
+        condition_id: str,
+        side: Literal["BUY", "SELL"],
+        price: float,
+        size: float,
+        outcome: str,
+        status: str,
+        match_time: Optional[datetime] = None,
+        last_update: Optional[datetime] = None,
+    ):
+        self.trade_id = trade_id
+        self.order_id = order_id
+        self.token_id = token_id
+        self.condition_id = condition_id
+        self.side = side
+        self.price = price
+        self.size = size
+        self.outcome = outcome
+        self.status = status
+        self.match_time = match_time
+        self.last_update = last_update
+
+    @property
+    def signed_size(self) -> float:
+        """Position change in the token, 0 for failed trades."""
+        if self.status == "FAILED":
+            return 0.0
+        return self.size if self.side == "BUY" else -self.size
+
+    def __repr__(self) -> str:
+        return (
+            f"Fill(trade_id={self.trade_id!r}, order_id={self.order_id!r}, "
+            f"side={self.side}, price={self.price}, size={self.size}, status={self.status})"
+        )
+
+
+def _opposite(side: Literal["BUY", "SELL"]) -> Literal["BUY", "SELL"]:
+    return "SELL" if side == "BUY" else "BUY"
+
+
+class OrderStateStore:
+    """
+    Our open orders and fills, kept up to date from user websocket events.
+
+    Seed it once with load() (fetch_orders is e.g. a clob client's get_orders) or seed(), then pass
+    `store.process_event` as the process_event callback of PolymarketWebsocketsClient.user_socket
+    (and `store.on_reconnect` as its on_reconnect callback to re-seed after missed events), or feed
+    typed events to apply_event. Open orders are indexed by order id, token and market, positions
+    are the net size of our fills per token - all O(1) lookups without polling /data/orders.
+
+    With AsyncPolymarketWebsocketsClient.user_events, pass an async fetch_orders (e.g. an async
+    clob client's get_orders), seed with `await store.aload()` and pass `on_reconnect=store.aon_reconnect`
+    so the REST call does not block the event loop.
+
+    A re-seed that fails on reconnect is logged and leaves `stale` set until the next successful load.
+    Our side of a trade is found by order id, or by api_key for orders the store has not seen.
+    Closed orders and settled fills are kept for the last max_history entries.
+    """
+
+    def __init__(
+        self,
+        fetch_orders: Optional[
+            Callable[[], list[OpenOrder]] | Callable[[], Awaitable[list[OpenOrder]]]
+        ] = None,
+        api_key: Optional[str] = None,
+        on_order: Optional[Callable[[TrackedOrder], None]] = None,
+        on_fill: Optional[Callable[[Fill], None]] = None,
+        validate: bool = False,
+        max_history: int = 10_000,
+    ):
+        self.fetch_orders = fetch_orders
+        self.api_key = api_key
+        self.on_order = on_order
+        self.on_fill = on_fill
+        self.validate = validate
+        self.max_history = max_history
+        self.orders: dict[str, TrackedOrder] = {}
+        # order ids of the open orders per token / market
+        self.by_token: dict[str, set[str]] = {}
+        self.by_market: dict[str, set[str]] = {}
+        # trade id -> our fills in it
+        self.fills: OrderedDict[str, list[Fill]] = OrderedDict()
+        self.positions: dict[str, float] = {}
+        self._closed: OrderedDict[str, None] = OrderedDict()
+        # events may have been missed since the last successful load
+        self.stale = False
+        # the socket thread and callers of load() both update the state
+        self._lock = threading.RLock()
+
+    def get(self, order_id: str) -> Optional[TrackedOrder]:
+        return self.orders.get(order_id)
+
+    def open_orders(
+        self, token_id: Optional[str] = None, condition_id: Optional[str] = None
+    ) -> list[TrackedOrder]:
+        """Open orders, of one token or market if given."""
+        with self._lock:
+            if token_id is not None:
+                order_ids: Iterable[str] = self.by_token.get(token_id, ())
+            elif condition_id is not None:
+                order_ids = self.by_market.get(condition_id, ())
+            else:
+                return [order for order in self.orders.values() if order.is_open]
+            return [self.orders[order_id] for order_id in order_ids]
+
+    def open_size(self, token_id: str, side: Literal["BUY", "SELL"]) -> float:
+        """Unfilled size of our open orders on one side of a token."""
+        with self._lock:
+            return sum(
+                self.orders[order_id].remaining
+                for order_id in self.by_token.get(token_id, ())
+                if self.orders[order_id].side == side
+            )
+
+    def position(self, token_id: str) -> float:
+        """Net size bought minus sold through the fills seen so far."""
+        return self.positions.get(token_id, 0.0)
+
+    def _index(self, order: TrackedOrder) -> None:
+        if order.is_open:
+            self.by_token.setdefault(order.token_id, set()).add(order.order_id)
+            self.by_market.setdefault(order.condition_id, set()).add(order.order_id)
+            self._closed.pop(order.order_id, None)
+            return
+        for index, key in (
+            (self.by_token, order.token_id),
+            (self.by_market, order.condition_id),
+        ):
+            order_ids = index.get(key)
+            if order_ids is not None:
+                order_ids.discard(order.order_id)
+                if not order_ids:
+                    del index[key]
+        self._closed[order.order_id] = None
+        while len(self._closed) > self.max_history:
+            self.orders.pop(self._closed.popitem(last=False)[0], None)
+
+    def seed(self, orders: Iterable[OpenOrder]) -> None:
+        """Replace the open orders with a REST snapshot, open orders missing from it are dropped."""
+        with self._lock:
+            seeded = {order.order_id: order for order in orders}
+            for order_id in [
+                order_id
+                for order_id, order in self.orders.items()
+                if order.is_open and order_id not in seeded
+            ]:
+                order = self.orders[order_id]
+                # filled or canceled while we were not listening
+                order.status = "UNKNOWN"
+                self._index(order)
+            for order_id, open_order in seeded.items():
+                order = TrackedOrder.from_open_order(open_order)
+                known = self.orders.get(order_id)
+                if known is not None:
+                    order.size_matched = max(order.size_matched, known.size_matched)
+                    order.updated_at = known.updated_at
+                self.orders[order_id] = order
+                self._index(order)
+
+    def _fetch(self) -> list[OpenOrder] | Awaitable[list[OpenOrder]]:
+        if self.fetch_orders is None:
+            msg = "load needs a fetch_orders callable (e.g. clob_client.get_orders)"
+            raise ValueError(msg)
+        return self.fetch_orders()
+
+    def load(self) -> None:
+        """Seed from a sync fetch_orders."""
+        orders = self._fetch()
+        if inspect.isawaitable(orders):
+            if inspect.iscoroutine(orders):
+                orders.close()
+            msg = "fetch_orders is async, use aload()"
+            raise TypeError(msg)
+        self.seed(orders)
+        self.stale = False
+
+    async def aload(self) -> None:
+        """Seed from fetch_orders, awaiting it if it is async."""
+        orders = self._fetch()
+        if inspect.isawaitable(orders):
+            orders = await orders
+        self.seed(orders)
+        self.stale = False
+
+    def on_reconnect(self) -> None:
+        """Events were missed while disconnected, re-seed the open orders if fetch_orders is set."""
+        self.stale = True
+        if self.fetch_orders is None:
+            return
+        try:
+            self.load()
+        except Exception:
+            # keep the socket running, the open orders stay stale until the next load()
+            logger.exception("re-seeding the open orders failed")
+
+    async def aon_reconnect(self) -> None:
+        """on_reconnect for AsyncPolymarketWebsocketsClient.user_events, see on_reconnect."""
+        self.stale = True
+        if self.fetch_orders is None:
+            return
+        try:
+            await self.aload()
+        except Exception:
+            logger.exception("re-seeding the open orders failed")
+
+    def apply_order(self, event: OrderEvent) -> TrackedOrder:
+        """Apply a PLACEMENT / UPDATE / CANCELLATION event."""
+        with self._lock:
+            order = self.orders.get(event.order_id)
+            if order is None:
+                order = TrackedOrder(
+                    event.order_id,
+                    event.token_id,
+                    event.condition_id,
+                    event.side,
+                    event.price,
+                    event.original_size,
+                    event.size_matched,
+                    event.status,
+                    event.outcome,
+                    event.order_type,
+                    event.created_at,
+                    event.expiration,
+                )
+                self.orders[event.order_id] = order
+            elif (
+                event.timestamp is not None
+                and order.updated_at is not None
+                and event.timestamp < order.updated_at
+            ):
+                # an older event delivered late, the state is already newer
+                return order
+            else:
+                # matched size never goes down, a late UPDATE must not undo a fill
+                order.size_matched = max(order.size_matched, event.size_matched)
+                order.original_size = event.original_size
+                if order.status != "CANCELED":
+                    order.status = event.status
+            if event.type == "CANCELLATION":
+                order.status = "CANCELED"
+            elif order.status == "LIVE" and order.remaining <= 0:
+                order.status = "MATCHED"
+            order.updated_at = event.timestamp or order.updated_at
+            for trade_id in event.associated_trades or ():
+                if trade_id not in order.trade_ids:
+                    order.trade_ids.append(trade_id)
+            self._index(order)
+        if self.on_order:
+            self.on_order(order)
+        return order
+
+    def _our_fills(self, event: TradeEvent) -> list[Fill]:
+        fills = []
+        taker_is_ours = False
+        for maker in event.maker_orders:
+            order = self.orders.get(maker.order_id)
+            if order is None and (self.api_key is None or maker.owner != self.api_key):
+                continue
+            if order is not None:
+                side = order.side
+            else:
+                # a maker on the same outcome takes the other side, on the complement the same side
+                side = (
+                    _opposite(event.side)
+                    if maker.outcome == event.outcome
+                    else event.side
+                )
+            fills.append(
+                Fill(
+                    event.trade_id,
+                    maker.order_id,
+                    maker.token_id,
+                    event.condition_id,
+                    side,
+                    maker.price,
+                    maker.matched_amount,
+                    maker.outcome,
+                    event.status,
+                    event.matchtime,
+                    event.last_update,
+                )
+            )
+        if event.taker_order_id in self.orders:
+            taker_is_ours = True
+        elif self.api_key is not None and not fills:
+            taker_is_ours = event.trade_owner == self.api_key
+        if taker_is_ours:
+            fills.append(
+                Fill(
+                    event.trade_id,
+                    event.taker_order_id,
+                    event.token_id,
+                    event.condition_id,
+                    event.side,
+                    event.price,
+                    event.size,
+                    event.outcome,
+                    event.status,
+                    event.matchtime,
+                    event.last_update,
+                )
+            )
+        return fills
+
+    def apply_trade(self, event: TradeEvent) -> list[Fill]:
+        """Apply a MATCHED / MINED / CONFIRMED / RETRYING / FAILED event, returns our fills in it."""
+        with self._lock:
+            fills = self.fills.get(event.trade_id)
+            if fills is None:
+                fills = self._our_fills(event)
+                if not fills:
+                    return []
+                self.fills[event.trade_id] = fills
+                for fill in fills:
+                    self.positions[fill.token_id] = (
+                        self.positions.get(fill.token_id, 0.0) + fill.signed_size
+                    )
+                    order = self.orders.get(fill.order_id)
+                    if order is not None and event.trade_id not in order.trade_ids:
+                        order.trade_ids.append(event.trade_id)
+                while len(self.fills) > self.max_history:
+                    oldest = next(iter(self.fills.values()))
+                    if oldest[0].status not in _FINAL_TRADE_STATUSES:
+                        break
+                    self.fills.popitem(last=False)
+            elif fills[0].status in _FINAL_TRADE_STATUSES:
+                return fills
+            else:
+                for fill in fills:
+                    before = fill.signed_size
+                    fill.status = event.status
+                    fill.last_update = event.last_update
+                    self.positions[fill.token_id] = (
+                        self.positions.get(fill.token_id, 0.0)
+                        + fill.signed_size
+                        - before
+                    )
+        if self.on_fill:
+            for fill in fills:
+                self.on_fill(fill)
+        return fills
+
+    def apply_event(self, event: UserChannelEvent) -> None:
+        if isinstance(event, OrderEvent):
+            self.apply_order(event)
+        elif isinstance(event, TradeEvent):
+            self.apply_trade(event)
+
+    def _decode(self, item: dict[str, Any]) -> Optional[UserChannelEvent]:
+        if not self.validate:
+            try:
+                event = construct_user_item(item)
+            except SCHEMA_ERRORS:
+                event = None
+            if event is not None:
+                return event
+        match item.get("event_type"):
+            case "order":
+                return OrderEvent(**item)
+            case "trade":
+                return TradeEvent(**item)
+        return None
+
+    def process_message(self, message: dict | list) -> None:
+        for item in message if isinstance(message, list) else [message]:
+            try:
+                event = self._decode(item)
+            except (*SCHEMA_ERRORS, AttributeError):
+                # one malformed item must not take the socket down
+                logger.warning("skipping malformed user item: %r", item)
+                continue
+            if event is not None:
+                self.apply_event(event)
+
+    def process_event(self, event: Text) -> None:
+        try:
+            message = json.loads(event.text) if self.validate else loads(event.text)
+        except json.JSONDecodeError:
+            # PONG and other non json frames
+            return
+        self.process_message(message)
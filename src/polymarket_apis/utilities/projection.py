@@ -0,0 +1,94 @@
+"""
+Slim ("lite") pydantic models holding a chosen subset of a model's fields.
+
+project_model(GammaMarket, ["id", "slug", "token_ids"]) builds - once, the result is cached - a
+model with only those fields, their aliases and field validators, so validating a payload skips
+every other key. Nested models are projected with dotted paths: project_model(Event, ["id",
+"markets.id", "markets.token_ids"]) keeps full Event.markets items out of memory as well.
+"""
+
+import types
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel, create_model, field_validator
+
+
+def _nested_model(annotation: Any) -> Optional[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _replace(annotation: Any, old: type[BaseModel], new: type[BaseModel]) -> Any:
+    # swap the nested model inside Optional[...] / list[...] annotations
+    if annotation is old:
+        return new
+    origin = get_origin(annotation)
+    if origin in {Union, types.UnionType}:
+        return Union[tuple(_replace(arg, old, new) for arg in get_args(annotation))]
+    if origin is list:
+        return list[_replace(get_args(annotation)[0], old, new)]  # type: ignore[misc]
+    return annotation
+
+
+def _field_names(model: type[BaseModel]) -> dict[str, str]:
+    # python name or alias -> python name
+    names = {}
+    for name, field in model.model_fields.items():
+        names[name] = name
+        if field.alias is not None:
+            names[field.alias] = name
+    return names
+
+
+@lru_cache(maxsize=256)
+def _project(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    names = _field_names(model)
+    selected: dict[str, set[str]] = {}
+    for path in fields:
+        head, _, rest = path.partition(".")
+        if head not in names:
+            msg = f"{model.__name__} has no field {head!r}"
+            raise ValueError(msg)
+        nested = selected.setdefault(names[head], set())
+        if rest:
+            nested.add(rest)
+    definitions: dict[str, Any] = {}
+    for name, nested in selected.items():
+        field = model.model_fields[name]
+        annotation = field.annotation
+        if nested:
+            inner = _nested_model(annotation)
+            if inner is None:
+                msg = f"{model.__name__}.{name} is not a model, cannot select {sorted(nested)}"
+                raise ValueError(msg)
+            annotation = _replace(annotation, inner, _project(inner, frozenset(nested)))
+        definitions[name] = (annotation, field)
+    validators: dict[str, Any] = {}
+    decorators = model.__pydantic_decorators__.field_validators
+    for decorator_name, decorator in decorators.items():
+        kept = [name for name in decorator.info.fields if name in selected]
+        if kept:
+            func = getattr(decorator.func, "__func__", decorator.func)
+            validators[decorator_name] = field_validator(
+                *kept, mode=decorator.info.mode
+            )(classmethod(func))
+    return create_model(  # type: ignore[call-overload,no-any-return]
+        f"{model.__name__}Lite",
+        __config__=model.model_config,
+        __doc__=f"{model.__name__} projected on {', '.join(sorted(fields))}.",
+        __module__=model.__module__,
+        __validators__=validators,
+        **definitions,
+    )
+
+
+def project_model(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """Cached slim version of model with only fields (python names or aliases, dotted for nested models)."""
+    return _project(model, frozenset(fields))
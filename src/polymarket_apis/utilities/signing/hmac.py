@@ -22,3 +22,26 @@ def build_hmac_signature(
 
     # ensure base64 encoded
     return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
+
+
+class HmacSigner:
+    """HMAC-SHA256 signer for one api secret - the secret is decoded and keyed once, each signature copies the keyed state."""
+
+    def __init__(self, secret: str):
+        self._prototype = hmac.new(
+            base64.urlsafe_b64decode(secret), digestmod=hashlib.sha256
+        )
+
+    def sign(
+        self,
+        timestamp: str,
+        method: str,
+        request_path: str,
+        body: bytes | None = None,
+    ) -> str:
+        """Sign timestamp + method + path + the exact body bytes sent on the wire."""
+        h = self._prototype.copy()
+        h.update(f"{timestamp}{method}{request_path}".encode())
+        if body:
+            h.update(body)
+        return base64.urlsafe_b64encode(h.digest()).decode("utf-8")
@@ -0,0 +1,216 @@
+"""
+Append only log of raw websocket frames, for deterministic replays and offline benchmarks.
+
+Layout: an 8 byte header (magic + version) followed by records of
+`<d receive time> <B flags> <I length> <payload>`, little endian. The low bits of flags are the
+channel (see CHANNELS), the high bit marks a zlib compressed payload. A record cut short by a
+crash is ignored on replay.
+"""
+
+import asyncio
+import mmap
+import struct
+import threading
+import time
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from typing import Literal, NamedTuple, Optional, Self
+
+from lomond.events import Text
+
+Channel = Literal["market", "user", "live_data"]
+
+CHANNELS: tuple[Channel, ...] = ("market", "user", "live_data")
+MAGIC = b"PMWSLOG\x01"
+
+_RECORD = struct.Struct("<dBI")
+_COMPRESSED = 0x80
+# keys that repeat in every frame, compressing single frames against them saves most of the size
+_ZDICT = (
+    b'"event_type":"price_change","market":"0x","price_changes":[{"asset_id":"'
+    b'"price":"0.","size":"","side":"BUY","side":"SELL","hash":"'
+    b'"best_bid":"0.","best_ask":"0.","timestamp":"'
+    b'"event_type":"book","bids":[{"price":"0.","size":"'
+    b'"asks":[{"price":"0.","size":"","tick_size":"0.01","last_trade_price":"'
+    b'"event_type":"last_trade_price","fee_rate_bps":"0"'
+)
+
+
+class LogRecord(NamedTuple):
+    received_time: float
+    channel: Channel
+    text: str
+
+
+class StreamRecorder:
+    """
+    Thread safe writer of a stream log.
+
+    Use `recorder.tap(process_event, "market")` as the process_event callback of a
+    PolymarketWebsocketsClient socket to record frames before they are processed, or call
+    write() directly (e.g. with the raw text of AsyncPolymarketWebsocketsClient.messages()).
+    """
+
+    def __init__(
+        self, path: str | Path, compress: bool = False, min_compress_size: int = 256
+    ):
+        self.path = Path(path)
+        self.compress = compress
+        # small frames (PONG, single price changes) barely shrink, store them as is
+        self.min_compress_size = min_compress_size
+        self._lock = threading.Lock()
+        self._file = self.path.open("ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        else:
+            _check_header(self.path)
+
+    def write(
+        self,
+        text: str,
+        channel: Channel = "market",
+        received_time: Optional[float] = None,
+    ) -> None:
+        payload = text.encode("utf-8")
+        flags = CHANNELS.index(channel)
+        if self.compress and len(payload) >= self.min_compress_size:
+            compressor = zlib.compressobj(zdict=_ZDICT)
+            payload = compressor.compress(payload) + compressor.flush()
+            flags |= _COMPRESSED
+        header = _RECORD.pack(
+            received_time if received_time is not None else time.time(),
+            flags,
+            len(payload),
+        )
+        with self._lock:
+            self._file.write(header + payload)
+
+    def tap(
+        self,
+        process_event: Optional[Callable[[Text], None]] = None,
+        channel: Channel = "market",
+    ) -> Callable[[Text], None]:
+        """process_event callback that records every frame, then passes it on to process_event."""
+
+        def record(event: Text) -> None:
+            self.write(event.text, channel, event.received_time)
+            if process_event is not None:
+                process_event(event)
+
+        return record
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+
+def _check_header(path: Path) -> None:
+    with path.open("rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            msg = f"{path} is not a websocket stream log"
+            raise ValueError(msg)
+
+
+class StreamReplayer:
+    """
+    Memory mapped reader of a stream log.
+
+    replay() feeds the recorded frames to process_event callbacks as lomond Text events (with the
+    recorded received_time), at the original pace (speed=1), accelerated (speed=10) or as fast as
+    possible (speed=None).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        _check_header(self.path)
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return self.records()
+
+    def records(self, channel: Optional[Channel] = None) -> Iterator[LogRecord]:
+        with (
+            self.path.open("rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            offset = len(MAGIC)
+            end = len(data)
+            while offset + _RECORD.size <= end:
+                received_time, flags, length = _RECORD.unpack_from(data, offset)
+                offset += _RECORD.size
+                if offset + length > end:
+                    # truncated by a crash while writing
+                    break
+                record_channel = CHANNELS[flags & ~_COMPRESSED]
+                if channel is None or record_channel == channel:
+                    payload = data[offset : offset + length]
+                    if flags & _COMPRESSED:
+                        decompressor = zlib.decompressobj(zdict=_ZDICT)
+                        payload = decompressor.decompress(payload)
+                    yield LogRecord(received_time, record_channel, payload.decode())
+                offset += length
+
+    def replay(
+        self,
+        process_event: Callable[[Text], None],
+        channel: Optional[Channel] = None,
+        speed: Optional[float] = None,
+    ) -> int:
+        """Feed the recorded frames (of channel) to process_event, returns the number of frames."""
+        frames = 0
+        pace = _Pace(speed)
+        for record in self.records(channel):
+            pace.wait(record.received_time)
+            event = Text(record.text)
+            event.received_time = record.received_time
+            process_event(event)
+            frames += 1
+        return frames
+
+    async def areplay(
+        self, channel: Optional[Channel] = None, speed: Optional[float] = None
+    ) -> AsyncIterator[LogRecord]:
+        """Recorded frames as an async iterator, paced like replay()."""
+        pace = _Pace(speed)
+        for record in self.records(channel):
+            delay = pace.delay(record.received_time)
+            # yield to the loop even without a delay so other tasks keep running
+            await asyncio.sleep(delay)
+            yield record
+
+
+class _Pace:
+    # maps recorded receive times onto the monotonic clock, divided by speed
+
+    def __init__(self, speed: Optional[float]):
+        if speed is not None and speed <= 0:
+            msg = f"speed must be positive (or None for no pacing), got {speed}"
+            raise ValueError(msg)
+        self.speed = speed
+        self.first_received: Optional[float] = None
+        self.started = 0.0
+
+    def delay(self, received_time: float) -> float:
+        if self.speed is None:
+            return 0.0
+        if self.first_received is None:
+            self.first_received = received_time
+            self.started = time.monotonic()
+            return 0.0
+        due = self.started + (received_time - self.first_received) / self.speed
+        return max(due - time.monotonic(), 0.0)
+
+    def wait(self, received_time: float) -> None:
+        delay = self.delay(received_time)
+        if delay > 0:
+            time.sleep(delay)
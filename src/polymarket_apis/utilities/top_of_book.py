@@ -0,0 +1,259 @@
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from datetime import datetime
+from typing import Any, Optional
+
+from lomond.events import Text
+
+from ..types.websockets_types import (
+    BestBidAskEvent,
+    MarketChannelEvent,
+    OrderBookSummaryEvent,
+    PriceChangeEvent,
+)
+from .fast_decode import SCHEMA_ERRORS, loads, unix_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _best(prices: Iterable[float], highest: bool) -> Optional[float]:
+    prices = list(prices)
+    if not prices:
+        return None
+    return max(prices) if highest else min(prices)
+
+
+class TopOfBook:
+    """Best bid and ask of one token."""
+
+    __slots__ = ("best_ask", "best_bid", "timestamp", "token_id")
+
+    def __init__(
+        self,
+        token_id: str,
+        best_bid: Optional[float],
+        best_ask: Optional[float],
+        timestamp: Optional[datetime] = None,
+    ):
+        self.token_id = token_id
+        self.best_bid = best_bid
+        self.best_ask = best_ask
+        self.timestamp = timestamp
+
+    def midpoint(self) -> Optional[float]:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    def spread(self) -> Optional[float]:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask - self.best_bid
+
+    def copy(self) -> "TopOfBook":
+        return TopOfBook(self.token_id, self.best_bid, self.best_ask, self.timestamp)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TopOfBook):
+            return NotImplemented
+        return (
+            self.token_id == other.token_id
+            and self.best_bid == other.best_bid
+            and self.best_ask == other.best_ask
+            and self.timestamp == other.timestamp
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"TopOfBook(token_id={self.token_id!r}, best_bid={self.best_bid}, "
+            f"best_ask={self.best_ask}, timestamp={self.timestamp})"
+        )
+
+
+class TopOfBookConflator:
+    """
+    Latest best bid/ask per token from the market channel, published as batches of changed tokens.
+
+    Every book / price_change / best_bid_ask update only overwrites the token's entry, so consumers
+    see at most one update per token per publish however bursty the feed is. Publish on demand with
+    changed(), every interval seconds on a thread with start(), or as an async iterator with stream().
+
+    Pass `conflator.process_event` as the process_event callback of PolymarketWebsocketsClient.market_socket,
+    raw frames are read without building event models.
+    """
+
+    def __init__(self) -> None:
+        self.latest: dict[str, TopOfBook] = {}
+        self.updates = 0
+        self.published = 0
+        # tokens changed since the last publish, insertion ordered
+        self._changed: dict[str, None] = {}
+        self._lock = threading.Lock()
+        self._publisher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def set(
+        self,
+        token_id: str,
+        best_bid: Optional[float],
+        best_ask: Optional[float],
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        with self._lock:
+            self.updates += 1
+            top = self.latest.get(token_id)
+            if top is None:
+                self.latest[token_id] = TopOfBook(
+                    token_id, best_bid, best_ask, timestamp
+                )
+            elif top.best_bid != best_bid or top.best_ask != best_ask:
+                top.best_bid = best_bid
+                top.best_ask = best_ask
+                top.timestamp = timestamp
+            else:
+                top.timestamp = timestamp
+                return
+            self._changed[token_id] = None
+
+    def update(self, event: MarketChannelEvent) -> None:
+        """Apply a typed market event, types without top of book information are ignored."""
+        if isinstance(event, BestBidAskEvent):
+            self.set(event.token_id, event.best_bid, event.best_ask, event.timestamp)
+        elif isinstance(event, PriceChangeEvent):
+            for change in event.price_changes:
+                self.set(
+                    change.token_id, change.best_bid, change.best_ask, event.timestamp
+                )
+        elif isinstance(event, OrderBookSummaryEvent):
+            self.set(
+                event.token_id,
+                _best((level.price for level in event.bids), highest=True),
+                _best((level.price for level in event.asks), highest=False),
+                event.timestamp,
+            )
+
+    def process_message(self, message: dict[str, Any] | list[Any]) -> None:
+        for item in message if isinstance(message, list) else [message]:
+            try:
+                self._apply_item(item)
+            except (*SCHEMA_ERRORS, AttributeError):
+                # one malformed item must not take the socket down
+                logger.warning("skipping malformed market item: %r", item)
+
+    def _apply_item(self, item: dict[str, Any]) -> None:
+        match item.get("event_type"):
+            case "best_bid_ask":
+                self.set(
+                    item["asset_id"],
+                    float(item["best_bid"]),
+                    float(item["best_ask"]),
+                    unix_datetime(item["timestamp"]),
+                )
+            case "price_change":
+                short = "price_changes" not in item
+                timestamp = unix_datetime(item["t" if short else "timestamp"])
+                for change in item["pc" if short else "price_changes"]:
+                    try:
+                        self.set(
+                            change["a" if short else "asset_id"],
+                            float(change["bb" if short else "best_bid"]),
+                            float(change["ba" if short else "best_ask"]),
+                            timestamp,
+                        )
+                    except SCHEMA_ERRORS:
+                        logger.warning("skipping malformed price change: %r", change)
+            case "book":
+                self.set(
+                    item["asset_id"],
+                    _best(
+                        (float(level["price"]) for level in item["bids"]),
+                        highest=True,
+                    ),
+                    _best(
+                        (float(level["price"]) for level in item["asks"]),
+                        highest=False,
+                    ),
+                    unix_datetime(item["timestamp"]),
+                )
+
+    def process_event(self, event: Text) -> None:
+        try:
+            message = loads(event.text)
+        except json.JSONDecodeError:
+            # PONG and other non json frames
+            return
+        self.process_message(message)
+
+    def changed(self) -> dict[str, TopOfBook]:
+        """Copies of the tokens changed since the previous call, empty if none did."""
+        with self._lock:
+            if not self._changed:
+                return {}
+            changed = {
+                token_id: self.latest[token_id].copy() for token_id in self._changed
+            }
+            self._changed.clear()
+            self.published += len(changed)
+            return changed
+
+    def start(
+        self, on_publish: Callable[[dict[str, TopOfBook]], None], interval: float = 0.1
+    ) -> None:
+        """Call on_publish with the changed tokens every interval seconds (skipped when nothing changed)."""
+        if self._publisher is not None:
+            msg = "publisher already running"
+            raise RuntimeError(msg)
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                changed = self.changed()
+                if changed:
+                    try:
+                        on_publish(changed)
+                    except Exception:
+                        # keep publishing, a dead thread would look like a running publisher
+                        logger.exception("top of book on_publish failed")
+
+        self._publisher = threading.Thread(
+            target=run, name="top-of-book-publisher", daemon=True
+        )
+        self._publisher.start()
+
+    def stop(self) -> None:
+        if self._publisher is not None:
+            self._stop.set()
+            self._publisher.join()
+            self._publisher = None
+
+    async def stream(
+        self, events: AsyncIterator[MarketChannelEvent], interval: float = 0.1
+    ) -> AsyncIterator[dict[str, TopOfBook]]:
+        """Read events on a task and yield the changed tokens every interval seconds."""
+
+        async def pump() -> None:
+            async for event in events:
+                self.update(event)
+
+        reader = asyncio.create_task(pump())
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                if reader.done():
+                    # re-raises a socket failure, or ends with the source
+                    reader.result()
+                    changed = self.changed()
+                    if changed:
+                        yield changed
+                    return
+                changed = self.changed()
+                if changed:
+                    yield changed
+        finally:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)